@@ -79,6 +79,8 @@ WSGI_APPLICATION = 'swimeeter.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# PostgreSQL is the supported database. Other backends (e.g. SQLite for local
+# runs) migrate too, but build the name search indexes without text_pattern_ops.
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -87,6 +89,29 @@ DATABASES = {
 }
 
 
+# Caches
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+# Heat sheet payloads are cached per meet version; set heat_sheet_cache_dir to
+# share the cache between worker processes through the file system.
+HEAT_SHEET_CACHE_DIR = os.environ.get('heat_sheet_cache_dir')
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'heat_sheets': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': HEAT_SHEET_CACHE_DIR,
+        'OPTIONS': { 'MAX_ENTRIES': 2000 },
+    } if HEAT_SHEET_CACHE_DIR else {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'heat_sheets',
+        'OPTIONS': { 'MAX_ENTRIES': 2000 },
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -0,0 +1,54 @@
+from rest_framework.views import APIView
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework import status
+
+from .. import view_helpers as vh
+from ..renderers import API_RENDERER_CLASSES
+
+from django.conf import settings
+from django.db import transaction
+
+
+class API_view(APIView):
+    # ~ shared base of every api/v1 view
+    renderer_classes = API_RENDERER_CLASSES
+
+    def dispatch(self, request, *args, **kwargs):
+        # * rows loaded while handling the request are shared through one identity map
+        identity_map_token = vh.open_identity_map()
+        try:
+            if request.method in SAFE_METHODS:
+                return super().dispatch(request, *args, **kwargs)
+
+            # ! writes commit together with the changes finalize_response flushes
+            #   -> readers never see new rows next to stale heats or meet versions
+            with transaction.atomic():
+                return super().dispatch(request, *args, **kwargs)
+        finally:
+            # ! reset on every path -> no map outlives its request
+            vh.close_identity_map(identity_map_token)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        # * apply seeding invalidations and meet changes deferred by the view
+        flush_result = vh.flush_deferred_changes(request)
+        # ? internal error invalidating event seeding
+        if flush_result is not None:
+            # ! roll back the view's writes -> none commit without their invalidation
+            transaction.set_rollback(True)
+            response = flush_result
+
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        # * tag successful meet reads with the ETag of their meet version
+        meet_etag = getattr(request, "meet_etag", None)
+        if meet_etag is not None and response.status_code == status.HTTP_200_OK:
+            response["ETag"] = meet_etag
+
+        # ~ debug mode -> report how often the identity map saved a query
+        identity_map = vh.get_identity_map()
+        if identity_map is not None and settings.DEBUG:
+            response["X-Identity-Map"] = (
+                f"hits={identity_map['hits']}; misses={identity_map['misses']}"
+            )
+
+        return response
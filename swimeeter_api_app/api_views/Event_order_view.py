@@ -0,0 +1,88 @@
+from rest_framework.views import Response
+from rest_framework import status
+
+from ..models import Event
+from .. import view_helpers as vh
+from .API_view import API_view
+
+from django.db import transaction
+
+
+class Event_order_view(API_view):
+    def put(self, request):
+        session_id = vh.get_query_param(request, "session_id")
+        # ? no "session_id" param passed
+        if isinstance(session_id, Response):
+            return session_id
+        else:
+            session_id = int(session_id)
+
+        session_of_id = vh.get_model_of_id("Session", session_id)
+        # ? no session of session_id exists
+        if isinstance(session_of_id, Response):
+            return session_of_id
+
+        check_is_host = vh.check_user_is_host(request, session_of_id.meet.host_id)
+        # ? user is not meet host
+        if isinstance(check_is_host, Response):
+            return check_is_host
+
+        event_ids = request.data.get("event_ids", None)
+        # ? no ordered list of event ids passed
+        if not isinstance(event_ids, list) or not all(
+            isinstance(event_id, int) for event_id in event_ids
+        ):
+            return Response(
+                "event_ids must be a list of event ids",
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # ? same event listed more than once
+        if len(set(event_ids)) != len(event_ids):
+            return Response(
+                "event_ids contains duplicate event ids",
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # * rewrite order numbers of session
+        try:
+            with transaction.atomic():
+                # ! lock session -> concurrent edits cannot interleave order numbers
+                vh.lock_sessions([session_id])
+
+                # ? listed events are not exactly the events of the session
+                session_event_ids = set(
+                    Event.objects.filter(session_id=session_id).values_list(
+                        "id", flat=True
+                    )
+                )
+                if session_event_ids != set(event_ids):
+                    return Response(
+                        "event_ids must list every event of the session exactly once",
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+                vh.set_events_order(session_id, event_ids)
+        # ? internal error reordering events
+        except Exception as err:
+            return Response(
+                str(err),
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, session_of_id.meet_id)
+
+        # * get events JSON
+        events_of_session = Event.objects.filter(session_id=session_id).order_by(
+            "order_in_session"
+        )
+        events_JSON = vh.get_JSON_multiple("Event", events_of_session, True)
+        # ? internal error generating JSON
+        if isinstance(events_JSON, Response):
+            return events_JSON
+        else:
+            return Response(
+                events_JSON,
+                status=status.HTTP_200_OK,
+            )
@@ -1,13 +1,15 @@
-from rest_framework.views import APIView, Response
+from rest_framework.views import Response
 from rest_framework import status
 
 from ..models import Event, Individual_entry, Relay_entry
 from .. import view_helpers as vh
+from .API_view import API_view
 
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 
-class Event_view(APIView):
+class Event_view(API_view):
     def get(self, request):
         specific_to = vh.get_query_param(request, "specific_to")
         # ? no "specific_to" param passed
@@ -44,12 +46,12 @@ class Event_view(APIView):
                 if isinstance(event_of_id, Response):
                     return event_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, event_of_id.session.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, event_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 # * get event JSON
                 event_JSON = vh.get_JSON_single("Event", event_of_id, True)
@@ -76,12 +78,12 @@ class Event_view(APIView):
                 if isinstance(session_of_id, Response):
                     return session_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, session_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, session_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 events_of_session = Event.objects.filter(
                     session_id=session_id
@@ -135,11 +137,10 @@ class Event_view(APIView):
                         stage__istartswith=search__stage
                     )
 
-                # * only retrieve request range of values
-                events_of_session = events_of_session[lower_bound:upper_bound]
-
-                # * get events JSON
-                events_JSON = vh.get_JSON_multiple("Event", events_of_session, True)
+                # * get events JSON -> request range of values or cursor page
+                events_JSON = vh.get_JSON_page(
+                    request, "Event", events_of_session, lower_bound, upper_bound
+                )
                 # ? internal error generating JSON
                 if isinstance(events_JSON, Response):
                     return events_JSON
@@ -158,15 +159,10 @@ class Event_view(APIView):
                 else:
                     meet_id = int(meet_id)
 
-                meet_of_id = vh.get_model_of_id("Meet", meet_id)
-                # ? no meet of meet_id exists
-                if isinstance(meet_of_id, Response):
-                    return meet_of_id
-
-                check_meet_access = vh.check_meet_access_allowed(request, meet_of_id)
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                check_meet_read = vh.check_conditional_meet_read(request, meet_id)
+                # ? no meet of meet_id exists, access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 event_type = vh.get_query_param(request, "event_type")
                 # ? no "event_type" param passed
@@ -179,19 +175,19 @@ class Event_view(APIView):
 
                 if event_type == "individual":
                     events_of_meet = Event.objects.filter(
-                        session__meet_id=meet_id, is_relay=False
+                        meet_id=meet_id, is_relay=False
                     ).order_by(
                         "stroke", "distance", "competing_min_age", "competing_gender"
                     )
                 elif event_type == "relay":
                     events_of_meet = Event.objects.filter(
-                        session__meet_id=meet_id, is_relay=True
+                        meet_id=meet_id, is_relay=True
                     ).order_by(
                         "stroke", "distance", "competing_min_age", "competing_gender"
                     )
                 else:
                     events_of_meet = Event.objects.filter(
-                        session__meet_id=meet_id
+                        meet_id=meet_id
                     ).order_by(
                         "stroke", "distance", "competing_min_age", "competing_gender"
                     )
@@ -250,11 +246,10 @@ class Event_view(APIView):
                         session__name__istartswith=search__session_name
                     )
 
-                # * only retrieve request range of values
-                events_of_meet = events_of_meet[lower_bound:upper_bound]
-
-                # * get events JSON
-                events_JSON = vh.get_JSON_multiple("Event", events_of_meet, True)
+                # * get events JSON -> request range of values or cursor page
+                events_JSON = vh.get_JSON_page(
+                    request, "Event", events_of_meet, lower_bound, upper_bound
+                )
                 # ? internal error generating JSON
                 if isinstance(events_JSON, Response):
                     return events_JSON
@@ -291,73 +286,87 @@ class Event_view(APIView):
         
         # * create new event
         try:
-            # ~ highest order number
-            current_highest_order_number = Event.objects.filter(
-                session_id=session_id
-            ).count()
-
-            # * generate order number for new event
-            if "order_in_session" in request.data:
-                if request.data["order_in_session"] == "start":
-                    order_number = 1
-                elif request.data["order_in_session"] == "end":
-                    order_number = current_highest_order_number + 1
+            with transaction.atomic():
+                # ! lock session -> concurrent edits cannot interleave order numbers
+                vh.lock_sessions([session_id])
+
+                # ~ highest order number
+                current_highest_order_number = Event.objects.filter(
+                    session_id=session_id
+                ).count()
+
+                # * generate order number for new event
+                if "order_in_session" in request.data:
+                    if request.data["order_in_session"] == "start":
+                        order_number = 1
+                    elif request.data["order_in_session"] == "end":
+                        order_number = current_highest_order_number + 1
+                    else:
+                        order_number = min(
+                            request.data["order_in_session"],
+                            current_highest_order_number + 1,
+                        )  # cap order number at end
                 else:
-                    order_number = min(
-                        request.data["order_in_session"],
-                        current_highest_order_number + 1,
-                    )  # cap order number at end
-            else:
-                order_number = current_highest_order_number + 1
-
-            new_event = Event(
-                stroke=request.data["stroke"],
-                distance=request.data["distance"],
-                is_relay=request.data["is_relay"],
-                swimmers_per_entry=request.data["swimmers_per_entry"],
-                stage=request.data["stage"],
-                competing_gender=request.data["competing_gender"],
-                competing_max_age = request.data.get("competing_max_age", None),
-                competing_min_age = request.data.get("competing_min_age", None),
-                order_in_session=order_number,
-                # total_heats => null,
-                session_id=session_id,
-            )
+                    order_number = current_highest_order_number + 1
 
-            if (
-                new_event.competing_max_age != None
-                and new_event.competing_min_age != None
-                and new_event.competing_max_age
-                < new_event.competing_min_age
-            ):
-                # ? invalid age range -> max less than min
-                return Response(
-                    "maximum age less than minimum age",
-                    status=status.HTTP_400_BAD_REQUEST,
+                new_event = Event(
+                    stroke=request.data["stroke"],
+                    distance=request.data["distance"],
+                    is_relay=request.data["is_relay"],
+                    swimmers_per_entry=request.data["swimmers_per_entry"],
+                    stage=request.data["stage"],
+                    competing_gender=request.data["competing_gender"],
+                    competing_max_age = request.data.get("competing_max_age", None),
+                    competing_min_age = request.data.get("competing_min_age", None),
+                    order_in_session=order_number,
+                    # total_heats => null,
+                    session_id=session_id,
+                    meet_id=session_of_id.meet_id,
                 )
 
-            if (
-                request.data["is_relay"]
-                and request.data["stroke"] == "Medley"
-                and request.data["swimmers_per_entry"] != 4
-            ):
-                # ? invalid number of swimmers per entry for a medley relay
-                return Response(
-                    "swimmers per entry of medley relay is not 4",
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-            
-            # * handle any duplicates
-            duplicate_handling = vh.get_duplicate_handling(request)
-            handle_duplicates = vh.handle_duplicates(
-                duplicate_handling, "Event", new_event
-            )
-            # ? error handling duplicates
-            if isinstance(handle_duplicates, Response):
-                return handle_duplicates
+                if (
+                    new_event.competing_max_age != None
+                    and new_event.competing_min_age != None
+                    and new_event.competing_max_age
+                    < new_event.competing_min_age
+                ):
+                    # ? invalid age range -> max less than min
+                    return Response(
+                        "maximum age less than minimum age",
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
 
-            new_event.full_clean()
-            new_event.save()
+                if (
+                    request.data["is_relay"]
+                    and request.data["stroke"] == "Medley"
+                    and request.data["swimmers_per_entry"] != 4
+                ):
+                    # ? invalid number of swimmers per entry for a medley relay
+                    return Response(
+                        "swimmers per entry of medley relay is not 4",
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+            
+                # * handle any duplicates
+                duplicate_handling = vh.get_duplicate_handling(request)
+                handle_duplicates = vh.handle_duplicates(
+                    duplicate_handling, "Event", new_event
+                )
+                # ? error handling duplicates
+                if isinstance(handle_duplicates, Response):
+                    return handle_duplicates
+
+                new_event.full_clean()
+                new_event.save()
+
+                # * move event order numbers forward
+                if "order_in_session" in request.data:
+                    vh.shift_events_order(
+                        session_id,
+                        1,
+                        min_order=order_number,
+                        excluded_event_id=new_event.pk,
+                    )
         except ValidationError as err:
             # ? invalid creation data passed -> validators
             return Response(
@@ -371,15 +380,8 @@ class Event_view(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        # * move event order numbers forward
-        if "order_in_session" in request.data:
-            order_shifted_events = Event.objects.filter(
-                session_id=session_id, order_in_session__gte=order_number
-            ).exclude(id=new_event.pk)
-
-            for event in order_shifted_events:
-                event.order_in_session += 1
-                event.save()
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, new_event.meet_id)
 
         # * get event JSON
         event_JSON = vh.get_JSON_single("Event", new_event, True)
@@ -405,96 +407,202 @@ class Event_view(APIView):
         if isinstance(event_of_id, Response):
             return event_of_id
 
-        check_is_host = vh.check_user_is_host(request, event_of_id.session.meet.host_id)
+        check_is_host = vh.check_user_is_host(request, event_of_id.meet.host_id)
         # ? user is not meet host
         if isinstance(check_is_host, Response):
             return check_is_host
 
-        # ~ order number variables
-        current_highest_order_number = Event.objects.filter(
-            session_id=event_of_id.session_id
-        ).count()
-        previous_order_number = event_of_id.order_in_session
-        requested_order_number = event_of_id.order_in_session
+        # @ validate requested session before taking any locks
+        session_id = vh.get_query_param(request, "session_id")
+        if isinstance(session_id, str):
+            session_id = int(session_id)
 
-        # * update existing event
-        session_changed = False
-        old_session_id = -1
-        try:
-            edited_event = Event.objects.get(id=event_id)
-
-            if "stroke" in request.data:
-                edited_event.stroke = request.data["stroke"]
-            if "distance" in request.data:
-                edited_event.distance = request.data["distance"]
-            # if "is_relay" in request.data:
-            #     edited_event.is_relay = request.data["is_relay"]
-            if "swimmers_per_entry" in request.data:
-                edited_event.swimmers_per_entry = request.data["swimmers_per_entry"]
-            if "stage" in request.data:
-                edited_event.stage = request.data["stage"]
-            if "competing_gender" in request.data:
-                edited_event.competing_gender = request.data["competing_gender"]
-            if "order_in_session" in request.data:
-                # ~ requested order number
-                requested_order_number = request.data["order_in_session"]
-
-            edited_event.competing_max_age = request.data.get("competing_max_age", None)
-            edited_event.competing_min_age = request.data.get("competing_min_age", None)
-
-            if (
-                edited_event.competing_max_age != None
-                and edited_event.competing_min_age != None
-                and edited_event.competing_max_age < edited_event.competing_min_age
-            ):
-                # ? invalid age range -> max less than min
+            session_of_id = vh.get_model_of_id("Session", session_id)
+            # ? no session of session_id exists
+            if isinstance(session_of_id, Response):
+                return session_of_id
+
+            # ? session and event meets do not match
+            if session_of_id.meet_id != event_of_id.meet_id:
                 return Response(
-                    "maximum age less than minimum age",
+                    "session and event meets do not match",
                     status=status.HTTP_400_BAD_REQUEST,
                 )
+        else:
+            session_id = None
 
-            if (
-                edited_event.is_relay
-                and edited_event.stroke == "Medley"
-                and edited_event.swimmers_per_entry != 4
-            ):
-                # ? invalid number of swimmers per entry for a medley relay
-                return Response(
-                    "swimmers per entry of medley relay is not 4",
-                    status=status.HTTP_400_BAD_REQUEST,
+        # * update existing event
+        seeding_needs_invalidation = False
+        try:
+            with transaction.atomic():
+                # ! lock affected sessions before any write
+                #   -> concurrent edits cannot interleave order numbers
+                locked_session_ids = {event_of_id.session_id}
+                if session_id is not None:
+                    locked_session_ids.add(session_id)
+                vh.lock_sessions(locked_session_ids)
+
+                # ~ re-read under the lock -> session and order are current
+                edited_event = Event.objects.get(id=event_id)
+                if edited_event.session_id not in locked_session_ids:
+                    # * moved by a concurrent edit -> lock its current session too
+                    vh.lock_sessions([edited_event.session_id])
+
+                # ~ order number variables
+                previous_session_id = edited_event.session_id
+                previous_order_number = edited_event.order_in_session
+                requested_order_number = request.data.get(
+                    "order_in_session", previous_order_number
                 )
 
-            # @ update foreign keys
-            session_id = vh.get_query_param(request, "session_id")
-            if isinstance(session_id, str):
-                session_id = int(session_id)
+                if "stroke" in request.data:
+                    edited_event.stroke = request.data["stroke"]
+                if "distance" in request.data:
+                    edited_event.distance = request.data["distance"]
+                # if "is_relay" in request.data:
+                #     edited_event.is_relay = request.data["is_relay"]
+                if "swimmers_per_entry" in request.data:
+                    edited_event.swimmers_per_entry = request.data["swimmers_per_entry"]
+                if "stage" in request.data:
+                    edited_event.stage = request.data["stage"]
+                if "competing_gender" in request.data:
+                    edited_event.competing_gender = request.data["competing_gender"]
+
+                edited_event.competing_max_age = request.data.get(
+                    "competing_max_age", None
+                )
+                edited_event.competing_min_age = request.data.get(
+                    "competing_min_age", None
+                )
 
-                if session_id != edited_event.session_id:
-                    session_of_id = vh.get_model_of_id("Session", session_id)
-                    # ? no session of session_id exists
-                    if isinstance(session_of_id, Response):
-                        return session_of_id
+                if (
+                    edited_event.competing_max_age != None
+                    and edited_event.competing_min_age != None
+                    and edited_event.competing_max_age < edited_event.competing_min_age
+                ):
+                    # ? invalid age range -> max less than min
+                    return Response(
+                        "maximum age less than minimum age",
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
 
-                    session_changed = True
-                    old_session_id = edited_event.session_id
+                if (
+                    edited_event.is_relay
+                    and edited_event.stroke == "Medley"
+                    and edited_event.swimmers_per_entry != 4
+                ):
+                    # ? invalid number of swimmers per entry for a medley relay
+                    return Response(
+                        "swimmers per entry of medley relay is not 4",
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+                # @ update foreign keys
+                if session_id is not None:
                     edited_event.session_id = session_id
+                session_changed = edited_event.session_id != previous_session_id
 
-                    # ~ highest order number
-                    current_highest_order_number = Event.objects.filter(
-                        session_id=session_id
-                    ).count()
+                # * handle any duplicates
+                duplicate_handling = vh.get_duplicate_handling(request)
+                handle_duplicates = vh.handle_duplicates(
+                    duplicate_handling, "Event", edited_event
+                )
+                # ? error handling duplicates
+                if isinstance(handle_duplicates, Response):
+                    return handle_duplicates
+
+                # ~ highest order number
+                highest_order_number = (
+                    Event.objects.filter(session_id=edited_event.session_id)
+                    .exclude(id=edited_event.pk)
+                    .count()
+                    + 1
+                )
 
-            # * handle any duplicates
-            duplicate_handling = vh.get_duplicate_handling(request)
-            handle_duplicates = vh.handle_duplicates(
-                duplicate_handling, "Event", edited_event
-            )
-            # ? error handling duplicates
-            if isinstance(handle_duplicates, Response):
-                return handle_duplicates
+                # ~ calculate true requested order number
+                if requested_order_number == "start":
+                    requested_order_number = 1
+                elif requested_order_number == "end":
+                    requested_order_number = highest_order_number
+                else:
+                    requested_order_number = min(
+                        requested_order_number,
+                        highest_order_number,
+                    )  # cap order number at end
+
+                # $ move order numbers if...
+                match (session_changed):
+                    # $ ...session changed
+                    case True:
+                        # * move event order numbers backward -> old session
+                        vh.shift_events_order(
+                            previous_session_id,
+                            -1,
+                            min_order=previous_order_number + 1,
+                            excluded_event_id=edited_event.pk,
+                        )
+
+                        # * move event order numbers forward -> new session
+                        vh.shift_events_order(
+                            edited_event.session_id,
+                            1,
+                            min_order=requested_order_number,
+                            excluded_event_id=edited_event.pk,
+                        )
 
-            edited_event.full_clean()
-            edited_event.save()
+                    # $ ...session stayed the same
+                    case False:
+                        # * move event order numbers backward -> self moved forward
+                        if previous_order_number < requested_order_number:
+                            vh.shift_events_order(
+                                edited_event.session_id,
+                                -1,
+                                min_order=previous_order_number + 1,
+                                max_order=requested_order_number,
+                                excluded_event_id=edited_event.pk,
+                            )
+
+                        # * move event order numbers forward -> self moved backward
+                        elif previous_order_number > requested_order_number:
+                            vh.shift_events_order(
+                                edited_event.session_id,
+                                1,
+                                min_order=requested_order_number,
+                                max_order=previous_order_number - 1,
+                                excluded_event_id=edited_event.pk,
+                            )
+
+                edited_event.order_in_session = requested_order_number
+                edited_event.full_clean()
+                edited_event.save()
+
+                # * delete newly incompatible entries
+                if edited_event.is_relay:
+                    entries_of_event = Relay_entry.objects.filter(
+                        event_id=edited_event.pk
+                    )
+                    for entry in entries_of_event:
+                        for swimmer in entry.swimmers.all():
+                            check_compatibility = vh.validate_swimmer_against_event(
+                                swimmer, edited_event
+                            )
+                            # ? swimmer and event are not compatible
+                            if isinstance(check_compatibility, Response):
+                                entry.delete()
+                                seeding_needs_invalidation = True
+                                break
+                else:
+                    entries_of_event = Individual_entry.objects.filter(
+                        event_id=edited_event.pk
+                    )
+                    for entry in entries_of_event:
+                        check_compatibility = vh.validate_swimmer_against_event(
+                            entry.swimmer, edited_event
+                        )
+                        # ? swimmer and event are not compatible
+                        if isinstance(check_compatibility, Response):
+                            entry.delete()
+                            seeding_needs_invalidation = True
         except ValidationError as err:
             # ? invalid creation data passed -> validators
             return Response(
@@ -508,113 +616,12 @@ class Event_view(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # * delete newly incompatible entries and invalidate event seeding
-        seeding_needs_invalidation = False
-
-        if edited_event.is_relay:
-            entries_of_event = Relay_entry.objects.filter(event_id=edited_event.pk)
-            for entry in entries_of_event:
-                for swimmer in entry.swimmers.all():
-                    check_compatibility = vh.validate_swimmer_against_event(
-                        swimmer, edited_event
-                    )
-                    # ? swimmer and event are not compatible
-                    if isinstance(check_compatibility, Response):
-                        entry.delete()
-                        seeding_needs_invalidation = True
-                        break
-        else:
-            entries_of_event = Individual_entry.objects.filter(event_id=edited_event.pk)
-            for entry in entries_of_event:
-                check_compatibility = vh.validate_swimmer_against_event(
-                    entry.swimmer, edited_event
-                )
-                # ? swimmer and event are not compatible
-                if isinstance(check_compatibility, Response):
-                    entry.delete()
-                    seeding_needs_invalidation = True
-
         if seeding_needs_invalidation:
             # * invalidate event seeding
-            invalidate_hs_data = vh.invalidate_event_seeding(edited_event)
-            # ? internal error invalidating event seeding
-            if isinstance(invalidate_hs_data, Response):
-                return invalidate_hs_data
-
-        # $ move order numbers if...
-        match (session_changed):
-            # $ ...session changed
-            case True:
-                # ~ calculate true requested order number
-                if requested_order_number == "start":
-                    requested_order_number = 1
-                elif requested_order_number == "end":
-                    requested_order_number = current_highest_order_number + 1
-                else:
-                    requested_order_number = min(
-                        requested_order_number,
-                        current_highest_order_number + 1,
-                    )  # cap order number at end
-
-                # * move event order numbers backward -> old session
-                order_shifted_events = Event.objects.filter(
-                    session_id=old_session_id,
-                    order_in_session__gt=previous_order_number,
-                ).exclude(id=edited_event.pk)
-
-                for event in order_shifted_events:
-                    event.order_in_session -= 1
-                    event.save()
+            vh.defer_event_seeding_invalidation(request, edited_event)
 
-                # * move event order numbers forward -> new session
-                order_shifted_events = Event.objects.filter(
-                    session_id=edited_event.session_id,
-                    order_in_session__gte=requested_order_number,
-                ).exclude(id=edited_event.pk)
-
-                for event in order_shifted_events:
-                    event.order_in_session += 1
-                    event.save()
-
-            # $ ...session stayed the same
-            case False:
-                # ~ calculate true requested order number
-                if requested_order_number == "start":
-                    requested_order_number = 1
-                elif requested_order_number == "end":
-                    requested_order_number = current_highest_order_number
-                else:
-                    requested_order_number = min(
-                        requested_order_number,
-                        current_highest_order_number,
-                    )  # cap order number at end
-
-                # * move event order numbers backward -> self moved forward
-                if previous_order_number < requested_order_number:
-                    order_shifted_events = Event.objects.filter(
-                        session_id=edited_event.session_id,
-                        order_in_session__gt=previous_order_number,
-                        order_in_session__lte=requested_order_number,
-                    ).exclude(id=edited_event.pk)
-
-                    for event in order_shifted_events:
-                        event.order_in_session -= 1
-                        event.save()
-
-                # * move event order numbers forward -> self moved backward
-                elif previous_order_number > requested_order_number:
-                    order_shifted_events = Event.objects.filter(
-                        session_id=edited_event.session_id,
-                        order_in_session__lt=previous_order_number,
-                        order_in_session__gte=requested_order_number,
-                    ).exclude(id=edited_event.pk)
-
-                    for event in order_shifted_events:
-                        event.order_in_session += 1
-                        event.save()
-
-        edited_event.order_in_session = requested_order_number
-        edited_event.save()
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, edited_event.meet_id)
 
         # * get event JSON
         event_JSON = vh.get_JSON_single("Event", edited_event, True)
@@ -640,23 +647,28 @@ class Event_view(APIView):
         if isinstance(event_of_id, Response):
             return event_of_id
 
-        check_is_host = vh.check_user_is_host(request, event_of_id.session.meet.host_id)
+        check_is_host = vh.check_user_is_host(request, event_of_id.meet.host_id)
         # ? user is not meet host
         if isinstance(check_is_host, Response):
             return check_is_host
 
-        # * move event order numbers backward
-        order_shifted_events = Event.objects.filter(
-            session_id=event_of_id.session_id,
-            order_in_session__gt=event_of_id.order_in_session,
-        )
-        for event in order_shifted_events:
-            event.order_in_session -= 1
-            event.save()
-
         # * delete existing event
         try:
-            event_of_id.delete()
+            with transaction.atomic():
+                # ! lock session -> concurrent edits cannot interleave order numbers
+                vh.lock_sessions([event_of_id.session_id])
+                event_of_id.refresh_from_db(fields=["order_in_session"])
+
+                event_of_id.delete()
+
+                # * move event order numbers backward
+                vh.shift_events_order(
+                    event_of_id.session_id,
+                    -1,
+                    min_order=event_of_id.order_in_session + 1,
+                )
+
+            vh.defer_meet_version_bump(request, event_of_id.meet_id)
             return Response(status=status.HTTP_204_NO_CONTENT)
         # ? internal error deleting model
         except Exception as err:
@@ -1,11 +1,12 @@
-from rest_framework.views import APIView, Response
+from rest_framework.views import Response
 from rest_framework import status
 
 from ..models import Event
 from .. import view_helpers as vh
+from .API_view import API_view
 
 
-class Heat_sheet_view(APIView):
+class Heat_sheet_view(API_view):
     def get(self, request):
         specific_to = vh.get_query_param(request, "specific_to")
         # ? no "specific_to" param passed
@@ -28,14 +29,16 @@ class Heat_sheet_view(APIView):
                 if isinstance(meet_of_id, Response):
                     return meet_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, meet_of_id
-                )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                check_meet_read = vh.check_conditional_meet_read(request, meet_id)
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
                 
-                retrieved_seeding = vh.get_seeding_data("Meet" if specific_to == "meet" else "Overview", meet_of_id)
+                retrieved_seeding = vh.get_cached_seeding_data(
+                    "Meet" if specific_to == "meet" else "Overview",
+                    meet_of_id,
+                    meet_of_id.pk,
+                )
                 # ? error retrieving seeding data
                 if isinstance(retrieved_seeding, Response):
                     return retrieved_seeding
@@ -59,14 +62,16 @@ class Heat_sheet_view(APIView):
                 if isinstance(pool_of_id, Response):
                     return pool_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, pool_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, pool_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
                 
-                retrieved_seeding = vh.get_seeding_data("Pool", pool_of_id)
+                retrieved_seeding = vh.get_cached_seeding_data(
+                    "Pool", pool_of_id, pool_of_id.meet_id
+                )
                 # ? error retrieving seeding data
                 if isinstance(retrieved_seeding, Response):
                     return retrieved_seeding
@@ -90,14 +95,16 @@ class Heat_sheet_view(APIView):
                 if isinstance(session_of_id, Response):
                     return session_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, session_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, session_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
                 
-                retrieved_seeding = vh.get_seeding_data("Session", session_of_id)
+                retrieved_seeding = vh.get_cached_seeding_data(
+                    "Session", session_of_id, session_of_id.meet_id
+                )
                 # ? error retrieving seeding data
                 if isinstance(retrieved_seeding, Response):
                     return retrieved_seeding
@@ -121,14 +128,16 @@ class Heat_sheet_view(APIView):
                 if isinstance(event_of_id, Response):
                     return event_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, event_of_id.session.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, event_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
                 
-                retrieved_seeding = vh.get_seeding_data("Event", event_of_id)
+                retrieved_seeding = vh.get_cached_seeding_data(
+                    "Event", event_of_id, event_of_id.meet_id
+                )
                 # ? error retrieving seeding data
                 if isinstance(retrieved_seeding, Response):
                     return retrieved_seeding
@@ -152,14 +161,16 @@ class Heat_sheet_view(APIView):
                 if isinstance(team_of_id, Response):
                     return team_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, team_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, team_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
                 
-                retrieved_seeding = vh.get_seeding_data("Team", team_of_id)
+                retrieved_seeding = vh.get_cached_seeding_data(
+                    "Team", team_of_id, team_of_id.meet_id
+                )
                 # ? error retrieving seeding data
                 if isinstance(retrieved_seeding, Response):
                     return retrieved_seeding
@@ -183,14 +194,16 @@ class Heat_sheet_view(APIView):
                 if isinstance(swimmer_of_id, Response):
                     return swimmer_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, swimmer_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, swimmer_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
                 
-                retrieved_seeding = vh.get_seeding_data("Swimmer", swimmer_of_id)
+                retrieved_seeding = vh.get_cached_seeding_data(
+                    "Swimmer", swimmer_of_id, swimmer_of_id.meet_id
+                )
                 # ? error retrieving seeding data
                 if isinstance(retrieved_seeding, Response):
                     return retrieved_seeding
@@ -214,12 +227,12 @@ class Heat_sheet_view(APIView):
                 if isinstance(entry_of_id, Response):
                     return entry_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, entry_of_id.event.session.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, entry_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
                 
                 retrieved_seeding = vh.get_seeding_data("Relay_entry", entry_of_id)
                 # ? error retrieving seeding data
@@ -245,12 +258,12 @@ class Heat_sheet_view(APIView):
                 if isinstance(entry_of_id, Response):
                     return entry_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, entry_of_id.event.session.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, entry_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
                 
                 retrieved_seeding = vh.get_seeding_data("Individual_entry", entry_of_id)
                 # ? error retrieving seeding data
@@ -291,7 +304,7 @@ class Heat_sheet_view(APIView):
                 if isinstance(event_of_id, Response):
                     return event_of_id
 
-                check_is_host = vh.check_user_is_host(request, event_of_id.session.meet.host_id)
+                check_is_host = vh.check_user_is_host(request, event_of_id.meet.host_id)
                 # ? user is not meet host
                 if isinstance(check_is_host, Response):
                     return check_is_host
@@ -302,7 +315,9 @@ class Heat_sheet_view(APIView):
                     return generation_result
 
                 # * retrieve updated meet seeding data
-                retrieved_seeding = vh.get_seeding_data("Overview", event_of_id.session.meet)
+                retrieved_seeding = vh.get_cached_seeding_data(
+                    "Overview", event_of_id.meet, event_of_id.meet_id
+                )
                 # ? error retrieving seeding data
                 if isinstance(retrieved_seeding, Response):
                     return retrieved_seeding
@@ -338,19 +353,22 @@ class Heat_sheet_view(APIView):
                     events_to_seed = Event.objects.filter(session_id=session_id, total_heats__isnull=True)
 
                 # * generate seeding for applicable events
-                for event in events_to_seed:
-                    generation_result = vh.generate_event_seeding(request.data, event)
-                    if isinstance(generation_result, Response):
-                        return generation_result
+                seeding_timings = vh.generate_events_seeding(
+                    request.data, events_to_seed.select_related("session__pool")
+                )
+                if isinstance(seeding_timings, Response):
+                    return seeding_timings
 
                 # * retrieve updated meet seeding data
-                retrieved_seeding = vh.get_seeding_data("Overview", session_of_id.meet)
+                retrieved_seeding = vh.get_cached_seeding_data(
+                    "Overview", session_of_id.meet, session_of_id.meet_id
+                )
                 # ? error retrieving seeding data
                 if isinstance(retrieved_seeding, Response):
                     return retrieved_seeding
                 else:
                     return Response(
-                        retrieved_seeding,
+                        {**retrieved_seeding, "seeding_timings": seeding_timings},
                         status=status.HTTP_200_OK
                     )
             
@@ -375,24 +393,27 @@ class Heat_sheet_view(APIView):
                 
                 # * retrieve events to seed
                 if (request.data.get("re_seed_events", True)):
-                    events_to_seed = Event.objects.filter(session__meet_id=meet_id)
+                    events_to_seed = Event.objects.filter(meet_id=meet_id)
                 else:
-                    events_to_seed = Event.objects.filter(session__meet_id=meet_id, total_heats__isnull=True)
+                    events_to_seed = Event.objects.filter(meet_id=meet_id, total_heats__isnull=True)
 
                 # * generate seeding for applicable events
-                for event in events_to_seed:
-                    generation_result = vh.generate_event_seeding(request.data, event)
-                    if isinstance(generation_result, Response):
-                        return generation_result
+                seeding_timings = vh.generate_events_seeding(
+                    request.data, events_to_seed.select_related("session__pool")
+                )
+                if isinstance(seeding_timings, Response):
+                    return seeding_timings
 
                 # * retrieve updated meet seeding data
-                retrieved_seeding = vh.get_seeding_data("Overview", meet_of_id)
+                retrieved_seeding = vh.get_cached_seeding_data(
+                    "Overview", meet_of_id, meet_of_id.pk
+                )
                 # ? error retrieving seeding data
                 if isinstance(retrieved_seeding, Response):
                     return retrieved_seeding
                 else:
                     return Response(
-                        retrieved_seeding,
+                        {**retrieved_seeding, "seeding_timings": seeding_timings},
                         status=status.HTTP_200_OK
                     )
 
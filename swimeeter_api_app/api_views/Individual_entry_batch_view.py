@@ -0,0 +1,329 @@
+from rest_framework.views import Response
+from rest_framework import status
+
+from ..models import Event, Swimmer, Individual_entry
+from .. import view_helpers as vh
+from .API_view import API_view
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+
+class Individual_entry_batch_view(API_view):
+    def post(self, request):
+        check_logged_in = vh.check_user_logged_in(request)
+        # ? user is not logged in
+        if isinstance(check_logged_in, Response):
+            return check_logged_in
+
+        batch_items = vh.get_batch_items(request)
+        # ? invalid batch passed
+        if isinstance(batch_items, Response):
+            return batch_items
+
+        # * load every referenced swimmer and event -> one query each
+        swimmers_of_ids = Swimmer.objects.in_bulk(
+            vh.get_batch_ids(batch_items, "swimmer_id")
+        )
+        events_of_ids = Event.objects.select_related("meet").in_bulk(
+            vh.get_batch_ids(batch_items, "event_id")
+        )
+
+        # * validate every item in memory
+        batch_results = [None] * len(batch_items)
+        new_individual_entries = {}
+        batch_pairs = set()
+        for index, batch_item in enumerate(batch_items):
+            swimmer_of_id = swimmers_of_ids.get(batch_item.get("swimmer_id"))
+            event_of_id = events_of_ids.get(batch_item.get("event_id"))
+
+            # ? no event of event_id exists
+            if event_of_id is None:
+                item_error = Response(
+                    "no Event with the given id exists",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? event is not an individual event
+            elif event_of_id.is_relay:
+                item_error = Response(
+                    "event is not an individual event",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? no swimmer of swimmer_id exists
+            elif swimmer_of_id is None:
+                item_error = Response(
+                    "no Swimmer with the given id exists",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? swimmer and event meets do not match
+            elif swimmer_of_id.meet_id != event_of_id.meet_id:
+                item_error = Response(
+                    "swimmer and event meets do not match",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? swimmer entered twice into the same event
+            elif (event_of_id.pk, swimmer_of_id.pk) in batch_pairs:
+                item_error = Response(
+                    "duplicate entries exist inside batch",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            else:
+                # ? user is not meet host
+                item_error = vh.check_user_is_host(
+                    request, event_of_id.meet.host_id
+                )
+                # ? swimmer and event are not compatible
+                if item_error is None:
+                    item_error = vh.validate_swimmer_against_event(
+                        swimmer_of_id, event_of_id
+                    )
+
+            if item_error is not None:
+                batch_results[index] = vh.get_batch_result(index, item_error)
+                continue
+
+            try:
+                new_individual_entry = Individual_entry(
+                    seed_time=batch_item["seed_time"],
+                    # heat_number => null,
+                    # lane_number => null,
+                    swimmer=swimmer_of_id,
+                    event=event_of_id,
+                    meet=event_of_id.meet,
+                )
+                new_individual_entry.full_clean(exclude=["swimmer", "event", "meet"])
+            except ValidationError as err:
+                # ? invalid creation data passed -> validators
+                batch_results[index] = vh.get_batch_result(
+                    index,
+                    Response(
+                        "; ".join(err.messages),
+                        status=status.HTTP_400_BAD_REQUEST,
+                    ),
+                )
+                continue
+            except Exception as err:
+                # ? invalid creation data passed -> general
+                batch_results[index] = vh.get_batch_result(
+                    index,
+                    Response(
+                        str(err),
+                        status=status.HTTP_400_BAD_REQUEST,
+                    ),
+                )
+                continue
+
+            batch_pairs.add((event_of_id.pk, swimmer_of_id.pk))
+            new_individual_entries[index] = new_individual_entry
+
+        # * handle any duplicates -> one query for the whole batch
+        duplicate_handling = vh.get_entry_duplicate_handling(request)
+        original_duplicates = {
+            (event_id, swimmer_id): individual_entry_id
+            for individual_entry_id, event_id, swimmer_id in Individual_entry.objects.filter(
+                event_id__in={entry.event_id for entry in new_individual_entries.values()},
+                swimmer_id__in={entry.swimmer_id for entry in new_individual_entries.values()},
+            ).values_list("id", "event_id", "swimmer_id")
+        }
+
+        replaced_individual_entry_ids = []
+        for index, new_individual_entry in list(new_individual_entries.items()):
+            duplicate_id = original_duplicates.get(
+                (new_individual_entry.event_id, new_individual_entry.swimmer_id)
+            )
+            if duplicate_id is None:
+                continue
+
+            if duplicate_handling == "keep_new":
+                replaced_individual_entry_ids.append(duplicate_id)
+                continue
+
+            if duplicate_handling == "keep_originals":
+                item_response = Response(
+                    "new model is a duplicate; new model not added",
+                    status=status.HTTP_200_OK,
+                )
+            else:
+                item_response = Response(
+                    "unhandled duplicates exist",
+                    status=status.HTTP_409_CONFLICT,
+                )
+            batch_results[index] = vh.get_batch_result(index, item_response)
+            del new_individual_entries[index]
+
+        # * create new individual_entries
+        try:
+            with transaction.atomic():
+                Individual_entry.objects.filter(
+                    id__in=replaced_individual_entry_ids
+                ).delete()
+                Individual_entry.objects.bulk_create(new_individual_entries.values())
+        # ? internal error creating models
+        except Exception as err:
+            return Response(
+                str(err),
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        affected_events = {
+            entry.event_id: entry.event for entry in new_individual_entries.values()
+        }
+
+        # * invalidate seeding of each affected event once
+        vh.defer_events_seeding_invalidation(request, affected_events.values())
+
+        # * mark meet heat sheets as changed
+        for event in affected_events.values():
+            vh.defer_meet_version_bump(request, event.meet_id)
+
+        # * get individual_entries JSON
+        individual_entries_JSON = vh.get_JSON_multiple(
+            "Individual_entry", list(new_individual_entries.values()), True
+        )
+        # ? internal error generating JSON
+        if isinstance(individual_entries_JSON, Response):
+            return individual_entries_JSON
+
+        for index, individual_entry_JSON in zip(
+            new_individual_entries.keys(), individual_entries_JSON
+        ):
+            batch_results[index] = vh.get_batch_result(
+                index,
+                Response(individual_entry_JSON, status=status.HTTP_201_CREATED),
+            )
+
+        return vh.get_batch_response(batch_results)
+
+    def put(self, request):
+        check_logged_in = vh.check_user_logged_in(request)
+        # ? user is not logged in
+        if isinstance(check_logged_in, Response):
+            return check_logged_in
+
+        batch_items = vh.get_batch_items(request)
+        # ? invalid batch passed
+        if isinstance(batch_items, Response):
+            return batch_items
+
+        # * load every referenced individual_entry -> one query
+        individual_entries_of_ids = Individual_entry.objects.select_related(
+            "event", "meet"
+        ).in_bulk(vh.get_batch_ids(batch_items, "individual_entry_id"))
+
+        # * validate every item in memory
+        batch_results = [None] * len(batch_items)
+        edited_individual_entries = {}
+        edited_individual_entry_ids = set()
+        reseeded_events = {}
+        for index, batch_item in enumerate(batch_items):
+            individual_entry_of_id = individual_entries_of_ids.get(
+                batch_item.get("individual_entry_id")
+            )
+
+            # ? no individual entry of individual_entry_id exists
+            if individual_entry_of_id is None:
+                item_error = Response(
+                    "no Individual_entry with the given id exists",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? individual entry listed twice
+            elif individual_entry_of_id.pk in edited_individual_entry_ids:
+                item_error = Response(
+                    "individual entry listed more than once inside batch",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? no seed time passed
+            elif "seed_time" not in batch_item:
+                item_error = Response(
+                    "no seed_time passed",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            else:
+                # ? user is not meet host
+                item_error = vh.check_user_is_host(
+                    request, individual_entry_of_id.meet.host_id
+                )
+
+            if item_error is not None:
+                batch_results[index] = vh.get_batch_result(index, item_error)
+                continue
+
+            # * update existing individual_entry
+            seed_time_changed = (
+                batch_item["seed_time"] != individual_entry_of_id.seed_time
+            )
+            try:
+                individual_entry_of_id.seed_time = batch_item["seed_time"]
+                individual_entry_of_id.full_clean(exclude=["swimmer", "event", "meet"])
+            except ValidationError as err:
+                # ? invalid update data passed -> validators
+                batch_results[index] = vh.get_batch_result(
+                    index,
+                    Response(
+                        "; ".join(err.messages),
+                        status=status.HTTP_400_BAD_REQUEST,
+                    ),
+                )
+                continue
+            except Exception as err:
+                # ? invalid update data passed -> general
+                batch_results[index] = vh.get_batch_result(
+                    index,
+                    Response(
+                        str(err),
+                        status=status.HTTP_400_BAD_REQUEST,
+                    ),
+                )
+                continue
+
+            edited_individual_entries[index] = individual_entry_of_id
+            edited_individual_entry_ids.add(individual_entry_of_id.pk)
+            if seed_time_changed:
+                reseeded_events[individual_entry_of_id.event_id] = (
+                    individual_entry_of_id.event
+                )
+
+        # * save seed times in one statement
+        try:
+            Individual_entry.objects.bulk_update(
+                edited_individual_entries.values(), ["seed_time"]
+            )
+            vh.forget_models(
+                "Individual_entry",
+                [entry.pk for entry in edited_individual_entries.values()],
+            )
+        # ? internal error updating models
+        except Exception as err:
+            return Response(
+                str(err),
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        affected_events = {
+            entry.event_id: entry.event for entry in edited_individual_entries.values()
+        }
+
+        # * invalidate seeding of each event with a changed seed time once
+        vh.defer_events_seeding_invalidation(request, reseeded_events.values())
+
+        # * mark meet heat sheets as changed
+        for event in affected_events.values():
+            vh.defer_meet_version_bump(request, event.meet_id)
+
+        # * get individual_entries JSON
+        individual_entries_JSON = vh.get_JSON_multiple(
+            "Individual_entry", list(edited_individual_entries.values()), True
+        )
+        # ? internal error generating JSON
+        if isinstance(individual_entries_JSON, Response):
+            return individual_entries_JSON
+
+        for index, individual_entry_JSON in zip(
+            edited_individual_entries.keys(), individual_entries_JSON
+        ):
+            batch_results[index] = vh.get_batch_result(
+                index,
+                Response(individual_entry_JSON, status=status.HTTP_200_OK),
+            )
+
+        return vh.get_batch_response(batch_results)
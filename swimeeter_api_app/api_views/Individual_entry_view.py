@@ -1,13 +1,14 @@
-from rest_framework.views import APIView, Response
+from rest_framework.views import Response
 from rest_framework import status
 
 from ..models import Individual_entry, Event
 from .. import view_helpers as vh
+from .API_view import API_view
 
 from django.core.exceptions import ValidationError
 
 
-class Individual_entry_view(APIView):
+class Individual_entry_view(API_view):
     def get(self, request):
         specific_to = vh.get_query_param(request, "specific_to")
         # ? no "specific_to" param passed
@@ -46,12 +47,12 @@ class Individual_entry_view(APIView):
                 if isinstance(individual_entry_of_id, Response):
                     return individual_entry_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, individual_entry_of_id.event.session.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, individual_entry_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 # * get individual_entry JSON
                 individual_entry_JSON = vh.get_JSON_single(
@@ -80,12 +81,12 @@ class Individual_entry_view(APIView):
                 if isinstance(event_of_id, Response):
                     return event_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, event_of_id.session.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, event_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 individual_entries_of_event = Individual_entry.objects.filter(
                     event_id=event_id
@@ -137,14 +138,9 @@ class Individual_entry_view(APIView):
                         swimmer__team__acronym__istartswith=search__team_acronym
                     )
 
-                # * only retrieve request range of values
-                individual_entries_of_event = individual_entries_of_event[
-                    lower_bound:upper_bound
-                ]
-
-                # * get individual_entries JSON
-                individual_entries_JSON = vh.get_JSON_multiple(
-                    "Individual_entry", individual_entries_of_event, True
+                # * get individual_entries JSON -> request range of values or cursor page
+                individual_entries_JSON = vh.get_JSON_page(
+                    request, "Individual_entry", individual_entries_of_event, lower_bound, upper_bound
                 )
                 # ? internal error generating JSON
                 if isinstance(individual_entries_JSON, Response):
@@ -169,12 +165,12 @@ class Individual_entry_view(APIView):
                 if isinstance(team_of_id, Response):
                     return team_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, team_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, team_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 individual_entries_of_team = Individual_entry.objects.filter(
                     swimmer__team_id=team_id
@@ -281,14 +277,9 @@ class Individual_entry_view(APIView):
                         swimmer__gender__istartswith=search__swimmer_gender
                     )
 
-                # * only retrieve request range of values
-                individual_entries_of_team = individual_entries_of_team[
-                    lower_bound:upper_bound
-                ]
-
-                # * get individual_entries JSON
-                individual_entries_JSON = vh.get_JSON_multiple(
-                    "Individual_entry", individual_entries_of_team, True
+                # * get individual_entries JSON -> request range of values or cursor page
+                individual_entries_JSON = vh.get_JSON_page(
+                    request, "Individual_entry", individual_entries_of_team, lower_bound, upper_bound
                 )
                 # ? internal error generating JSON
                 if isinstance(individual_entries_JSON, Response):
@@ -313,12 +304,12 @@ class Individual_entry_view(APIView):
                 if isinstance(event_of_id, Response):
                     return event_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, event_of_id.session.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, event_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 heat_number = vh.get_query_param(request, "heat_number")
                 # ? no "heat_number" param passed
@@ -382,14 +373,9 @@ class Individual_entry_view(APIView):
                         swimmer__team__acronym__istartswith=search__team_acronym
                     )
 
-                # * only retrieve request range of values
-                individual_entries_of_heat = individual_entries_of_heat[
-                    lower_bound:upper_bound
-                ]
-
-                # * get individual_entries JSON
-                individual_entries_JSON = vh.get_JSON_multiple(
-                    "Individual_entry", individual_entries_of_heat, True
+                # * get individual_entries JSON -> request range of values or cursor page
+                individual_entries_JSON = vh.get_JSON_page(
+                    request, "Individual_entry", individual_entries_of_heat, lower_bound, upper_bound
                 )
                 # ? internal error generating JSON
                 if isinstance(individual_entries_JSON, Response):
@@ -414,12 +400,12 @@ class Individual_entry_view(APIView):
                 if isinstance(swimmer_of_id, Response):
                     return swimmer_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, swimmer_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, swimmer_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 individual_entries_of_swimmer = Individual_entry.objects.filter(
                     swimmer_id=swimmer_id
@@ -496,14 +482,9 @@ class Individual_entry_view(APIView):
                         )
                     )
 
-                # * only retrieve request range of values
-                individual_entries_of_swimmer = individual_entries_of_swimmer[
-                    lower_bound:upper_bound
-                ]
-
-                # * get individual_entries JSON
-                individual_entries_JSON = vh.get_JSON_multiple(
-                    "Individual_entry", individual_entries_of_swimmer, True
+                # * get individual_entries JSON -> request range of values or cursor page
+                individual_entries_JSON = vh.get_JSON_page(
+                    request, "Individual_entry", individual_entries_of_swimmer, lower_bound, upper_bound
                 )
                 # ? internal error generating JSON
                 if isinstance(individual_entries_JSON, Response):
@@ -541,7 +522,7 @@ class Individual_entry_view(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        check_is_host = vh.check_user_is_host(request, event_of_id.session.meet.host_id)
+        check_is_host = vh.check_user_is_host(request, event_of_id.meet.host_id)
         # ? user is not meet host
         if isinstance(check_is_host, Response):
             return check_is_host
@@ -559,7 +540,7 @@ class Individual_entry_view(APIView):
             return swimmer_of_id
 
         # ? swimmer and event meets do not match
-        if swimmer_of_id.meet_id != event_of_id.session.meet_id:
+        if swimmer_of_id.meet_id != event_of_id.meet_id:
             return Response(
                 "swimmer and event meets do not match",
                 status=status.HTTP_400_BAD_REQUEST,
@@ -580,6 +561,7 @@ class Individual_entry_view(APIView):
                 # lane_number => null,
                 swimmer_id=swimmer_id,
                 event_id=event_id,
+                meet_id=event_of_id.meet_id,
             )
 
             # * handle any duplicates
@@ -607,10 +589,10 @@ class Individual_entry_view(APIView):
             )
 
         # * invalidate event seeding
-        invalidate_hs_data = vh.invalidate_event_seeding(new_individual_entry.event)
-        # ? internal error invalidating event seeding
-        if isinstance(invalidate_hs_data, Response):
-            return invalidate_hs_data
+        vh.defer_event_seeding_invalidation(request, new_individual_entry.event)
+
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, new_individual_entry.meet_id)
 
         # * get individual_entry JSON
         new_individual_entry_JSON = vh.get_JSON_single(
@@ -643,7 +625,7 @@ class Individual_entry_view(APIView):
             return individual_entry_of_id
 
         check_is_host = vh.check_user_is_host(
-            request, individual_entry_of_id.event.session.meet.host_id
+            request, individual_entry_of_id.meet.host_id
         )
         # ? user is not meet host
         if isinstance(check_is_host, Response):
@@ -687,13 +669,19 @@ class Individual_entry_view(APIView):
                     )
 
                 edited_individual_entry.event = event_of_id
+                edited_individual_entry.meet_id = event_of_id.meet_id
 
             # @ handle FK swimmer change
             swimmer_id = vh.get_query_param(request, "swimmer_id")
             if isinstance(swimmer_id, str):
                 swimmer_id = int(swimmer_id)
 
-                if swimmer_id != edited_individual_entry.swimmer.pk:
+                # ~ a swimmer swap keeps the entry's heat and lane...
+                #   ! ...unless it replaces a duplicate entry of the event
+                if (
+                    swimmer_id != edited_individual_entry.swimmer.pk
+                    and vh.get_entry_duplicate_handling(request) == "keep_new"
+                ):
                     seeding_needs_invalidation = True
 
                 swimmer_of_id = vh.get_model_of_id("Swimmer", swimmer_id)
@@ -706,7 +694,7 @@ class Individual_entry_view(APIView):
             # ? swimmer and event meets do not match
             if (
                 edited_individual_entry.swimmer.meet_id
-                != edited_individual_entry.event.session.meet_id
+                != edited_individual_entry.meet_id
             ):
                 return Response(
                     "swimmer and event meets do not match",
@@ -746,20 +734,15 @@ class Individual_entry_view(APIView):
 
         # * invalidate event seeding
         if seeding_needs_invalidation:
-            invalidate_hs_data = vh.invalidate_event_seeding(
-                edited_individual_entry.event
-            )
-            # ? internal error invalidating event seeding
-            if isinstance(invalidate_hs_data, Response):
-                return invalidate_hs_data
+            vh.defer_event_seeding_invalidation(request, edited_individual_entry.event)
 
             if event_changed:
-                invalidate_hs_data = vh.invalidate_event_seeding(
-                    Event.objects.get(id=original_event_id)
+                vh.defer_event_seeding_invalidation(
+                    request, Event.objects.get(id=original_event_id)
                 )
-                # ? internal error invalidating event seeding
-                if isinstance(invalidate_hs_data, Response):
-                    return invalidate_hs_data
+
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, edited_individual_entry.meet_id)
 
         # * get individual_entry JSON
         edited_individual_entry_JSON = vh.get_JSON_single(
@@ -790,7 +773,7 @@ class Individual_entry_view(APIView):
             return individual_entry_of_id
 
         check_is_host = vh.check_user_is_host(
-            request, individual_entry_of_id.event.session.meet.host_id
+            request, individual_entry_of_id.meet.host_id
         )
         # ? user is not meet host
         if isinstance(check_is_host, Response):
@@ -803,11 +786,9 @@ class Individual_entry_view(APIView):
             individual_entry_of_id.delete()
 
             # * invalidate event seeding
-            invalidate_hs_data = vh.invalidate_event_seeding(event)
-            # ? internal error invalidating event seeding
-            if isinstance(invalidate_hs_data, Response):
-                return invalidate_hs_data
+            vh.defer_event_seeding_invalidation(request, event)
 
+            vh.defer_meet_version_bump(request, event.meet_id)
             return Response(status=status.HTTP_204_NO_CONTENT)
         # ? internal error deleting model
         except Exception as err:
@@ -1,10 +1,11 @@
-from rest_framework.views import APIView, Response
+from rest_framework.views import Response
 from rest_framework import status
 
 from .. import view_helpers as vh
+from .API_view import API_view
 
 
-class Info_view(APIView):
+class Info_view(API_view):
     def get(self, request):
         info_needed = vh.get_query_param(request, "info_needed")
         # ? no "info_needed" param passed
@@ -50,7 +51,30 @@ class Info_view(APIView):
                         {"has_editing_access": has_editing_access},
                         status=status.HTTP_200_OK,
                     )
-                
+
+            # $ ...editing access of many models
+            case "editing_access_batch":
+                model_pairs = vh.get_model_pairs(request)
+                # ? invalid "models" param passed
+                if isinstance(model_pairs, Response):
+                    return model_pairs
+
+                # * check editing access -> one query per model type
+                has_editing_accesses = vh.check_editing_accesses(request, model_pairs)
+                return Response(
+                    [
+                        {
+                            "model_type": model_type,
+                            "model_id": model_id,
+                            "has_editing_access": has_editing_access,
+                        }
+                        for (model_type, model_id), has_editing_access in zip(
+                            model_pairs, has_editing_accesses
+                        )
+                    ],
+                    status=status.HTTP_200_OK,
+                )
+
             # $ ...relationship tree
             case "relationship_tree":
                 model_type = vh.get_query_param(request, "model_type")
@@ -65,13 +89,10 @@ class Info_view(APIView):
                 else:
                     model_id = int(model_id)
 
-                model_object = vh.get_model_of_id(model_type, model_id)
-                # ? no model_object of model_id exists
-                if isinstance(model_object, Response):
-                    return model_object
-
-                # * get relationship tree
-                relationship_tree = vh.get_relationship_tree(model_type, model_object)
+                # * get relationship tree -> memoized per meet version
+                relationship_tree = vh.get_cached_relationship_tree(
+                    model_type, model_id
+                )
                 # ? internal error getting relationship tree
                 if isinstance(relationship_tree, Response):
                     return relationship_tree
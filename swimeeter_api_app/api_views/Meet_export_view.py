@@ -0,0 +1,32 @@
+from rest_framework.views import Response
+
+from .. import view_helpers as vh
+from .API_view import API_view
+
+from django.http import StreamingHttpResponse
+
+
+class Meet_export_view(API_view):
+    def get(self, request):
+        meet_id = vh.get_query_param(request, "meet_id")
+        # ? no "meet_id" param passed
+        if isinstance(meet_id, Response):
+            return meet_id
+        else:
+            meet_id = int(meet_id)
+
+        check_meet_access = vh.check_meet_access_allowed(request, meet_id)
+        # ? no meet of meet_id exists or private meet access not allowed
+        if isinstance(check_meet_access, Response):
+            return check_meet_access
+
+        # * stream meet as NDJSON -> memory stays flat for any meet size
+        export_response = StreamingHttpResponse(
+            vh.iter_meet_export_lines(meet_id),
+            content_type="application/x-ndjson",
+        )
+        export_response[
+            "Content-Disposition"
+        ] = f'attachment; filename="meet_{meet_id}.ndjson"'
+
+        return export_response
@@ -0,0 +1,34 @@
+from rest_framework.views import Response
+from rest_framework import status
+
+from .. import view_helpers as vh
+from .API_view import API_view
+
+
+class Meet_import_view(API_view):
+    def post(self, request):
+        check_logged_in = vh.check_user_logged_in(request)
+        # ? user is not logged in
+        if isinstance(check_logged_in, Response):
+            return check_logged_in
+
+        # * import meet from NDJSON body -> read line by line
+        import_lines = request.stream if request.stream is not None else []
+        duplicate_handling = vh.get_duplicate_handling(request)
+        import_result = vh.import_meet(import_lines, request.user.id, duplicate_handling)
+        # ? meet could not be imported
+        if isinstance(import_result, Response):
+            return import_result
+
+        new_meet, import_report = import_result
+
+        # * get meet JSON
+        meet_JSON = vh.get_JSON_single("Meet", new_meet, True)
+        # ? internal error generating JSON
+        if isinstance(meet_JSON, Response):
+            return meet_JSON
+        else:
+            return Response(
+                {"meet": meet_JSON, **import_report},
+                status=status.HTTP_201_CREATED,
+            )
@@ -1,13 +1,14 @@
-from rest_framework.views import APIView, Response
+from rest_framework.views import Response
 from rest_framework import status
 
 from ..models import Meet
 from .. import view_helpers as vh
+from .API_view import API_view
 
 from django.core.exceptions import ValidationError
 
 
-class Meet_view(APIView):
+class Meet_view(API_view):
     def get(self, request):
         specific_to = vh.get_query_param(request, "specific_to")
         # ? no "specific_to" param passed
@@ -44,10 +45,10 @@ class Meet_view(APIView):
                 if isinstance(meet_of_id, Response):
                     return meet_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(request, meet_of_id)
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                check_meet_read = vh.check_conditional_meet_read(request, meet_id)
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 # * get meet JSON
                 meet_JSON = vh.get_JSON_single("Meet", meet_of_id, True)
@@ -102,11 +103,10 @@ class Meet_view(APIView):
                         )
                     meets_of_host = meets_of_host.filter(is_public=search__is_public)
 
-                # * only retrieve request range of values
-                meets_of_host = meets_of_host[lower_bound:upper_bound]
-
-                # * get meets JSON
-                meets_JSON = vh.get_JSON_multiple("Meet", meets_of_host, True)
+                # * get meets JSON -> request range of values or cursor page
+                meets_JSON = vh.get_JSON_page(
+                    request, "Meet", meets_of_host, lower_bound, upper_bound
+                )
                 # ? internal error generating JSON
                 if isinstance(meets_JSON, Response):
                     return meets_JSON
@@ -135,11 +135,10 @@ class Meet_view(APIView):
                 if isinstance(search__host_last_name, str):
                     meets_of_all = meets_of_all.filter(host__last_name__istartswith=search__host_last_name)
                 
-                # * only retrieve request range of values
-                meets_of_all = meets_of_all[lower_bound:upper_bound]
-
-                # * get meets JSON
-                meets_JSON = vh.get_JSON_multiple("Meet", meets_of_all, True)
+                # * get meets JSON -> request range of values or cursor page
+                meets_JSON = vh.get_JSON_page(
+                    request, "Meet", meets_of_all, lower_bound, upper_bound
+                )
                 # ? internal error generating JSON
                 if isinstance(meets_JSON, Response):
                     return meets_JSON
@@ -258,6 +257,9 @@ class Meet_view(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, edited_meet.pk)
+
         # * get meet JSON
         meet_JSON = vh.get_JSON_single("Meet", edited_meet, True)
         # ? internal error generating JSON
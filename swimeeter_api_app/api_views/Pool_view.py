@@ -1,13 +1,14 @@
-from rest_framework.views import APIView, Response
+from rest_framework.views import Response
 from rest_framework import status
 
 from ..models import Pool, Session
 from .. import view_helpers as vh
+from .API_view import API_view
 
 from django.core.exceptions import ValidationError
 
 
-class Pool_view(APIView):
+class Pool_view(API_view):
     def get(self, request):
         specific_to = vh.get_query_param(request, "specific_to")
         # ? no "specific_to" param passed
@@ -44,12 +45,12 @@ class Pool_view(APIView):
                 if isinstance(pool_of_id, Response):
                     return pool_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, pool_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, pool_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 # * get pool JSON
                 pool_JSON = vh.get_JSON_single("Pool", pool_of_id, True)
@@ -71,15 +72,10 @@ class Pool_view(APIView):
                 else:
                     meet_id = int(meet_id)
 
-                meet_of_id = vh.get_model_of_id("Meet", meet_id)
-                # ? no meet of meet_id exists
-                if isinstance(meet_of_id, Response):
-                    return meet_of_id
-
-                check_meet_access = vh.check_meet_access_allowed(request, meet_of_id)
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                check_meet_read = vh.check_conditional_meet_read(request, meet_id)
+                # ? no meet of meet_id exists, access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 pools_of_meet = Pool.objects.filter(meet_id=meet_id).order_by(
                     "name", "lanes", "side_length", "measure_unit"
@@ -104,11 +100,10 @@ class Pool_view(APIView):
                 if isinstance(search__measure_unit, str):
                     pools_of_meet = pools_of_meet.filter(measure_unit__istartswith=search__measure_unit)
 
-                # * only retrieve request range of values
-                pools_of_meet = pools_of_meet[lower_bound:upper_bound]
-
-                # * get pools JSON
-                pools_JSON = vh.get_JSON_multiple("Pool", pools_of_meet, True)
+                # * get pools JSON -> request range of values or cursor page
+                pools_JSON = vh.get_JSON_page(
+                    request, "Pool", pools_of_meet, lower_bound, upper_bound
+                )
                 # ? internal error generating JSON
                 if isinstance(pools_JSON, Response):
                     return pools_JSON
@@ -180,6 +175,9 @@ class Pool_view(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, new_pool.meet_id)
+
         # * get pool JSON
         pool_JSON = vh.get_JSON_single("Pool", new_pool, True)
         # ? internal error generating JSON
@@ -254,6 +252,9 @@ class Pool_view(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, edited_pool.meet_id)
+
         # * get pool JSON
         pool_JSON = vh.get_JSON_single("Pool", edited_pool, True)
         # ? internal error generating JSON
@@ -294,6 +295,7 @@ class Pool_view(APIView):
         # * delete existing pool
         try:
             pool_of_id.delete()
+            vh.defer_meet_version_bump(request, pool_of_id.meet_id)
             return Response(status=status.HTTP_204_NO_CONTENT)
         # ? internal error deleting model
         except Exception as err:
@@ -0,0 +1,307 @@
+from rest_framework.views import Response
+from rest_framework import status
+
+from ..models import Event, Swimmer, Relay_entry, Relay_assignment
+from .. import view_helpers as vh
+from .API_view import API_view
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+
+class Relay_entry_batch_view(API_view):
+    def post(self, request):
+        check_logged_in = vh.check_user_logged_in(request)
+        # ? user is not logged in
+        if isinstance(check_logged_in, Response):
+            return check_logged_in
+
+        batch_items = vh.get_batch_items(request)
+        # ? invalid batch passed
+        if isinstance(batch_items, Response):
+            return batch_items
+
+        # * load every referenced event and swimmer -> one query each
+        events_of_ids = Event.objects.select_related("meet").in_bulk(
+            vh.get_batch_ids(batch_items, "event_id")
+        )
+        swimmers_of_ids = Swimmer.objects.in_bulk(
+            vh.get_batch_ids(
+                [
+                    assignment
+                    for batch_item in batch_items
+                    if isinstance(batch_item.get("assignments"), list)
+                    for assignment in batch_item["assignments"]
+                    if isinstance(assignment, dict)
+                ],
+                "swimmer_id",
+            )
+        )
+
+        # * validate every relay in memory
+        batch_results = [None] * len(batch_items)
+        new_relay_entries = {}
+        new_relay_assignments = {}
+        batch_swimmers = set()
+        for index, batch_item in enumerate(batch_items):
+            event_of_id = events_of_ids.get(batch_item.get("event_id"))
+            assignments = batch_item.get("assignments")
+
+            # ? no event of event_id exists
+            if event_of_id is None:
+                item_error = Response(
+                    "no Event with the given id exists",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? event is not a relay event
+            elif not event_of_id.is_relay:
+                item_error = Response(
+                    "event is not a relay event",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? assignments are not a list of objects
+            elif not isinstance(assignments, list) or not all(
+                isinstance(assignment, dict) for assignment in assignments
+            ):
+                item_error = Response(
+                    "assignments must be a list of objects",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            else:
+                # ? user is not meet host
+                item_error = vh.check_user_is_host(
+                    request, event_of_id.meet.host_id
+                )
+
+            if item_error is not None:
+                batch_results[index] = vh.get_batch_result(index, item_error)
+                continue
+
+            swimmer_ids = [assignment.get("swimmer_id") for assignment in assignments]
+            relay_placements = sorted(
+                assignment.get("order_in_relay") for assignment in assignments
+                if isinstance(assignment.get("order_in_relay"), int)
+            )
+            swimmers_of_relay = [
+                swimmers_of_ids.get(swimmer_id) for swimmer_id in swimmer_ids
+            ]
+
+            # ? relay has incorrect number of swimmers
+            if len(swimmer_ids) != event_of_id.swimmers_per_entry:
+                item_error = Response(
+                    "relay has incorrect number of swimmers",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? relay placements are incorrect
+            elif relay_placements != list(range(1, len(swimmer_ids) + 1)):
+                item_error = Response(
+                    "relay placements are incorrect",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? relay splits are missing
+            elif not all(
+                isinstance(assignment.get("seed_relay_split"), int)
+                and not isinstance(assignment.get("seed_relay_split"), bool)
+                for assignment in assignments
+            ):
+                item_error = Response(
+                    "relay splits are missing or not integers",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? duplicate swimmers exist inside relay
+            elif len(set(swimmer_ids)) != len(swimmer_ids):
+                item_error = Response(
+                    "duplicate swimmers exist inside relay",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? no swimmer of swimmer_id exists
+            elif None in swimmers_of_relay:
+                item_error = Response(
+                    "no Swimmer with the given id exists",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? swimmers of different teams exist inside relay
+            elif len({swimmer.team_id for swimmer in swimmers_of_relay}) > 1:
+                item_error = Response(
+                    "swimmers of different teams exist inside relay",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? swimmer and event meets do not match
+            elif any(
+                swimmer.meet_id != event_of_id.meet_id
+                for swimmer in swimmers_of_relay
+            ):
+                item_error = Response(
+                    "swimmer and event meets do not match",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # ? swimmer entered twice into the same event
+            elif any(
+                (event_of_id.pk, swimmer_id) in batch_swimmers
+                for swimmer_id in swimmer_ids
+            ):
+                item_error = Response(
+                    "duplicate entries exist inside batch",
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            else:
+                for swimmer_of_id in swimmers_of_relay:
+                    # ? swimmer and event are not compatible
+                    item_error = vh.validate_swimmer_against_event(
+                        swimmer_of_id, event_of_id
+                    )
+                    if item_error is not None:
+                        break
+
+            if item_error is not None:
+                batch_results[index] = vh.get_batch_result(index, item_error)
+                continue
+
+            try:
+                new_relay_entry = Relay_entry(
+                    seed_time=sum(
+                        assignment["seed_relay_split"] for assignment in assignments
+                    ),
+                    # heat_number => null,
+                    # lane_number => null,
+                    event=event_of_id,
+                    meet=event_of_id.meet,
+                )
+                new_relay_entry.full_clean(exclude=["event", "meet"])
+
+                relay_assignments = []
+                for assignment, swimmer_of_id in zip(assignments, swimmers_of_relay):
+                    new_relay_assignment = Relay_assignment(
+                        order_in_relay=assignment["order_in_relay"],
+                        seed_relay_split=assignment["seed_relay_split"],
+                        swimmer=swimmer_of_id,
+                        # relay_entry => assigned post-creation,
+                        meet=event_of_id.meet,
+                    )
+                    new_relay_assignment.full_clean(
+                        exclude=["swimmer", "relay_entry", "meet"]
+                    )
+                    relay_assignments.append(new_relay_assignment)
+            except ValidationError as err:
+                # ? invalid creation data passed -> validators
+                batch_results[index] = vh.get_batch_result(
+                    index,
+                    Response(
+                        "; ".join(err.messages),
+                        status=status.HTTP_400_BAD_REQUEST,
+                    ),
+                )
+                continue
+            except Exception as err:
+                # ? invalid creation data passed -> general
+                batch_results[index] = vh.get_batch_result(
+                    index,
+                    Response(
+                        str(err),
+                        status=status.HTTP_400_BAD_REQUEST,
+                    ),
+                )
+                continue
+
+            batch_swimmers.update(
+                (event_of_id.pk, swimmer_id) for swimmer_id in swimmer_ids
+            )
+            new_relay_entries[index] = new_relay_entry
+            new_relay_assignments[index] = relay_assignments
+
+        # * handle any duplicates -> one query for the whole batch
+        duplicate_handling = vh.get_entry_duplicate_handling(request)
+        original_duplicates = {}
+        for relay_entry_id, event_id, swimmer_id in Relay_assignment.objects.filter(
+            relay_entry__event_id__in={
+                entry.event_id for entry in new_relay_entries.values()
+            },
+            swimmer_id__in={
+                assignment.swimmer_id
+                for relay_assignments in new_relay_assignments.values()
+                for assignment in relay_assignments
+            },
+        ).values_list("relay_entry_id", "relay_entry__event_id", "swimmer_id"):
+            original_duplicates.setdefault((event_id, swimmer_id), set()).add(
+                relay_entry_id
+            )
+
+        replaced_relay_entry_ids = set()
+        for index, new_relay_entry in list(new_relay_entries.items()):
+            duplicate_ids = set()
+            for assignment in new_relay_assignments[index]:
+                duplicate_ids |= original_duplicates.get(
+                    (new_relay_entry.event_id, assignment.swimmer_id), set()
+                )
+            if len(duplicate_ids) == 0:
+                continue
+
+            if duplicate_handling == "keep_new":
+                replaced_relay_entry_ids |= duplicate_ids
+                continue
+
+            if duplicate_handling == "keep_originals":
+                item_response = Response(
+                    "new model is a duplicate; new model not added",
+                    status=status.HTTP_200_OK,
+                )
+            else:
+                item_response = Response(
+                    "unhandled duplicates exist",
+                    status=status.HTTP_409_CONFLICT,
+                )
+            batch_results[index] = vh.get_batch_result(index, item_response)
+            del new_relay_entries[index]
+            del new_relay_assignments[index]
+
+        # * create new relay_entries and their relay_assignments
+        try:
+            with transaction.atomic():
+                Relay_entry.objects.filter(id__in=replaced_relay_entry_ids).delete()
+                Relay_entry.objects.bulk_create(new_relay_entries.values())
+
+                for index, new_relay_entry in new_relay_entries.items():
+                    for new_relay_assignment in new_relay_assignments[index]:
+                        new_relay_assignment.relay_entry = new_relay_entry
+                Relay_assignment.objects.bulk_create(
+                    [
+                        new_relay_assignment
+                        for relay_assignments in new_relay_assignments.values()
+                        for new_relay_assignment in relay_assignments
+                    ]
+                )
+        # ? internal error creating models
+        except Exception as err:
+            return Response(
+                str(err),
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        affected_events = {
+            entry.event_id: entry.event for entry in new_relay_entries.values()
+        }
+
+        # * invalidate seeding of each affected event once
+        vh.defer_events_seeding_invalidation(request, affected_events.values())
+
+        # * mark meet heat sheets as changed
+        for event in affected_events.values():
+            vh.defer_meet_version_bump(request, event.meet_id)
+
+        # * get relay_entries JSON
+        relay_entries_JSON = vh.get_JSON_multiple(
+            "Relay_entry", list(new_relay_entries.values()), True
+        )
+        # ? internal error generating JSON
+        if isinstance(relay_entries_JSON, Response):
+            return relay_entries_JSON
+
+        for index, relay_entry_JSON in zip(
+            new_relay_entries.keys(), relay_entries_JSON
+        ):
+            batch_results[index] = vh.get_batch_result(
+                index,
+                Response(relay_entry_JSON, status=status.HTTP_201_CREATED),
+            )
+
+        return vh.get_batch_response(batch_results)
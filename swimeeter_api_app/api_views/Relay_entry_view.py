@@ -1,15 +1,16 @@
-from rest_framework.views import APIView, Response
+from rest_framework.views import Response
 from rest_framework import status
 
 from ..models import Relay_entry, Relay_assignment
 from .. import view_helpers as vh
+from .API_view import API_view
 
 from django.core.exceptions import ValidationError
 
 from django.db.models import Subquery
 
 
-class Relay_entry_view(APIView):
+class Relay_entry_view(API_view):
     def get(self, request):
         specific_to = vh.get_query_param(request, "specific_to")
         # ? no "specific_to" param passed
@@ -46,12 +47,12 @@ class Relay_entry_view(APIView):
                 if isinstance(relay_entry_of_id, Response):
                     return relay_entry_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, relay_entry_of_id.event.session.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, relay_entry_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 # * get relay_entry JSON
                 relay_entry_JSON = vh.get_JSON_single(
@@ -80,12 +81,12 @@ class Relay_entry_view(APIView):
                 if isinstance(event_of_id, Response):
                     return event_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, event_of_id.session.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, event_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 relay_entries_of_event = (
                     Relay_entry.objects.filter(event_id=event_id)
@@ -123,12 +124,9 @@ class Relay_entry_view(APIView):
                         swimmers__first_name__in=search__participant_names.split(", ")
                     )
 
-                # * only retrieve request range of values
-                relay_entries_of_event = relay_entries_of_event[lower_bound:upper_bound]
-
-                # * get relay_entries JSON
-                relay_entries_JSON = vh.get_JSON_multiple(
-                    "Relay_entry", relay_entries_of_event, True
+                # * get relay_entries JSON -> request range of values or cursor page
+                relay_entries_JSON = vh.get_JSON_page(
+                    request, "Relay_entry", relay_entries_of_event, lower_bound, upper_bound
                 )
                 # ? internal error generating JSON
                 if isinstance(relay_entries_JSON, Response):
@@ -153,12 +151,12 @@ class Relay_entry_view(APIView):
                 if isinstance(team_of_id, Response):
                     return team_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, team_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, team_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 relay_entries_of_team = (
                     Relay_entry.objects.filter(swimmers__team_id=team_id)
@@ -235,12 +233,9 @@ class Relay_entry_view(APIView):
                         swimmers__first_name__in=search__participant_names.split(", ")
                     )
 
-                # * only retrieve request range of values
-                relay_entries_of_team = relay_entries_of_team[lower_bound:upper_bound]
-
-                # * get relay_entries JSON
-                relay_entries_JSON = vh.get_JSON_multiple(
-                    "Relay_entry", relay_entries_of_team, True
+                # * get relay_entries JSON -> request range of values or cursor page
+                relay_entries_JSON = vh.get_JSON_page(
+                    request, "Relay_entry", relay_entries_of_team, lower_bound, upper_bound
                 )
                 # ? internal error generating JSON
                 if isinstance(relay_entries_JSON, Response):
@@ -265,12 +260,12 @@ class Relay_entry_view(APIView):
                 if isinstance(event_of_id, Response):
                     return event_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, event_of_id.session.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, event_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 heat_number = vh.get_query_param(request, "heat_number")
                 # ? no "heat_number" param passed
@@ -322,12 +317,9 @@ class Relay_entry_view(APIView):
                         swimmers__first_name__in=search__participant_names.split(", ")
                     )
 
-                # * only retrieve request range of values
-                relay_entries_of_heat = relay_entries_of_heat[lower_bound:upper_bound]
-
-                # * get relay_entries JSON
-                relay_entries_JSON = vh.get_JSON_multiple(
-                    "Relay_entry", relay_entries_of_heat, True
+                # * get relay_entries JSON -> request range of values or cursor page
+                relay_entries_JSON = vh.get_JSON_page(
+                    request, "Relay_entry", relay_entries_of_heat, lower_bound, upper_bound
                 )
                 # ? internal error generating JSON
                 if isinstance(relay_entries_JSON, Response):
@@ -352,12 +344,12 @@ class Relay_entry_view(APIView):
                 if isinstance(swimmer_of_id, Response):
                     return swimmer_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, swimmer_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, swimmer_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 relay_entries_of_swimmer = swimmer_of_id.relay_entries.all().order_by(
                     "event__stroke",
@@ -428,14 +420,9 @@ class Relay_entry_view(APIView):
                         swimmers__first_name__in=search__participant_names.split(", ")
                     )
 
-                # * only retrieve request range of values
-                relay_entries_of_swimmer = relay_entries_of_swimmer[
-                    lower_bound:upper_bound
-                ]
-
-                # * get relay_entries JSON
-                relay_entries_JSON = vh.get_JSON_multiple(
-                    "Relay_entry", relay_entries_of_swimmer, True
+                # * get relay_entries JSON -> request range of values or cursor page
+                relay_entries_JSON = vh.get_JSON_page(
+                    request, "Relay_entry", relay_entries_of_swimmer, lower_bound, upper_bound
                 )
                 # ? internal error generating JSON
                 if isinstance(relay_entries_JSON, Response):
@@ -476,7 +463,7 @@ class Relay_entry_view(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        check_is_host = vh.check_user_is_host(request, event_of_id.session.meet.host_id)
+        check_is_host = vh.check_user_is_host(request, event_of_id.meet.host_id)
         # ? user is not meet host
         if isinstance(check_is_host, Response):
             return check_is_host
@@ -525,7 +512,7 @@ class Relay_entry_view(APIView):
             
         for swimmer_of_id in swimmers_of_ids:
             # ? swimmer and event meets do not match
-            if swimmer_of_id.meet_id != event_of_id.session.meet_id:
+            if swimmer_of_id.meet_id != event_of_id.meet_id:
                 return Response(
                     "swimmer and event meets do not match",
                     status=status.HTTP_400_BAD_REQUEST,
@@ -562,6 +549,7 @@ class Relay_entry_view(APIView):
                 # lane_number => null,
                 # swimmers => assigned post-creation,
                 event_id=event_id,
+                meet_id=event_of_id.meet_id,
             )
 
             new_relay_entry.full_clean()
@@ -591,6 +579,7 @@ class Relay_entry_view(APIView):
                     seed_relay_split=assignment["seed_relay_split"],
                     swimmer_id=assignment["swimmer_id"],
                     relay_entry=new_relay_entry,
+                    meet_id=new_relay_entry.meet_id,
                 )
 
                 new_relay_assignment.full_clean()
@@ -644,10 +633,10 @@ class Relay_entry_view(APIView):
             original_duplicates.delete()
 
         # * invalidate event seeding
-        invalidate_hs_data = vh.invalidate_event_seeding(new_relay_entry.event)
-        # ? internal error invalidating event seeding
-        if isinstance(invalidate_hs_data, Response):
-            return invalidate_hs_data
+        vh.defer_event_seeding_invalidation(request, new_relay_entry.event)
+
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, new_relay_entry.meet_id)
 
         # * get relay_entry JSON
         new_relay_entry_JSON = vh.get_JSON_single("Relay_entry", new_relay_entry, True)
@@ -675,9 +664,7 @@ class Relay_entry_view(APIView):
         if isinstance(relay_entry_of_id, Response):
             return relay_entry_of_id
 
-        check_is_host = vh.check_user_is_host(
-            request, relay_entry_of_id.event.session.meet.host_id
-        )
+        check_is_host = vh.check_user_is_host(request, relay_entry_of_id.meet.host_id)
         # ? user is not meet host
         if isinstance(check_is_host, Response):
             return check_is_host
@@ -695,10 +682,8 @@ class Relay_entry_view(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        original_swimmer_ids = [swimmer.pk for swimmer in list(relay_entry_of_id.swimmers.all())]
-        if (sorted(original_swimmer_ids) != sorted(swimmer_ids)):
-            # * swimmers changed
-            seeding_needs_invalidation = True
+        # ~ swimmer changes keep the entry's heat and lane -> only seed time, event
+        #   and replaced duplicates require invalidation below
 
         event_changed = False
         original_event = relay_entry_of_id.event
@@ -724,6 +709,7 @@ class Relay_entry_view(APIView):
                 )
 
             relay_entry_of_id.event = event_of_id
+            relay_entry_of_id.meet_id = event_of_id.meet_id
 
         # ? relay has incorrect number of swimmers
         if len(swimmer_ids) != relay_entry_of_id.event.swimmers_per_entry:
@@ -756,7 +742,7 @@ class Relay_entry_view(APIView):
 
         for swimmer_of_id in swimmers_of_ids:
             # ? swimmer and event meets do not match
-            if swimmer_of_id.meet_id != relay_entry_of_id.event.session.meet_id:
+            if swimmer_of_id.meet_id != relay_entry_of_id.meet_id:
                 return Response(
                     "swimmer and event meets do not match",
                     status=status.HTTP_400_BAD_REQUEST,
@@ -801,6 +787,7 @@ class Relay_entry_view(APIView):
                     seed_relay_split=assignment["seed_relay_split"],
                     swimmer_id=assignment["swimmer_id"],
                     relay_entry=edited_relay_entry,
+                    meet_id=edited_relay_entry.meet_id,
                 )
 
                 new_relay_assignment.full_clean()
@@ -846,16 +833,13 @@ class Relay_entry_view(APIView):
 
         # * invalidate event seeding
         if seeding_needs_invalidation:
-            invalidate_hs_data = vh.invalidate_event_seeding(edited_relay_entry.event)
-            # ? internal error invalidating event seeding
-            if isinstance(invalidate_hs_data, Response):
-                return invalidate_hs_data
+            vh.defer_event_seeding_invalidation(request, edited_relay_entry.event)
 
             if event_changed:
-                invalidate_hs_data = vh.invalidate_event_seeding(original_event)
-                # ? internal error invalidating event seeding
-                if isinstance(invalidate_hs_data, Response):
-                    return invalidate_hs_data
+                vh.defer_event_seeding_invalidation(request, original_event)
+
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, edited_relay_entry.meet_id)
 
         # * get relay_entry JSON
         edited_relay_entry_JSON = vh.get_JSON_single(
@@ -883,9 +867,7 @@ class Relay_entry_view(APIView):
         if isinstance(relay_entry_of_id, Response):
             return relay_entry_of_id
 
-        check_is_host = vh.check_user_is_host(
-            request, relay_entry_of_id.event.session.meet.host_id
-        )
+        check_is_host = vh.check_user_is_host(request, relay_entry_of_id.meet.host_id)
         # ? user is not meet host
         if isinstance(check_is_host, Response):
             return check_is_host
@@ -897,11 +879,9 @@ class Relay_entry_view(APIView):
             relay_entry_of_id.delete()
 
             # * invalidate event seeding
-            invalidate_hs_data = vh.invalidate_event_seeding(event)
-            # ? internal error invalidating event seeding
-            if isinstance(invalidate_hs_data, Response):
-                return invalidate_hs_data
+            vh.defer_event_seeding_invalidation(request, event)
 
+            vh.defer_meet_version_bump(request, event.meet_id)
             return Response(status=status.HTTP_204_NO_CONTENT)
         # ? internal error deleting model
         except Exception as err:
@@ -1,14 +1,15 @@
 from datetime import datetime
-from rest_framework.views import APIView, Response
+from rest_framework.views import Response
 from rest_framework import status
 
 from ..models import Session
 from .. import view_helpers as vh
+from .API_view import API_view
 
 from django.core.exceptions import ValidationError
 
 
-class Session_view(APIView):
+class Session_view(API_view):
     def get(self, request):
         specific_to = vh.get_query_param(request, "specific_to")
         # ? no "specific_to" param passed
@@ -45,12 +46,12 @@ class Session_view(APIView):
                 if isinstance(session_of_id, Response):
                     return session_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, session_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, session_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 # * get session JSON
                 session_JSON = vh.get_JSON_single("Session", session_of_id, True)
@@ -77,10 +78,12 @@ class Session_view(APIView):
                 if isinstance(pool_of_id, Response):
                     return pool_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(request, pool_of_id.meet)
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, pool_of_id.meet_id
+                )
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 sessions_of_pool = Session.objects.filter(pool_id=pool_id).order_by(
                     "begin_time", "end_time", "name"
@@ -91,11 +94,10 @@ class Session_view(APIView):
                 if isinstance(search__name, str):
                     sessions_of_pool = sessions_of_pool.filter(name__istartswith=search__name)
 
-                # * only retrieve request range of values
-                sessions_of_pool = sessions_of_pool[lower_bound:upper_bound]
-
-                # * get sessions JSON
-                sessions_JSON = vh.get_JSON_multiple("Session", sessions_of_pool, True)
+                # * get sessions JSON -> request range of values or cursor page
+                sessions_JSON = vh.get_JSON_page(
+                    request, "Session", sessions_of_pool, lower_bound, upper_bound
+                )
                 # ? internal error generating JSON
                 if isinstance(sessions_JSON, Response):
                     return sessions_JSON
@@ -114,15 +116,10 @@ class Session_view(APIView):
                 else:
                     meet_id = int(meet_id)
 
-                meet_of_id = vh.get_model_of_id("Meet", meet_id)
-                # ? no meet of meet_id exists
-                if isinstance(meet_of_id, Response):
-                    return meet_of_id
-
-                check_meet_access = vh.check_meet_access_allowed(request, meet_of_id)
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                check_meet_read = vh.check_conditional_meet_read(request, meet_id)
+                # ? no meet of meet_id exists, access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 sessions_of_meet = Session.objects.filter(meet_id=meet_id).order_by(
                     "begin_time", "end_time", "name"
@@ -137,11 +134,10 @@ class Session_view(APIView):
                 if isinstance(search__pool_name, str):
                     sessions_of_meet = sessions_of_meet.filter(pool__name__istartswith=search__pool_name)
 
-                # * only retrieve request range of values
-                sessions_of_meet = sessions_of_meet[lower_bound:upper_bound]
-
-                # * get sessions JSON
-                sessions_JSON = vh.get_JSON_multiple("Session", sessions_of_meet, True)
+                # * get sessions JSON -> request range of values or cursor page
+                sessions_JSON = vh.get_JSON_page(
+                    request, "Session", sessions_of_meet, lower_bound, upper_bound
+                )
                 # ? internal error generating JSON
                 if isinstance(sessions_JSON, Response):
                     return sessions_JSON
@@ -243,6 +239,9 @@ class Session_view(APIView):
                 meet_of_id.full_clean()
                 meet_of_id.save()
 
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, new_session.meet_id)
+
         # * get session JSON
         session_JSON = vh.get_JSON_single("Session", new_session, True)
         # ? internal error generating JSON
@@ -340,6 +339,9 @@ class Session_view(APIView):
             meet_of_id.full_clean()
             meet_of_id.save()
 
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, edited_session.meet_id)
+
         # * get session JSON
         session_JSON = vh.get_JSON_single("Session", edited_session, True)
         # ? internal error generating JSON
@@ -398,6 +400,7 @@ class Session_view(APIView):
         # * delete existing session
         try:
             session_of_id.delete()
+            vh.defer_meet_version_bump(request, session_of_id.meet_id)
             return Response(status=status.HTTP_204_NO_CONTENT)
         # ? internal error deleting model
         except Exception as err:
@@ -1,13 +1,14 @@
-from rest_framework.views import APIView, Response
+from rest_framework.views import Response
 from rest_framework import status
 
 from ..models import Swimmer, Individual_entry, Relay_entry
 from .. import view_helpers as vh
+from .API_view import API_view
 
 from django.core.exceptions import ValidationError
 
 
-class Swimmer_view(APIView):
+class Swimmer_view(API_view):
     def get(self, request):
         specific_to = vh.get_query_param(request, "specific_to")
         # ? no "specific_to" param passed
@@ -44,12 +45,12 @@ class Swimmer_view(APIView):
                 if isinstance(swimmer_of_id, Response):
                     return swimmer_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, swimmer_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, swimmer_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 # * get swimmer JSON
                 swimmer_JSON = vh.get_JSON_single("Swimmer", swimmer_of_id, True)
@@ -71,15 +72,10 @@ class Swimmer_view(APIView):
                 else:
                     meet_id = int(meet_id)
 
-                meet_of_id = vh.get_model_of_id("Meet", meet_id)
-                # ? no meet of meet_id exists
-                if isinstance(meet_of_id, Response):
-                    return meet_of_id
-
-                check_meet_access = vh.check_meet_access_allowed(request, meet_of_id)
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                check_meet_read = vh.check_conditional_meet_read(request, meet_id)
+                # ? no meet of meet_id exists, access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 swimmers_of_meet = Swimmer.objects.filter(meet_id=meet_id).order_by(
                     "last_name", "first_name", "age", "gender"
@@ -111,11 +107,10 @@ class Swimmer_view(APIView):
                 if isinstance(search__team_acronym, str):
                     swimmers_of_meet = swimmers_of_meet.filter(team__acronym__istartswith=search__team_acronym)
 
-                # * only retrieve request range of values
-                swimmers_of_meet = swimmers_of_meet[lower_bound:upper_bound]
-
-                # * get swimmers JSON
-                swimmers_JSON = vh.get_JSON_multiple("Swimmer", swimmers_of_meet, True)
+                # * get swimmers JSON -> request range of values or cursor page
+                swimmers_JSON = vh.get_JSON_page(
+                    request, "Swimmer", swimmers_of_meet, lower_bound, upper_bound
+                )
                 # ? internal error generating JSON
                 if isinstance(swimmers_JSON, Response):
                     return swimmers_JSON
@@ -139,12 +134,12 @@ class Swimmer_view(APIView):
                 if isinstance(team_of_id, Response):
                     return team_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, team_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, team_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 swimmers_of_team = Swimmer.objects.filter(team_id=team_id).order_by(
                     "last_name", "first_name", "age", "gender"
@@ -168,11 +163,10 @@ class Swimmer_view(APIView):
                 if isinstance(search__gender, str):
                     swimmers_of_team = swimmers_of_team.filter(gender__istartswith=search__gender)
 
-                # * only retrieve request range of values
-                swimmers_of_team = swimmers_of_team[lower_bound:upper_bound]
-
-                # * get swimmers JSON
-                swimmers_JSON = vh.get_JSON_multiple("Swimmer", swimmers_of_team, True)
+                # * get swimmers JSON -> request range of values or cursor page
+                swimmers_JSON = vh.get_JSON_page(
+                    request, "Swimmer", swimmers_of_team, lower_bound, upper_bound
+                )
                 # ? internal error generating JSON
                 if isinstance(swimmers_JSON, Response):
                     return swimmers_JSON
@@ -257,6 +251,9 @@ class Swimmer_view(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, meet_id)
+
         # * get swimmer JSON
         swimmer_JSON = vh.get_JSON_single("Swimmer", new_swimmer, True)
         # ? internal error generating JSON
@@ -344,49 +341,53 @@ class Swimmer_view(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # * delete newly incompatible entries and invalidate event seeding
+        # * find newly incompatible entries
+        incompatible_relay_entries = []
         relay_entries_of_swimmer = Relay_entry.objects.filter(
             swimmers__in=[edited_swimmer.pk]
-        )
+        ).select_related("event")
         for entry in relay_entries_of_swimmer:
             if team_changed:
-                # * invalidate event seeding
-                invalidate_hs_data = vh.invalidate_event_seeding(entry.event)
-                # ? internal error invalidating event seeding
-                if isinstance(invalidate_hs_data, Response):
-                    return invalidate_hs_data
-
-                entry.delete()
+                incompatible_relay_entries.append(entry)
             else:
                 check_compatibility = vh.validate_swimmer_against_event(
                     edited_swimmer, entry.event
                 )
                 # ? swimmer and event are not compatible
                 if isinstance(check_compatibility, Response):
-                    # * invalidate event seeding
-                    invalidate_hs_data = vh.invalidate_event_seeding(entry.event)
-                    # ? internal error invalidating event seeding
-                    if isinstance(invalidate_hs_data, Response):
-                        return invalidate_hs_data
-
-                    entry.delete()
+                    incompatible_relay_entries.append(entry)
 
+        incompatible_individual_entries = []
         individual_entries_of_swimmer = Individual_entry.objects.filter(
             swimmer_id=edited_swimmer.pk
-        )
+        ).select_related("event")
         for entry in individual_entries_of_swimmer:
             check_compatibility = vh.validate_swimmer_against_event(
                 edited_swimmer, entry.event
             )
             # ? swimmer and event are not compatible
             if isinstance(check_compatibility, Response):
-                # * invalidate event seeding
-                invalidate_hs_data = vh.invalidate_event_seeding(entry.event)
-                # ? internal error invalidating event seeding
-                if isinstance(invalidate_hs_data, Response):
-                    return invalidate_hs_data
+                incompatible_individual_entries.append(entry)
+
+        # * invalidate seeding of all affected events at once
+        vh.defer_events_seeding_invalidation(
+            request,
+            [
+                entry.event
+                for entry in incompatible_relay_entries + incompatible_individual_entries
+            ],
+        )
+
+        # * delete newly incompatible entries
+        Relay_entry.objects.filter(
+            id__in=[entry.pk for entry in incompatible_relay_entries]
+        ).delete()
+        Individual_entry.objects.filter(
+            id__in=[entry.pk for entry in incompatible_individual_entries]
+        ).delete()
 
-                entry.delete()
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, edited_swimmer.meet_id)
 
         # * get swimmer JSON
         swimmer_JSON = vh.get_JSON_single("Swimmer", edited_swimmer, True)
@@ -420,27 +421,23 @@ class Swimmer_view(APIView):
         # * delete existing swimmer
         try:
             individual_entries_of_swimmer = Individual_entry.objects.filter(
-            swimmer_id=swimmer_of_id.pk
-            )
-            for entry in individual_entries_of_swimmer:
-                # * invalidate event seeding
-                invalidate_hs_data = vh.invalidate_event_seeding(entry.event)
-                # ? internal error invalidating event seeding
-                if isinstance(invalidate_hs_data, Response):
-                    return invalidate_hs_data
-
+                swimmer_id=swimmer_of_id.pk
+            ).select_related("event")
             relay_entries_of_swimmer = Relay_entry.objects.filter(
                 swimmers__in=[swimmer_of_id.pk]
+            ).select_related("event")
+
+            # * invalidate seeding of all affected events at once
+            vh.defer_events_seeding_invalidation(
+                request,
+                [entry.event for entry in individual_entries_of_swimmer]
+                + [entry.event for entry in relay_entries_of_swimmer],
             )
-            for entry in relay_entries_of_swimmer:
-                # * invalidate event seeding
-                invalidate_hs_data = vh.invalidate_event_seeding(entry.event)
-                # ? internal error invalidating event seeding
-                if isinstance(invalidate_hs_data, Response):
-                    return invalidate_hs_data
-                entry.delete() # ! manual deletion due to indirect relationship through Relay_assignment
+
+            relay_entries_of_swimmer.delete() # ! manual deletion due to indirect relationship through Relay_assignment
 
             swimmer_of_id.delete()
+            vh.defer_meet_version_bump(request, swimmer_of_id.meet_id)
             return Response(status=status.HTTP_204_NO_CONTENT)
         # ? internal error deleting model
         except Exception as err:
@@ -1,13 +1,14 @@
-from rest_framework.views import APIView, Response
+from rest_framework.views import Response
 from rest_framework import status
 
 from ..models import Team, Swimmer, Individual_entry, Relay_entry
 from .. import view_helpers as vh
+from .API_view import API_view
 
 from django.core.exceptions import ValidationError
 
 
-class Team_view(APIView):
+class Team_view(API_view):
     def get(self, request):
         specific_to = vh.get_query_param(request, "specific_to")
         # ? no "specific_to" param passed
@@ -44,12 +45,12 @@ class Team_view(APIView):
                 if isinstance(team_of_id, Response):
                     return team_of_id
 
-                check_meet_access = vh.check_meet_access_allowed(
-                    request, team_of_id.meet
+                check_meet_read = vh.check_conditional_meet_read(
+                    request, team_of_id.meet_id
                 )
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                # ? private meet access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 # * get team JSON
                 team_JSON = vh.get_JSON_single("Team", team_of_id, True)
@@ -71,15 +72,10 @@ class Team_view(APIView):
                 else:
                     meet_id = int(meet_id)
 
-                meet_of_id = vh.get_model_of_id("Meet", meet_id)
-                # ? no meet of meet_id exists
-                if isinstance(meet_of_id, Response):
-                    return meet_of_id
-
-                check_meet_access = vh.check_meet_access_allowed(request, meet_of_id)
-                # ? private meet access not allowed
-                if isinstance(check_meet_access, Response):
-                    return check_meet_access
+                check_meet_read = vh.check_conditional_meet_read(request, meet_id)
+                # ? no meet of meet_id exists, access not allowed or meet unchanged
+                if isinstance(check_meet_read, Response):
+                    return check_meet_read
 
                 teams_of_meet = Team.objects.filter(meet_id=meet_id).order_by(
                     "name", "acronym"
@@ -94,11 +90,10 @@ class Team_view(APIView):
                 if isinstance(search__acronym, str):
                     teams_of_meet = teams_of_meet.filter(acronym__istartswith=search__acronym)
 
-                # * only retrieve request range of values
-                teams_of_meet = teams_of_meet[lower_bound:upper_bound]
-
-                # * get teams JSON
-                teams_JSON = vh.get_JSON_multiple("Team", teams_of_meet, True)
+                # * get teams JSON -> request range of values or cursor page
+                teams_JSON = vh.get_JSON_page(
+                    request, "Team", teams_of_meet, lower_bound, upper_bound
+                )
                 # ? internal error generating JSON
                 if isinstance(teams_JSON, Response):
                     return teams_JSON
@@ -165,6 +160,9 @@ class Team_view(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, meet_id)
+
         # * get team JSON
         team_JSON = vh.get_JSON_single("Team", new_team, True)
         # ? internal error generating JSON
@@ -227,6 +225,9 @@ class Team_view(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # * mark meet heat sheets as changed
+        vh.defer_meet_version_bump(request, edited_team.meet_id)
+
         # * get team JSON
         team_JSON = vh.get_JSON_single("Team", edited_team, True)
         # ? internal error generating JSON
@@ -267,6 +268,7 @@ class Team_view(APIView):
         # * delete existing swimmer
         try:
             team_of_id.delete()
+            vh.defer_meet_version_bump(request, team_of_id.meet_id)
             return Response(status=status.HTTP_204_NO_CONTENT)
         # ? internal error deleting model
         except Exception as err:
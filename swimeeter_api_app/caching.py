@@ -0,0 +1,82 @@
+from django.core.cache import caches
+from django.db.models import F
+
+from .models import Meet
+
+import threading
+
+# ! per-meet caching keyed by a meet version counter
+#   ~ any write that changes what a meet's heat sheets show bumps the version
+#   ! the version lives on the Meet row -> every worker process reads the same one
+#   ~ cached payloads of older versions are never read again and simply expire
+
+# ~ cache backend is configured in settings.CACHES -> locmem or file-based
+HEAT_SHEET_CACHE_ALIAS = "heat_sheets"
+HEAT_SHEET_CACHE_TIMEOUT = 60 * 60
+
+heat_sheet_cache_stats = {"hits": 0, "misses": 0}
+heat_sheet_cache_stats_lock = threading.Lock()
+
+
+def get_heat_sheet_cache():
+    return caches[HEAT_SHEET_CACHE_ALIAS]
+
+
+def get_meet_version(meet_id):
+    # ~ None if the meet no longer exists
+    return Meet.objects.filter(id=meet_id).values_list("version", flat=True).first()
+
+
+def bump_meet_version(meet_id):
+    Meet.objects.filter(id=meet_id).update(version=F("version") + 1)
+
+
+def get_heat_sheet_key(meet_id, meet_version, model_type, model_id):
+    return f"heat_sheet:{meet_id}:{meet_version}:{model_type}:{model_id}"
+
+
+def get_cached_heat_sheet(heat_sheet_key):
+    heat_sheet_data = get_heat_sheet_cache().get(heat_sheet_key)
+
+    with heat_sheet_cache_stats_lock:
+        if heat_sheet_data is None:
+            heat_sheet_cache_stats["misses"] += 1
+        else:
+            heat_sheet_cache_stats["hits"] += 1
+
+    return heat_sheet_data
+
+
+def set_cached_heat_sheet(heat_sheet_key, heat_sheet_data):
+    get_heat_sheet_cache().set(
+        heat_sheet_key, heat_sheet_data, timeout=HEAT_SHEET_CACHE_TIMEOUT
+    )
+
+
+def get_heat_sheet_cache_stats():
+    with heat_sheet_cache_stats_lock:
+        return {
+            **heat_sheet_cache_stats,
+            "backend": type(get_heat_sheet_cache()).__name__,
+        }
+
+
+# ! relationship tree caching keyed by model and meet version
+#   ~ breadcrumbs only change when their meet changes -> every such write bumps it
+RELATIONSHIP_TREE_CACHE_TIMEOUT = 60 * 60
+
+
+def get_relationship_tree_key(model_type, model_id, meet_version):
+    return f"relationship_tree:{model_type}:{model_id}:{meet_version}"
+
+
+def get_cached_relationship_tree(relationship_tree_key):
+    return get_heat_sheet_cache().get(relationship_tree_key)
+
+
+def set_cached_relationship_tree(relationship_tree_key, relationship_tree):
+    get_heat_sheet_cache().set(
+        relationship_tree_key,
+        relationship_tree,
+        timeout=RELATIONSHIP_TREE_CACHE_TIMEOUT,
+    )
@@ -0,0 +1,12 @@
+from django.contrib.postgres.indexes import OpClass
+
+
+class Portable_op_class(OpClass):
+    # ~ drop-in replacement for OpClass in index expressions
+    #   $ Postgres: indexes the expression with the given operator class
+    #   $ other databases (SQLite for local runs): indexes the plain expression
+    def as_sql(self, compiler, connection, **extra_context):
+        if connection.vendor != "postgresql":
+            return compiler.compile(self.get_source_expressions()[0])
+
+        return super().as_sql(compiler, connection, **extra_context)
@@ -0,0 +1,106 @@
+import random
+import string
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from ...models import Meet, Team, Swimmer
+from swimeeter_auth_app.models import Host
+
+
+def generate_name(length):
+    return random.choice(string.ascii_uppercase) + "".join(
+        random.choices(string.ascii_lowercase, k=length - 1)
+    )
+
+
+class Command(BaseCommand):
+    help = "Time the search__ name prefix filters on a generated meet (rolled back)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--swimmers", type=int, default=100_000)
+        parser.add_argument("--teams", type=int, default=200)
+        parser.add_argument("--runs", type=int, default=20)
+
+    def handle(self, *args, **options):
+        random.seed(0)
+
+        # ! everything generated here is rolled back at the end
+        with transaction.atomic():
+            host = Host.objects.create(
+                username="benchmark@swimeeter.local",
+                email="benchmark@swimeeter.local",
+                first_name="Benchmark",
+                last_name="Host",
+                screen_mode="system",
+                data_entry_information=False,
+                destructive_action_confirms=False,
+                motion_safe=False,
+            )
+            meet = Meet.objects.create(
+                name="Generated Search Meet",
+                is_public=True,
+                host=host,
+                begin_time=timezone.now(),
+                end_time=timezone.now(),
+            )
+            teams = Team.objects.bulk_create(
+                [
+                    Team(name=generate_name(10), acronym=generate_name(4).upper(), meet=meet)
+                    for _ in range(options["teams"])
+                ]
+            )
+            Swimmer.objects.bulk_create(
+                [
+                    Swimmer(
+                        first_name=generate_name(random.randint(3, 10)),
+                        last_name=generate_name(random.randint(3, 12)),
+                        age=random.randint(8, 60),
+                        gender=random.choice(["Man", "Woman"]),
+                        meet=meet,
+                        team=random.choice(teams),
+                    )
+                    for _ in range(options["swimmers"])
+                ],
+                batch_size=5000,
+            )
+
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute("ANALYZE")
+
+            # ~ same filters as the search__ params of the list views
+            search_queries = {
+                "search__first_name": lambda: Swimmer.objects.filter(
+                    meet_id=meet.pk, first_name__istartswith="ma"
+                ),
+                "search__last_name": lambda: Swimmer.objects.filter(
+                    meet_id=meet.pk, last_name__istartswith="smi"
+                ),
+                "search__team_name": lambda: Swimmer.objects.filter(
+                    meet_id=meet.pk, team__name__istartswith="bo"
+                ),
+                "search__name (teams)": lambda: Team.objects.filter(
+                    meet_id=meet.pk, name__istartswith="bo"
+                ),
+                "search__name (meets)": lambda: Meet.objects.filter(
+                    is_public=True, name__istartswith="gen"
+                ),
+                "search__host_last_name": lambda: Meet.objects.filter(
+                    is_public=True, host__last_name__istartswith="ho"
+                ),
+            }
+
+            for search_name, get_query_set in search_queries.items():
+                total_seconds = timeit.timeit(
+                    lambda: list(get_query_set()[:100]), number=options["runs"]
+                )
+                self.stdout.write(
+                    f"{search_name}: {total_seconds / options['runs'] * 1000:.2f} ms per query"
+                )
+                if options["verbosity"] > 1:
+                    self.stdout.write(get_query_set()[:100].explain())
+
+            transaction.set_rollback(True)
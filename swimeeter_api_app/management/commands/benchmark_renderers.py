@@ -0,0 +1,106 @@
+import random
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from ... import view_helpers as vh
+from ...renderers import Fast_JSON_renderer
+
+
+def generate_seeding_payload(total_heats, lanes, events_per_session):
+    # ~ shaped like get_seeding_data(..., "Overview", ...)
+    sessions_data = []
+    session_begin_time = datetime(2023, 7, 28, 9, tzinfo=timezone.utc)
+    heats_left = total_heats
+    event_id = 0
+    entry_id = 0
+
+    while heats_left > 0:
+        events_data = []
+        for _ in range(events_per_session):
+            if heats_left == 0:
+                break
+
+            event_id += 1
+            event_heats = min(heats_left, random.randint(1, 20))
+            heats_left -= event_heats
+
+            heats_data = []
+            for heat_number in range(1, event_heats + 1):
+                lane_entries = []
+                for lane_number in range(1, lanes + 1):
+                    entry_id += 1
+                    lane_entries.append(
+                        (
+                            lane_number,
+                            {
+                                "entry_id": entry_id,
+                                "entry_name": f"Swimmer {entry_id}",
+                                "entry_team": f"Team {entry_id % 40}",
+                                "entry_seed_time": random.randint(2500, 60000),
+                            },
+                        )
+                    )
+                heats_data.append(
+                    vh.build_heat_seeding_data(heat_number, lane_entries, lanes)
+                )
+
+            events_data.append(
+                {
+                    "event_id": event_id,
+                    "event_name": f"Event {event_id}",
+                    "event_number": len(events_data) + 1,
+                    "event_is_relay": False,
+                    "heats_data": heats_data,
+                }
+            )
+
+        sessions_data.append(
+            {
+                "session_id": len(sessions_data) + 1,
+                "session_name": f"Session {len(sessions_data) + 1}",
+                "session_number": len(sessions_data) + 1,
+                "session_begin_time": session_begin_time,
+                "session_seeding_full": True,
+                "events_data": events_data,
+            }
+        )
+        session_begin_time += timedelta(hours=4)
+
+    return {
+        "meet_id": 1,
+        "meet_name": "Generated Championship Meet",
+        "meet_begin_time": datetime(2023, 7, 28, 9, tzinfo=timezone.utc),
+        "meet_seeding_full": True,
+        "sessions_data": sessions_data,
+    }
+
+
+class Command(BaseCommand):
+    help = "Compare API renderer encode times on a generated heat sheet payload"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--heats", type=int, default=1000)
+        parser.add_argument("--lanes", type=int, default=8)
+        parser.add_argument("--runs", type=int, default=20)
+
+    def handle(self, *args, **options):
+        payload = generate_seeding_payload(options["heats"], options["lanes"], 30)
+        runs = options["runs"]
+
+        for renderer in (JSONRenderer(), Fast_JSON_renderer()):
+            rendered = renderer.render(payload)
+            total_seconds = timeit.timeit(
+                lambda: renderer.render(payload), number=runs
+            )
+            self.stdout.write(
+                f"{type(renderer).__name__}: {options['heats']} heats, "
+                f"{len(rendered) / 1_000_000:.2f} MB, "
+                f"{total_seconds / runs * 1000:.2f} ms per render"
+            )
+
+        # * both renderers must produce the same JSON document
+        if JSONRenderer().render(payload) != Fast_JSON_renderer().render(payload):
+            self.stderr.write("renderers produced different output")
@@ -0,0 +1,65 @@
+import random
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from ... import seeding
+
+
+def python_seeding(seed_times, lanes_per_heat, options):
+    heat_entry_counts = seeding.get_heat_entry_counts(
+        len(seed_times), lanes_per_heat, options["min_entries_per_heat"]
+    )
+    return seeding.SEEDING_STRATEGIES[options["seeding_type"]](
+        heat_entry_counts, seeding.get_standard_lane_order(lanes_per_heat), options
+    )
+
+
+class Command(BaseCommand):
+    help = "Time the pure Python and NumPy seeding strategies on a generated event"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--entries", type=int, default=10000)
+        parser.add_argument("--lanes", type=int, default=8)
+        parser.add_argument("--runs", type=int, default=20)
+
+    def handle(self, *args, **options):
+        random.seed(0)
+        seed_times = sorted(
+            random.randint(2500, 60000) for _ in range(options["entries"])
+        )
+        lanes_per_heat = options["lanes"]
+        runs = options["runs"]
+
+        for seeding_type in seeding.SEEDING_STRATEGIES:
+            benchmark_options = {
+                "seeding_type": seeding_type,
+                "min_entries_per_heat": 3,
+                "num_circle_seeded_heats": "All full heats",
+            }
+
+            total_seconds = timeit.timeit(
+                lambda: python_seeding(seed_times, lanes_per_heat, benchmark_options),
+                number=runs,
+            )
+            self.stdout.write(
+                f"{seeding_type} (python): {len(seed_times)} entries, "
+                f"{total_seconds / runs * 1000:.2f} ms per event"
+            )
+
+            # ~ compute_event_seeding only vectorizes large events with NumPy installed
+            if (
+                seeding.np is not None
+                and seeding_type in seeding.VECTORIZED_SEEDING_STRATEGIES
+                and len(seed_times) >= seeding.VECTORIZED_SEEDING_MIN_ENTRIES
+            ):
+                total_seconds = timeit.timeit(
+                    lambda: seeding.compute_event_seeding(
+                        seed_times, lanes_per_heat, benchmark_options
+                    ),
+                    number=runs,
+                )
+                self.stdout.write(
+                    f"{seeding_type} (numpy): {len(seed_times)} entries, "
+                    f"{total_seconds / runs * 1000:.2f} ms per event"
+                )
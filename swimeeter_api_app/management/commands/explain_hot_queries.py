@@ -0,0 +1,87 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from ...models import Meet, Session, Event, Swimmer, Individual_entry, Relay_entry
+
+# ~ query shapes used by the views and get_seeding_data -> expected index
+HOT_QUERIES = [
+    (
+        "individual entries of heat",
+        lambda: Individual_entry.objects.filter(event_id=1, heat_number=1).order_by(
+            "lane_number"
+        ),
+        "ind_entry_event_heat_idx",
+    ),
+    (
+        "individual entries by seed time",
+        lambda: Individual_entry.objects.filter(event_id=1).order_by("seed_time"),
+        "ind_entry_event_seed_idx",
+    ),
+    (
+        "relay entries of heat",
+        lambda: Relay_entry.objects.filter(event_id=1, heat_number=1).order_by(
+            "lane_number"
+        ),
+        "relay_entry_event_heat_idx",
+    ),
+    (
+        "relay entries by seed time",
+        lambda: Relay_entry.objects.filter(event_id=1).order_by("seed_time"),
+        "relay_entry_event_seed_idx",
+    ),
+    (
+        "events of session",
+        lambda: Event.objects.filter(session_id=1).order_by("order_in_session"),
+        "event_session_order_idx",
+    ),
+    (
+        "sessions of meet",
+        lambda: Session.objects.filter(meet_id=1).order_by(
+            "begin_time", "end_time", "name"
+        ),
+        "session_meet_begin_idx",
+    ),
+    (
+        "swimmers of meet",
+        lambda: Swimmer.objects.filter(meet_id=1).order_by("last_name", "first_name"),
+        "swimmer_meet_name_idx",
+    ),
+    (
+        "public meets",
+        lambda: Meet.objects.filter(is_public=True).order_by(
+            "-begin_time", "-end_time", "name"
+        ),
+        "meet_public_begin_idx",
+    ),
+]
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN the hot query shapes and check that each uses its composite index"
+
+    def handle(self, *args, **options):
+        # ? index names in plans are only checked on Postgres
+        if connection.vendor != "postgresql":
+            raise CommandError("explain_hot_queries requires a PostgreSQL database")
+
+        missing_indexes = []
+        with transaction.atomic():
+            # ! small seeded fixtures would otherwise be planned as sequential scans
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+            for query_name, get_query_set, index_name in HOT_QUERIES:
+                query_plan = get_query_set().explain()
+                if index_name in query_plan:
+                    self.stdout.write(f"ok: {query_name} -> {index_name}")
+                else:
+                    missing_indexes.append(query_name)
+                    self.stdout.write(
+                        f"missing: {query_name} -> {index_name}\n{query_plan}"
+                    )
+
+        # ? some hot query is not served by its index
+        if len(missing_indexes) > 0:
+            raise CommandError(
+                f"{len(missing_indexes)} hot queries did not use their index"
+            )
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.2 on 2026-10-18 15:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('swimeeter_api_app', '0004_alter_session_pool_alter_swimmer_team'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(
+                fields=['session', 'order_in_session'], name='event_session_order_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='individual_entry',
+            index=models.Index(
+                fields=['event', 'heat_number', 'lane_number'],
+                name='ind_entry_event_heat_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='individual_entry',
+            index=models.Index(
+                fields=['event', 'seed_time'], name='ind_entry_event_seed_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='meet',
+            index=models.Index(
+                fields=['is_public', '-begin_time', '-end_time', 'name'],
+                name='meet_public_begin_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='relay_entry',
+            index=models.Index(
+                fields=['event', 'heat_number', 'lane_number'],
+                name='relay_entry_event_heat_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='relay_entry',
+            index=models.Index(
+                fields=['event', 'seed_time'], name='relay_entry_event_seed_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(
+                fields=['meet', 'begin_time', 'end_time', 'name'],
+                name='session_meet_begin_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='swimmer',
+            index=models.Index(
+                fields=['meet', 'last_name', 'first_name'], name='swimmer_meet_name_idx'
+            ),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.2 on 2026-10-18 15:40
+
+from django.db import migrations, models
+import django.db.models.functions.text
+import swimeeter_api_app.indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('swimeeter_api_app', '0005_composite_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='meet',
+            index=models.Index(
+                swimeeter_api_app.indexes.Portable_op_class(
+                    django.db.models.functions.text.Upper('name'),
+                    name='text_pattern_ops',
+                ),
+                name='meet_name_upper_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='swimmer',
+            index=models.Index(
+                models.F('meet'),
+                swimeeter_api_app.indexes.Portable_op_class(
+                    django.db.models.functions.text.Upper('first_name'),
+                    name='text_pattern_ops',
+                ),
+                name='swimmer_meet_first_upper_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='swimmer',
+            index=models.Index(
+                models.F('meet'),
+                swimeeter_api_app.indexes.Portable_op_class(
+                    django.db.models.functions.text.Upper('last_name'),
+                    name='text_pattern_ops',
+                ),
+                name='swimmer_meet_last_upper_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(
+                models.F('meet'),
+                swimeeter_api_app.indexes.Portable_op_class(
+                    django.db.models.functions.text.Upper('name'),
+                    name='text_pattern_ops',
+                ),
+                name='team_meet_name_upper_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(
+                models.F('meet'),
+                swimeeter_api_app.indexes.Portable_op_class(
+                    django.db.models.functions.text.Upper('acronym'),
+                    name='text_pattern_ops',
+                ),
+                name='team_meet_acronym_upper_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 4.2.2 on 2026-10-18 18:02
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def backfill_meets(apps, schema_editor):
+    Session = apps.get_model('swimeeter_api_app', 'Session')
+    Event = apps.get_model('swimeeter_api_app', 'Event')
+    Individual_entry = apps.get_model('swimeeter_api_app', 'Individual_entry')
+    Relay_entry = apps.get_model('swimeeter_api_app', 'Relay_entry')
+    Relay_assignment = apps.get_model('swimeeter_api_app', 'Relay_assignment')
+
+    # * one set-based update per table -> parents before children
+    Event.objects.update(
+        meet_id=Subquery(
+            Session.objects.filter(id=OuterRef('session_id')).values('meet_id')
+        )
+    )
+    Individual_entry.objects.update(
+        meet_id=Subquery(
+            Event.objects.filter(id=OuterRef('event_id')).values('meet_id')
+        )
+    )
+    Relay_entry.objects.update(
+        meet_id=Subquery(
+            Event.objects.filter(id=OuterRef('event_id')).values('meet_id')
+        )
+    )
+    Relay_assignment.objects.update(
+        meet_id=Subquery(
+            Relay_entry.objects.filter(id=OuterRef('relay_entry_id')).values('meet_id')
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('swimeeter_api_app', '0006_name_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='meet',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='events',
+                to='swimeeter_api_app.meet',
+            ),
+        ),
+        migrations.AddField(
+            model_name='individual_entry',
+            name='meet',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='individual_entries',
+                to='swimeeter_api_app.meet',
+            ),
+        ),
+        migrations.AddField(
+            model_name='relay_entry',
+            name='meet',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='relay_entries',
+                to='swimeeter_api_app.meet',
+            ),
+        ),
+        migrations.AddField(
+            model_name='relay_assignment',
+            name='meet',
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='relay_assignments',
+                to='swimeeter_api_app.meet',
+            ),
+        ),
+        migrations.RunPython(backfill_meets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.2 on 2026-10-18 18:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    # ~ separate from the backfill -> no pending trigger events when altering on postgres
+    dependencies = [
+        ('swimeeter_api_app', '0007_denormalized_meet'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='event',
+            name='meet',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='events',
+                to='swimeeter_api_app.meet',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='individual_entry',
+            name='meet',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='individual_entries',
+                to='swimeeter_api_app.meet',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='relay_entry',
+            name='meet',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='relay_entries',
+                to='swimeeter_api_app.meet',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='relay_assignment',
+            name='meet',
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='relay_assignments',
+                to='swimeeter_api_app.meet',
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.2 on 2026-10-18 16:07
+
+from django.db import migrations, models
+import swimeeter_api_app.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('swimeeter_api_app', '0008_alter_denormalized_meet'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meet',
+            name='version',
+            field=models.PositiveBigIntegerField(
+                default=swimeeter_api_app.models.get_initial_meet_version,
+                editable=False,
+                serialize=False,
+            ),
+        ),
+    ]
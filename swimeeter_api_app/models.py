@@ -1,8 +1,25 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.core import validators
 from . import validators as v
+from .indexes import Portable_op_class
 from swimeeter_auth_app.models import Host
 
+import time
+
+
+def get_initial_meet_version():
+    # ! start from a timestamp -> a reused meet id never matches an old meet's version
+    return time.time_ns()
+
+
+def derive_meet(model_object, parent_name, save_kwargs):
+    # ! denormalized meet is copied from the parent on every save that writes it
+    #   ~ bulk_create and bulk_update skip save() -> callers copy parent.meet_id
+    update_fields = save_kwargs.get("update_fields")
+    if update_fields is None or "meet" in update_fields or "meet_id" in update_fields:
+        model_object.meet_id = getattr(model_object, parent_name).meet_id
+
 
 class Meet(models.Model):
     # * meet info fields
@@ -16,7 +33,44 @@ class Meet(models.Model):
     # * association fields
     host = models.ForeignKey(Host, on_delete=models.CASCADE, related_name="meets")
 
+    # * caching fields
+    version = models.PositiveBigIntegerField(
+        default=get_initial_meet_version, editable=False, serialize=False
+    )  # handled programmatically -> caching.bump_meet_version
+
     # via association: swimmers, sessions, pools
+    # via denormalized association: events, individual_entries, relay_entries,
+    #     relay_assignments
+
+    class Meta:
+        indexes = [
+            # ~ public meets listing -> filter(is_public).order_by(-begin_time, ...)
+            models.Index(
+                fields=["is_public", "-begin_time", "-end_time", "name"],
+                name="meet_public_begin_idx",
+            ),
+            # ~ name search -> UPPER(name) LIKE 'PREFIX%'
+            models.Index(
+                Portable_op_class(Upper("name"), name="text_pattern_ops"),
+                name="meet_name_upper_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # ! version only changes through bump_meet_version's F() update
+        #   -> saving a loaded meet must not write its stale version back
+        if (
+            not self._state.adding
+            and not kwargs.get("force_insert")
+            and kwargs.get("update_fields") is None
+        ):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "version"
+            ]
+
+        super().save(*args, **kwargs)
 
 
 class Pool(models.Model):
@@ -86,6 +140,15 @@ class Session(models.Model):
 
     # via association: events
 
+    class Meta:
+        indexes = [
+            # ~ sessions of meet -> filter(meet).order_by(begin_time, end_time, name)
+            models.Index(
+                fields=["meet", "begin_time", "end_time", "name"],
+                name="session_meet_begin_idx",
+            ),
+        ]
+
 
 class Event(models.Model):
     # * competition info fields
@@ -115,8 +178,24 @@ class Event(models.Model):
         Session, on_delete=models.CASCADE, related_name="events"
     )
 
+    # ! denormalized -> always equal to session.meet, see derive_meet
+    meet = models.ForeignKey(Meet, on_delete=models.CASCADE, related_name="events")
+
     # via association: individual_entries, relay_entries
 
+    class Meta:
+        indexes = [
+            # ~ events of session -> filter(session).order_by(order_in_session)
+            models.Index(
+                fields=["session", "order_in_session"],
+                name="event_session_order_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        derive_meet(self, "session", kwargs)
+        super().save(*args, **kwargs)
+
 
 class Team(models.Model):
     # * team info fields
@@ -136,6 +215,21 @@ class Team(models.Model):
 
     # via association: swimmers
 
+    class Meta:
+        indexes = [
+            # ~ name search within meet -> meet_id = ? AND UPPER(name) LIKE 'PREFIX%'
+            models.Index(
+                "meet",
+                Portable_op_class(Upper("name"), name="text_pattern_ops"),
+                name="team_meet_name_upper_idx",
+            ),
+            models.Index(
+                "meet",
+                Portable_op_class(Upper("acronym"), name="text_pattern_ops"),
+                name="team_meet_acronym_upper_idx",
+            ),
+        ]
+
 
 class Swimmer(models.Model):
     # * standard name fields
@@ -169,6 +263,26 @@ class Swimmer(models.Model):
 
     # via association: individual_entries, relay_entries, relay_assignments
 
+    class Meta:
+        indexes = [
+            # ~ swimmers of meet -> filter(meet).order_by(last_name, first_name, ...)
+            models.Index(
+                fields=["meet", "last_name", "first_name"],
+                name="swimmer_meet_name_idx",
+            ),
+            # ~ name search within meet -> meet_id = ? AND UPPER(name) LIKE 'PREFIX%'
+            models.Index(
+                "meet",
+                Portable_op_class(Upper("first_name"), name="text_pattern_ops"),
+                name="swimmer_meet_first_upper_idx",
+            ),
+            models.Index(
+                "meet",
+                Portable_op_class(Upper("last_name"), name="text_pattern_ops"),
+                name="swimmer_meet_last_upper_idx",
+            ),
+        ]
+
 
 class Individual_entry(models.Model):
     # * entry info fields
@@ -190,6 +304,29 @@ class Individual_entry(models.Model):
         Event, on_delete=models.CASCADE, related_name="individual_entries"
     )
 
+    # ! denormalized -> always equal to event.meet, see derive_meet
+    meet = models.ForeignKey(
+        Meet, on_delete=models.CASCADE, related_name="individual_entries"
+    )
+
+    class Meta:
+        indexes = [
+            # ~ heat sheets -> filter(event, heat_number).order_by(lane_number)
+            models.Index(
+                fields=["event", "heat_number", "lane_number"],
+                name="ind_entry_event_heat_idx",
+            ),
+            # ~ seeding -> filter(event).order_by(seed_time)
+            models.Index(
+                fields=["event", "seed_time"],
+                name="ind_entry_event_seed_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        derive_meet(self, "event", kwargs)
+        super().save(*args, **kwargs)
+
 
 class Relay_entry(models.Model):
     # * entry info fields
@@ -216,8 +353,31 @@ class Relay_entry(models.Model):
         Event, on_delete=models.CASCADE, related_name="relay_entries"
     )
 
+    # ! denormalized -> always equal to event.meet, see derive_meet
+    meet = models.ForeignKey(
+        Meet, on_delete=models.CASCADE, related_name="relay_entries"
+    )
+
     # via association: relay_assignments
 
+    class Meta:
+        indexes = [
+            # ~ heat sheets -> filter(event, heat_number).order_by(lane_number)
+            models.Index(
+                fields=["event", "heat_number", "lane_number"],
+                name="relay_entry_event_heat_idx",
+            ),
+            # ~ seeding -> filter(event).order_by(seed_time)
+            models.Index(
+                fields=["event", "seed_time"],
+                name="relay_entry_event_seed_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        derive_meet(self, "event", kwargs)
+        super().save(*args, **kwargs)
+
 
 # @ through table for swimmer <-> relay_entry many-to-many relationship
 class Relay_assignment(models.Model):
@@ -236,3 +396,12 @@ class Relay_assignment(models.Model):
     relay_entry = models.ForeignKey(
         Relay_entry, on_delete=models.CASCADE, related_name="relay_assignments"
     )
+
+    # ! denormalized -> always equal to relay_entry.meet, see derive_meet
+    meet = models.ForeignKey(
+        Meet, on_delete=models.CASCADE, related_name="relay_assignments"
+    )
+
+    def save(self, *args, **kwargs):
+        derive_meet(self, "relay_entry", kwargs)
+        super().save(*args, **kwargs)
@@ -0,0 +1,39 @@
+from rest_framework.renderers import JSONRenderer, BrowsableAPIRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ! orjson encodes datetimes natively -> OPT_UTC_Z matches DRF's "Z" suffix for UTC
+ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else None
+
+
+class Fast_JSON_renderer(JSONRenderer):
+    # ~ drop-in replacement for DRF's JSONRenderer
+    #   $ orjson installed: encodes straight to bytes
+    #   $ orjson missing or indented output requested: stdlib json through DRF
+    fallback_encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        if orjson is None or self.get_indent(
+            accepted_media_type, renderer_context or {}
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        rendered = orjson.dumps(
+            data, default=self.fallback_encoder.default, option=ORJSON_OPTIONS
+        )
+
+        # ! same escaping as DRF -> keeps the output safe to embed in <script> tags
+        return rendered.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+
+# ~ renderers used by every api/v1 view -> swap entries here to change encoding
+API_RENDERER_CLASSES = [Fast_JSON_renderer, BrowsableAPIRenderer]
@@ -0,0 +1,236 @@
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ! pure heat sheet seeding core -> no database or framework access
+
+# ~ seeding strategies:
+#   $ signature: (heat_entry_counts, lane_order, options) -> (heat_numbers, lane_numbers)
+#   $ output arrays are indexed like the seed-time-ordered entries (fastest first)
+SEEDING_STRATEGIES = {}
+
+# ~ vectorized seeding strategies:
+#   $ same signature, but lane_order is a NumPy array and NumPy arrays are returned
+#   ! only used when NumPy is installed and the event is large enough to benefit
+VECTORIZED_SEEDING_STRATEGIES = {}
+VECTORIZED_SEEDING_MIN_ENTRIES = 1000
+
+
+def register_seeding_strategy(seeding_type):
+    def register(strategy):
+        SEEDING_STRATEGIES[seeding_type] = strategy
+        return strategy
+
+    return register
+
+
+def register_vectorized_seeding_strategy(seeding_type):
+    def register(strategy):
+        VECTORIZED_SEEDING_STRATEGIES[seeding_type] = strategy
+        return strategy
+
+    return register
+
+
+def get_heat_entry_counts(total_entries, lanes_per_heat, min_entries_per_heat):
+    heat_entry_counts = []
+
+    for i in range(total_entries // lanes_per_heat):
+        heat_entry_counts.append(lanes_per_heat)
+
+    first_heat_leftover = total_entries % lanes_per_heat
+    if first_heat_leftover != 0:
+        heat_entry_counts.insert(0, first_heat_leftover)
+
+    # ~ deal with minimum entries needed per heat
+    for i in range(1, len(heat_entry_counts)):
+        # * first heat already meets min requirement
+        needed_entries = min_entries_per_heat - heat_entry_counts[0]
+        if needed_entries <= 0:
+            break
+
+        # * no entries are available to carry over -> fail to meet min requirement
+        available_entries = heat_entry_counts[i] - min_entries_per_heat
+        if available_entries == 0:
+            break
+
+        # * enough entries available to meet min requirement
+        if needed_entries <= available_entries:
+            heat_entry_counts[0] += needed_entries
+            heat_entry_counts[i] -= needed_entries
+            break
+
+        # * not enough entries available, but at least some
+        heat_entry_counts[0] += available_entries
+        heat_entry_counts[i] -= available_entries
+
+    return heat_entry_counts
+
+
+def get_standard_lane_order(lanes_per_heat):
+    # * center lane first, then alternating outward
+    standard_lane_order = []
+    current = math.ceil(lanes_per_heat / 2)
+    change = 1
+    while current >= 1 and current <= lanes_per_heat:
+        standard_lane_order.append(current)
+        current += change
+        change = -1 * (change + 1 if change > 0 else change - 1)
+
+    return standard_lane_order
+
+
+@register_seeding_strategy("standard")
+def standard_seeding(heat_entry_counts, lane_order, options):
+    heat_numbers = []
+    lane_numbers = []
+
+    # * standard seed all heats
+    for heat_index in range(len(heat_entry_counts) - 1, -1, -1):
+        for lane_index in range(heat_entry_counts[heat_index]):
+            heat_numbers.append(heat_index + 1)
+            lane_numbers.append(lane_order[lane_index])
+
+    return heat_numbers, lane_numbers
+
+
+def get_circle_seeded_heats_count(heat_entry_counts, options):
+    max_heat_entry_count = max(heat_entry_counts)
+
+    can_circle_seed_heats = 0
+    for i in range(len(heat_entry_counts) - 1, -1, -1):
+        if heat_entry_counts[i] == max_heat_entry_count:
+            can_circle_seed_heats += 1
+
+    requested_circled_seeded_heats = options["num_circle_seeded_heats"]
+    if requested_circled_seeded_heats == "All full heats":
+        requested_circled_seeded_heats = can_circle_seed_heats
+    else:
+        requested_circled_seeded_heats = int(requested_circled_seeded_heats)
+
+    return max(0, min(can_circle_seed_heats, requested_circled_seeded_heats))
+
+
+@register_seeding_strategy("circle")
+def circle_seeding(heat_entry_counts, lane_order, options):
+    heat_numbers = []
+    lane_numbers = []
+
+    # ~ no entries to seed
+    if len(heat_entry_counts) == 0:
+        return heat_numbers, lane_numbers
+
+    # * determine heats that will be circle seeded
+    max_heat_entry_count = max(heat_entry_counts)
+    will_circle_seed_heats = get_circle_seeded_heats_count(heat_entry_counts, options)
+
+    # * circle seed ending heats
+    for lane_index in range(0, max_heat_entry_count):
+        for heat_index in range(
+            len(heat_entry_counts) - 1,
+            len(heat_entry_counts) - will_circle_seed_heats - 1,
+            -1,
+        ):
+            heat_numbers.append(heat_index + 1)
+            lane_numbers.append(lane_order[lane_index])
+
+    # * standard seed beginning heats
+    for heat_index in range(len(heat_entry_counts) - will_circle_seed_heats - 1, -1, -1):
+        for lane_index in range(heat_entry_counts[heat_index]):
+            heat_numbers.append(heat_index + 1)
+            lane_numbers.append(lane_order[lane_index])
+
+    return heat_numbers, lane_numbers
+
+
+def standard_seed_heats_vectorized(heat_entry_counts, lane_order):
+    # * heats are filled from the last heat backward, lanes in lane_order
+    counts_of_filled_heats = np.asarray(heat_entry_counts[::-1], dtype=np.int64)
+    heat_numbers = np.repeat(
+        np.arange(len(heat_entry_counts), 0, -1, dtype=np.int64),
+        counts_of_filled_heats,
+    )
+
+    # * position of each entry inside its heat
+    heat_offsets = np.cumsum(counts_of_filled_heats) - counts_of_filled_heats
+    lane_indices = np.arange(len(heat_numbers), dtype=np.int64) - np.repeat(
+        heat_offsets, counts_of_filled_heats
+    )
+
+    return heat_numbers, lane_order[lane_indices]
+
+
+@register_vectorized_seeding_strategy("standard")
+def standard_seeding_vectorized(heat_entry_counts, lane_order, options):
+    return standard_seed_heats_vectorized(heat_entry_counts, lane_order)
+
+
+@register_vectorized_seeding_strategy("circle")
+def circle_seeding_vectorized(heat_entry_counts, lane_order, options):
+    # ~ no entries to seed
+    if len(heat_entry_counts) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+
+    # * determine heats that will be circle seeded
+    max_heat_entry_count = max(heat_entry_counts)
+    will_circle_seed_heats = get_circle_seeded_heats_count(heat_entry_counts, options)
+    total_heats = len(heat_entry_counts)
+
+    # * circle seed ending heats -> each lane is spread across the circled heats
+    circle_heat_numbers = np.tile(
+        np.arange(total_heats, total_heats - will_circle_seed_heats, -1, dtype=np.int64),
+        max_heat_entry_count,
+    )
+    circle_lane_numbers = np.repeat(
+        lane_order[:max_heat_entry_count], will_circle_seed_heats
+    )
+
+    # * standard seed beginning heats
+    standard_heat_numbers, standard_lane_numbers = standard_seed_heats_vectorized(
+        heat_entry_counts[: total_heats - will_circle_seed_heats], lane_order
+    )
+
+    return (
+        np.concatenate((circle_heat_numbers, standard_heat_numbers)),
+        np.concatenate((circle_lane_numbers, standard_lane_numbers)),
+    )
+
+
+def compute_event_seeding(seed_times, lanes_per_heat, options):
+    # ~ options:
+    #   $ min_entries_per_heat: number
+    #   $ seeding_type: any registered strategy, e.g. "standard" | "circle"
+    #   ! (circle seeding only) num_circle_seeded_heats: number | "All full heats"
+
+    # ! seed_times must already be sorted fastest first
+    strategy = SEEDING_STRATEGIES.get(options["seeding_type"])
+    # ? invalid seeding type
+    if strategy is None:
+        raise ValueError("invalid seeding type")
+
+    heat_entry_counts = get_heat_entry_counts(
+        len(seed_times), lanes_per_heat, options["min_entries_per_heat"]
+    )
+    lane_order = get_standard_lane_order(lanes_per_heat)
+
+    # $ use the NumPy path for very large events when available
+    vectorized_strategy = VECTORIZED_SEEDING_STRATEGIES.get(options["seeding_type"])
+    if (
+        np is not None
+        and vectorized_strategy is not None
+        and len(seed_times) >= VECTORIZED_SEEDING_MIN_ENTRIES
+    ):
+        heat_numbers, lane_numbers = vectorized_strategy(
+            heat_entry_counts, np.asarray(lane_order, dtype=np.int64), options
+        )
+
+        # ! convert back to Python ints -> database adapters reject NumPy scalars
+        return heat_numbers.tolist(), lane_numbers.tolist(), len(heat_entry_counts)
+
+    heat_numbers, lane_numbers = strategy(heat_entry_counts, lane_order, options)
+
+    return heat_numbers, lane_numbers, len(heat_entry_counts)
@@ -1,3 +1,1645 @@
-from django.test import TestCase
+from django.core.serializers import serialize
+from django.db import connection, transaction
+from django.db.models import F
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from unittest import mock, skipUnless
+import base64
+import json
+import math
+import random
+
+from .api_views.Swimmer_view import Swimmer_view
+from .models import (
+    Meet,
+    Pool,
+    Session,
+    Event,
+    Team,
+    Swimmer,
+    Individual_entry,
+    Relay_entry,
+    Relay_assignment,
+)
+from swimeeter_auth_app.models import Host
+from . import caching
+from . import seeding
+from . import view_helpers as vh
+from .management.commands.explain_hot_queries import HOT_QUERIES
+
+SEEDING_OPTIONS = {
+    "seeding_type": "standard",
+    "min_entries_per_heat": 3,
+    "num_circle_seeded_heats": 0,
+}
+
+
+def create_host(username="host@swimeeter.local"):
+    return Host.objects.create(
+        username=username,
+        email=username,
+        first_name="Test",
+        last_name="Host",
+        screen_mode="system",
+        data_entry_information=False,
+        destructive_action_confirms=False,
+        motion_safe=False,
+    )
+
+
+def get_letters(number):
+    # ~ names only allow letters -> spell each digit as one
+    return "".join("ABCDEFGHIJ"[int(digit)] for digit in str(number))
+
+
+def create_seeded_meet(host, total_sessions, total_events, total_swimmers):
+    # ~ each session holds total_events individual events and one relay event
+    now = timezone.now()
+    meet = Meet.objects.create(
+        name="Test Meet", is_public=True, host=host, begin_time=now, end_time=now
+    )
+    pool = Pool.objects.create(
+        name="Test Pool", lanes=8, side_length=25, measure_unit="Meters", meet=meet
+    )
+    team = Team.objects.create(name="Test Team", acronym="TT", meet=meet)
+    swimmers = Swimmer.objects.bulk_create(
+        [
+            Swimmer(
+                first_name="First",
+                last_name=get_letters(i),
+                age=15,
+                gender="Woman",
+                meet=meet,
+                team=team,
+            )
+            for i in range(total_swimmers)
+        ]
+    )
+
+    for session_index in range(total_sessions):
+        session = Session.objects.create(
+            name=f"Session {session_index}",
+            begin_time=now,
+            end_time=now,
+            meet=meet,
+            pool=pool,
+        )
+
+        for event_index in range(total_events + 1):
+            is_relay = event_index == total_events
+            event = Event.objects.create(
+                stroke="Freestyle",
+                # ~ distinct distances -> no two events of the meet are duplicates
+                distance=25 * (session_index * (total_events + 1) + event_index + 1),
+                is_relay=is_relay,
+                swimmers_per_entry=4 if is_relay else 1,
+                stage="Prelim",
+                competing_gender="Women",
+                order_in_session=event_index + 1,
+                session=session,
+                meet=meet,
+            )
+
+            if is_relay:
+                for relay_index in range(total_swimmers // 4):
+                    relay_entry = Relay_entry.objects.create(
+                        seed_time=30000 + relay_index, event=event, meet=meet
+                    )
+                    Relay_assignment.objects.bulk_create(
+                        [
+                            Relay_assignment(
+                                order_in_relay=leg_index + 1,
+                                seed_relay_split=7500,
+                                swimmer=swimmers[relay_index * 4 + leg_index],
+                                relay_entry=relay_entry,
+                                meet=meet,
+                            )
+                            for leg_index in range(4)
+                        ]
+                    )
+            else:
+                Individual_entry.objects.bulk_create(
+                    [
+                        Individual_entry(
+                            seed_time=6000 + i, swimmer=swimmer, event=event, meet=meet
+                        )
+                        for i, swimmer in enumerate(swimmers)
+                    ]
+                )
+
+    vh.generate_events_seeding(
+        SEEDING_OPTIONS,
+        Event.objects.filter(meet_id=meet.pk).select_related("session__pool"),
+    )
+
+    return Meet.objects.get(id=meet.pk)
+
+
+# ~ pre-batching get_JSON_multiple: serialize("json") then one lookup per expanded FK
+BASELINE_JSON_FIELDS = {
+    "Host": ["first_name", "last_name", "prefix", "suffix", "middle_initials"],
+    "Meet": ["name", "begin_time", "end_time", "is_public", "host"],
+    "Pool": [
+        "name",
+        "street_address",
+        "city",
+        "state",
+        "country",
+        "zipcode",
+        "lanes",
+        "side_length",
+        "measure_unit",
+        "meet",
+    ],
+    "Session": ["name", "begin_time", "end_time", "meet", "pool"],
+    "Event": [
+        "stroke",
+        "distance",
+        "is_relay",
+        "swimmers_per_entry",
+        "stage",
+        "competing_gender",
+        "competing_max_age",
+        "competing_min_age",
+        "order_in_session",
+        "total_heats",
+        "session",
+    ],
+    "Team": ["name", "acronym", "meet"],
+    "Swimmer": [
+        "first_name",
+        "last_name",
+        "prefix",
+        "suffix",
+        "middle_initials",
+        "age",
+        "gender",
+        "meet",
+        "team",
+    ],
+    "Individual_entry": ["seed_time", "heat_number", "lane_number", "swimmer", "event"],
+    "Relay_entry": [
+        "seed_time",
+        "heat_number",
+        "lane_number",
+        "relay_assignments",
+        "event",
+    ],
+    "Relay_assignment": [
+        "order_in_relay",
+        "seed_relay_split",
+        "swimmer",
+        "relay_entry",
+    ],
+}
+
+BASELINE_INNER_JSON = {
+    "Host": {},
+    "Meet": {"host": ("Host", False)},
+    "Pool": {"meet": ("Meet", False)},
+    "Session": {"meet": ("Meet", False), "pool": ("Pool", False)},
+    "Event": {"session": ("Session", True)},
+    "Team": {"meet": ("Meet", False)},
+    "Swimmer": {"meet": ("Meet", False), "team": ("Team", False)},
+    "Individual_entry": {"swimmer": ("Swimmer", True), "event": ("Event", False)},
+    "Relay_entry": {
+        "relay_assignments": ("Relay_assignment", True),
+        "event": ("Event", False),
+    },
+    "Relay_assignment": {"swimmer": ("Swimmer", True)},
+}
+
+
+def get_baseline_JSON(model_type, model_object, get_inner_JSON):
+    model_JSON = json.loads(
+        serialize("json", [model_object], fields=BASELINE_JSON_FIELDS[model_type])
+    )[0]
+
+    if get_inner_JSON:
+        for field_name, (inner_type, get_inner_inner_JSON) in BASELINE_INNER_JSON[
+            model_type
+        ].items():
+            inner_value = getattr(model_object, field_name)
+
+            # $ reverse relation -> list of every related model
+            if inner_type == "Relay_assignment":
+                model_JSON["fields"][field_name] = [
+                    get_baseline_JSON(inner_type, inner_object, get_inner_inner_JSON)
+                    for inner_object in inner_value.order_by("id")
+                ]
+            else:
+                model_JSON["fields"][field_name] = get_baseline_JSON(
+                    inner_type, inner_value, get_inner_inner_JSON
+                )
+
+    return model_JSON
+
+
+class JSON_serialization_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 1, 2, 8)
+
+        # * cover null and non-null values of every nullable field
+        Meet.objects.filter(pk=cls.meet.pk).update(end_time=None)
+        event = Event.objects.filter(meet=cls.meet, is_relay=False).first()
+        event.competing_max_age = 18
+        event.save()
+        Individual_entry.objects.filter(event=event).update(
+            heat_number=None, lane_number=None
+        )
+        Swimmer.objects.filter(meet=cls.meet).update(prefix="Dr", middle_initials="Q")
+        Pool.objects.filter(meet=cls.meet).update(city="Town", zipcode="01234")
+
+    def assert_JSON_matches_baseline(self, get_inner_JSON):
+        model_objects_of_type = {
+            "Host": Host.objects.filter(pk=self.host.pk),
+            "Meet": Meet.objects.filter(pk=self.meet.pk),
+        }
+        for model_type in list(BASELINE_JSON_FIELDS)[2:]:
+            model_objects_of_type[model_type] = vh.MODEL_CLASSES[
+                model_type
+            ].objects.filter(meet=self.meet)
+
+        for model_type, query_set in model_objects_of_type.items():
+            model_objects = list(query_set.order_by("id"))
+            self.assertGreater(len(model_objects), 0)
+
+            with self.subTest(model_type=model_type):
+                self.assertEqual(
+                    vh.get_JSON_multiple(model_type, model_objects, get_inner_JSON),
+                    [
+                        get_baseline_JSON(model_type, model_object, get_inner_JSON)
+                        for model_object in model_objects
+                    ],
+                )
+
+    def test_flat_JSON_matches_serialize(self):
+        self.assert_JSON_matches_baseline(False)
+
+    def test_inner_JSON_matches_per_model_expansion(self):
+        self.assert_JSON_matches_baseline(True)
+
+
+class Meet_heat_sheet_query_tests(TestCase):
+    # ! meet heat sheets are built from one bulk snapshot -> fixed query count
+    SNAPSHOT_QUERIES = 5
+
+    @classmethod
+    def setUpTestData(cls):
+        host = create_host()
+        cls.small_meet = create_seeded_meet(host, 1, 1, 8)
+        cls.large_meet = create_seeded_meet(host, 3, 4, 40)
+
+    def test_heat_sheet_query_count_is_independent_of_meet_size(self):
+        for meet in [self.small_meet, self.large_meet]:
+            for model_type in ["Overview", "Meet"]:
+                with self.subTest(meet=meet.pk, model_type=model_type):
+                    with self.assertNumQueries(self.SNAPSHOT_QUERIES):
+                        seeding_data = vh.get_seeding_data(model_type, meet)
+
+                    # * every event of the meet is seeded into heats
+                    self.assertNotIsInstance(seeding_data, vh.Response)
+                    self.assertEqual(
+                        sum(
+                            len(session_data["events_data"])
+                            for session_data in seeding_data["sessions_data"]
+                        ),
+                        Event.objects.filter(meet_id=meet.pk).count(),
+                    )
+                    for session_data in seeding_data["sessions_data"]:
+                        for event_data in session_data["events_data"]:
+                            self.assertTrue(event_data["heats_data"])
+
+
+@skipUnless(
+    connection.vendor == "postgresql", "query plans are only checked on Postgres"
+)
+class Hot_query_index_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # * plan against real rows and statistics, not empty tables
+        host = create_host()
+        for _ in range(3):
+            create_seeded_meet(host, 2, 4, 40)
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def test_hot_queries_use_their_indexes(self):
+        with transaction.atomic():
+            # ! fixture tables fit in a few pages -> still planned as sequential scans
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+            for query_name, get_query_set, index_name in HOT_QUERIES:
+                with self.subTest(query_name):
+                    self.assertIn(index_name, get_query_set().explain())
+
+
+class Event_order_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 2, 3, 4)
+        cls.first_session, cls.second_session = Session.objects.filter(
+            meet_id=cls.meet.pk
+        ).order_by("id")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.host)
+
+    def get_orders(self, session):
+        return list(
+            Event.objects.filter(session_id=session.pk)
+            .order_by("order_in_session")
+            .values_list("id", "order_in_session")
+        )
+
+    def test_moving_an_event_keeps_both_sessions_contiguous(self):
+        moved_event = Event.objects.get(
+            session_id=self.first_session.pk, order_in_session=2
+        )
+
+        response = self.client.put(
+            f"/api/v1/events/?event_id={moved_event.pk}"
+            f"&session_id={self.second_session.pk}&duplicate_handling=keep_both",
+            {"order_in_session": 1},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        for session in [self.first_session, self.second_session]:
+            orders = [order for _, order in self.get_orders(session)]
+            self.assertEqual(orders, list(range(1, len(orders) + 1)))
+        self.assertEqual(self.get_orders(self.second_session)[0][0], moved_event.pk)
+
+    def test_rejected_move_leaves_order_numbers_unchanged(self):
+        moved_event = Event.objects.get(
+            session_id=self.first_session.pk, order_in_session=3
+        )
+        previous_orders = self.get_orders(self.first_session)
+
+        # ? order number 0 fails validation after the other events were shifted
+        response = self.client.put(
+            f"/api/v1/events/?event_id={moved_event.pk}&duplicate_handling=keep_both",
+            {"order_in_session": 0},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.get_orders(self.first_session), previous_orders)
+
+
+class Individual_entry_batch_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 1, 2, 8)
+        cls.unchanged_event, cls.changed_event = Event.objects.filter(
+            meet_id=cls.meet.pk, is_relay=False
+        ).order_by("order_in_session")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.host)
+
+    def test_only_events_with_changed_seed_times_are_invalidated(self):
+        unchanged_entry, changed_entry = [
+            Individual_entry.objects.filter(event_id=event.pk).first()
+            for event in [self.unchanged_event, self.changed_event]
+        ]
+
+        response = self.client.put(
+            "/api/v1/individual_entries/batch/",
+            [
+                {
+                    "individual_entry_id": unchanged_entry.pk,
+                    "seed_time": unchanged_entry.seed_time,
+                },
+                {
+                    "individual_entry_id": changed_entry.pk,
+                    "seed_time": changed_entry.seed_time + 100,
+                },
+            ],
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.unchanged_event.refresh_from_db()
+        self.changed_event.refresh_from_db()
+        self.assertIsNotNone(self.unchanged_event.total_heats)
+        self.assertIsNone(self.changed_event.total_heats)
+
+
+class Relay_entry_batch_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 1, 1, 8)
+        cls.relay_event = Event.objects.get(meet=cls.meet, is_relay=True)
+        cls.individual_event = Event.objects.get(meet=cls.meet, is_relay=False)
+
+        # * swimmers without a relay yet, one of them on another team
+        team = Team.objects.get(meet=cls.meet)
+        other_team = Team.objects.create(name="Other Team", acronym="OT", meet=cls.meet)
+        cls.free_swimmers = Swimmer.objects.bulk_create(
+            [
+                Swimmer(
+                    first_name="Free",
+                    last_name=get_letters(i),
+                    age=15,
+                    gender="Woman",
+                    meet=cls.meet,
+                    team=other_team if i == 8 else team,
+                )
+                for i in range(9)
+            ]
+        )
+        cls.other_team_swimmer = cls.free_swimmers.pop()
+        cls.other_meet_swimmer = Swimmer.objects.filter(
+            meet=create_seeded_meet(cls.host, 1, 1, 4)
+        ).first()
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.host)
+
+    def get_relay_item(self, swimmers, event=None, orders=(1, 2, 3, 4)):
+        return {
+            "event_id": (event or self.relay_event).pk,
+            "assignments": [
+                {
+                    "swimmer_id": swimmer.pk,
+                    "order_in_relay": order,
+                    "seed_relay_split": 7000 + order,
+                }
+                for swimmer, order in zip(swimmers, orders)
+            ],
+        }
+
+    def post_batch(self, batch_items, duplicate_handling="unhandled"):
+        return self.client.post(
+            f"/api/v1/relay_entries/batch/?duplicate_handling={duplicate_handling}",
+            batch_items,
+            format="json",
+        )
+
+    def test_assignments_are_linked_to_their_own_entries(self):
+        first_swimmers = self.free_swimmers[:4]
+        second_swimmers = self.free_swimmers[4:]
+
+        response = self.post_batch(
+            [
+                self.get_relay_item(first_swimmers, orders=(3, 1, 4, 2)),
+                self.get_relay_item(second_swimmers),
+            ]
+        )
+
+        self.assertEqual(response.status_code, 201)
+        for batch_result, swimmers, orders in zip(
+            response.data,
+            [first_swimmers, second_swimmers],
+            [(3, 1, 4, 2), (1, 2, 3, 4)],
+        ):
+            relay_entry = Relay_entry.objects.get(pk=batch_result["data"]["pk"])
+            self.assertEqual(relay_entry.seed_time, 4 * 7000 + 10)
+            self.assertEqual(
+                set(
+                    relay_entry.relay_assignments.values_list(
+                        "swimmer_id", "order_in_relay", "meet_id"
+                    )
+                ),
+                {
+                    (swimmer.pk, order, self.meet.pk)
+                    for swimmer, order in zip(swimmers, orders)
+                },
+            )
+            self.assertEqual(
+                {
+                    assignment_JSON["fields"]["swimmer"]["pk"]
+                    for assignment_JSON in batch_result["data"]["fields"][
+                        "relay_assignments"
+                    ]
+                },
+                {swimmer.pk for swimmer in swimmers},
+            )
+
+    def test_invalid_relays_are_reported_per_item(self):
+        swimmers = self.free_swimmers[:4]
+        missing_split_item = self.get_relay_item(swimmers)
+        del missing_split_item["assignments"][2]["seed_relay_split"]
+
+        invalid_items = [
+            (
+                self.get_relay_item(swimmers, event=self.individual_event),
+                "event is not a relay event",
+            ),
+            (
+                self.get_relay_item(swimmers[:3]),
+                "relay has incorrect number of swimmers",
+            ),
+            (
+                self.get_relay_item(swimmers, orders=(1, 1, 2, 3)),
+                "relay placements are incorrect",
+            ),
+            (missing_split_item, "relay splits are missing or not integers"),
+            (
+                self.get_relay_item(swimmers[:3] + [swimmers[0]]),
+                "duplicate swimmers exist inside relay",
+            ),
+            (
+                self.get_relay_item(swimmers[:3] + [self.other_team_swimmer]),
+                "swimmers of different teams exist inside relay",
+            ),
+        ]
+
+        response = self.post_batch([batch_item for batch_item, _ in invalid_items])
+
+        self.assertEqual(response.status_code, 400)
+        for batch_result, (_, message) in zip(response.data, invalid_items):
+            self.assertEqual(batch_result["status"], 400)
+            self.assertEqual(batch_result["data"], message)
+        self.assertEqual(Relay_entry.objects.filter(event=self.relay_event).count(), 2)
+
+    def test_swimmer_and_event_meets_must_match(self):
+        other_meet_event = Event.objects.get(
+            meet=self.other_meet_swimmer.meet, is_relay=True
+        )
+
+        response = self.post_batch(
+            [self.get_relay_item(self.free_swimmers[:4], event=other_meet_event)]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data[0]["data"], "swimmer and event meets do not match"
+        )
+
+    def test_swimmer_twice_in_one_batch_is_a_duplicate(self):
+        response = self.post_batch(
+            [
+                self.get_relay_item(self.free_swimmers[:4]),
+                self.get_relay_item(self.free_swimmers[3:7]),
+            ]
+        )
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.data[0]["status"], 201)
+        self.assertEqual(response.data[1]["status"], 400)
+        self.assertEqual(
+            response.data[1]["data"], "duplicate entries exist inside batch"
+        )
+
+    def test_existing_relays_follow_duplicate_handling(self):
+        original_entry = Relay_entry.objects.filter(event=self.relay_event).first()
+        original_swimmer = original_entry.relay_assignments.first().swimmer
+        batch_items = [self.get_relay_item(self.free_swimmers[:3] + [original_swimmer])]
+
+        response = self.post_batch(batch_items)
+        self.assertEqual(response.status_code, 409)
+
+        response = self.post_batch(batch_items, "keep_originals")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(Relay_entry.objects.filter(pk=original_entry.pk).exists())
+
+        response = self.post_batch(batch_items, "keep_new")
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(Relay_entry.objects.filter(pk=original_entry.pk).exists())
+        self.assertEqual(Relay_entry.objects.filter(event=self.relay_event).count(), 2)
+
+
+class Deferred_invalidation_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 2, 3, 8)
+        cls.swimmer = Swimmer.objects.filter(meet_id=cls.meet.pk).order_by("id")[0]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.host)
+
+    def get_update_queries(self, context, table_name):
+        return [
+            query
+            for query in context.captured_queries
+            if query["sql"].startswith(f'UPDATE "swimeeter_api_app_{table_name}"')
+        ]
+
+    def test_many_edits_clear_each_event_and_bump_the_meet_once(self):
+        entered_event_ids = set(
+            Individual_entry.objects.filter(swimmer_id=self.swimmer.pk).values_list(
+                "event_id", flat=True
+            )
+        ) | set(
+            Relay_entry.objects.filter(swimmers__in=[self.swimmer.pk]).values_list(
+                "event_id", flat=True
+            )
+        )
+        meet_version = caching.get_meet_version(self.meet.pk)
+
+        # * a gender change makes every entry of the swimmer incompatible
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.put(
+                f"/api/v1/swimmers/?swimmer_id={self.swimmer.pk}",
+                {"gender": "Man"},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.get_update_queries(context, "event")), 1)
+        self.assertEqual(len(self.get_update_queries(context, "meet")), 1)
+        self.assertEqual(caching.get_meet_version(self.meet.pk), meet_version + 1)
+        self.assertEqual(len(entered_event_ids), 8)
+        self.assertFalse(
+            Event.objects.filter(
+                id__in=entered_event_ids, total_heats__isnull=False
+            ).exists()
+        )
+
+    def test_failed_invalidation_rolls_back_the_write(self):
+        meet_version = caching.get_meet_version(self.meet.pk)
+        failed_invalidation = vh.Response("heat sheet invalidation failed", status=500)
+
+        with mock.patch.object(
+            vh, "clear_events_seeding", return_value=failed_invalidation
+        ):
+            response = self.client.put(
+                f"/api/v1/swimmers/?swimmer_id={self.swimmer.pk}",
+                {"gender": "Man"},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(Swimmer.objects.get(id=self.swimmer.pk).gender, "Woman")
+        self.assertTrue(Individual_entry.objects.filter(swimmer=self.swimmer).exists())
+        self.assertEqual(caching.get_meet_version(self.meet.pk), meet_version)
+
+    def test_swimmer_swap_invalidates_seeding_only_when_replacing_a_duplicate(self):
+        event = Event.objects.filter(meet_id=self.meet.pk, is_relay=False).first()
+        swapped_entry = Individual_entry.objects.get(
+            event_id=event.pk, swimmer_id=self.swimmer.pk
+        )
+        new_swimmer = Swimmer.objects.create(
+            first_name="New",
+            last_name="Swimmer",
+            age=15,
+            gender="Woman",
+            meet=self.meet,
+            team=self.swimmer.team,
+        )
+
+        # $ swap onto a swimmer without an entry -> heat and lane carry over
+        response = self.client.put(
+            f"/api/v1/individual_entries/?individual_entry_id={swapped_entry.pk}"
+            f"&swimmer_id={new_swimmer.pk}",
+            {},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        event.refresh_from_db()
+        self.assertIsNotNone(event.total_heats)
+        swapped_entry.refresh_from_db()
+        self.assertIsNotNone(swapped_entry.heat_number)
+
+        # $ swap onto a swimmer with an entry -> the replaced entry leaves its lane
+        entered_swimmer = Individual_entry.objects.get(
+            event_id=event.pk, heat_number=1, lane_number=5
+        ).swimmer
+        response = self.client.put(
+            f"/api/v1/individual_entries/?individual_entry_id={swapped_entry.pk}"
+            f"&swimmer_id={entered_swimmer.pk}&duplicate_handling=keep_new",
+            {},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        event.refresh_from_db()
+        self.assertIsNone(event.total_heats)
+
+
+class Identity_map_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 1, 2, 8)
+        cls.event = Event.objects.filter(meet_id=cls.meet.pk).order_by("id")[0]
+
+    def setUp(self):
+        identity_map_token = vh.open_identity_map()
+        self.addCleanup(vh.close_identity_map, identity_map_token)
+
+    def test_rows_are_fetched_once_per_request(self):
+        with self.assertNumQueries(1):
+            event = vh.get_model_of_id("Event", self.event.pk)
+            # ~ meet came along through select_related
+            meet = vh.get_model_of_id("Meet", self.meet.pk)
+
+        with self.assertNumQueries(0):
+            self.assertIs(vh.get_model_of_id("Event", self.event.pk), event)
+            self.assertIs(event.meet, meet)
+
+        identity_map = vh.get_identity_map()
+        self.assertEqual((identity_map["hits"], identity_map["misses"]), (2, 1))
+
+    def test_set_based_updates_are_read_again(self):
+        event = vh.get_model_of_id("Event", self.event.pk)
+        meet = vh.get_model_of_id("Meet", self.meet.pk)
+
+        vh.shift_events_order(self.event.session_id, 1)
+        vh.clear_events_seeding([Event.objects.get(id=self.event.pk)])
+        vh.bump_meet_version(self.meet.pk)
+
+        fresh_event = vh.get_model_of_id("Event", self.event.pk)
+        self.assertIsNot(fresh_event, event)
+        self.assertEqual(fresh_event.order_in_session, event.order_in_session + 1)
+        self.assertIsNone(fresh_event.total_heats)
+        self.assertEqual(
+            vh.get_model_of_id("Meet", self.meet.pk).version, meet.version + 1
+        )
+
+
+class Identity_map_request_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 1, 1, 8)
+        cls.swimmer = Swimmer.objects.filter(meet_id=cls.meet.pk).first()
+
+    def test_map_is_reset_after_a_failed_request(self):
+        with mock.patch.object(Swimmer_view, "get", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                APIClient().get("/api/v1/swimmers/?specific_to=id&swimmer_id=1")
+
+        self.assertIsNone(vh.get_identity_map())
+
+    @override_settings(DEBUG=True)
+    def test_debug_responses_report_hits_and_misses(self):
+        response = APIClient().get(
+            f"/api/v1/swimmers/?specific_to=id&swimmer_id={self.swimmer.pk}"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        # ~ swimmer and team of its JSON miss, its meet is a hit for every access step
+        self.assertEqual(response["X-Identity-Map"], "hits=3; misses=2")
+        self.assertIsNone(vh.get_identity_map())
+
+
+class Meet_export_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 2, 2, 8)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.host)
+
+    def test_export_streams_one_model_per_line(self):
+        response = self.client.get(f"/api/v1/meets/export/?meet_id={self.meet.pk}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            response["Content-Disposition"],
+            f'attachment; filename="meet_{self.meet.pk}.ndjson"',
+        )
+
+        lines = b"".join(response.streaming_content).split(b"\n")
+        self.assertEqual(lines.pop(), b"")
+        rows = [json.loads(line) for line in lines]
+
+        for row in rows:
+            self.assertEqual(set(row), {"model", "pk", "fields"})
+            self.assertNotIn("id", row["fields"])
+
+        # $ parents come before children, meet first
+        model_order = [
+            "swimeeter_api_app.meet",
+            "swimeeter_api_app.pool",
+            "swimeeter_api_app.session",
+            "swimeeter_api_app.event",
+            "swimeeter_api_app.team",
+            "swimeeter_api_app.swimmer",
+            "swimeeter_api_app.individual_entry",
+            "swimeeter_api_app.relay_entry",
+            "swimeeter_api_app.relay_assignment",
+        ]
+        row_models = [row["model"] for row in rows]
+        self.assertEqual(row_models, sorted(row_models, key=model_order.index))
+        self.assertEqual(rows[0]["pk"], self.meet.pk)
+        self.assertEqual(
+            row_models.count("swimeeter_api_app.event"),
+            Event.objects.filter(meet=self.meet).count(),
+        )
+        self.assertEqual(
+            row_models.count("swimeeter_api_app.individual_entry"),
+            Individual_entry.objects.filter(meet=self.meet).count(),
+        )
+
+    def test_export_reads_every_table_in_one_transaction(self):
+        export_lines = vh.iter_meet_export_lines(self.meet.pk)
+        atomic_depth = len(connection.atomic_blocks)
+
+        next(export_lines)
+        self.assertEqual(len(connection.atomic_blocks), atomic_depth + 1)
+
+        list(export_lines)
+        self.assertEqual(len(connection.atomic_blocks), atomic_depth)
+
+    def test_private_meet_export_needs_access(self):
+        Meet.objects.filter(pk=self.meet.pk).update(is_public=False)
+
+        response = APIClient().get(f"/api/v1/meets/export/?meet_id={self.meet.pk}")
+        self.assertIn(response.status_code, [401, 403])
+
+
+class Meet_import_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 2, 2, 8)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.host)
+
+    def get_export_rows(self):
+        response = self.client.get(f"/api/v1/meets/export/?meet_id={self.meet.pk}")
+        self.assertEqual(response.status_code, 200)
+        return [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+
+    def post_import(self, rows, duplicate_handling="keep_both"):
+        return self.client.post(
+            f"/api/v1/meets/import/?duplicate_handling={duplicate_handling}",
+            "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows),
+            content_type="application/x-ndjson",
+        )
+
+    def get_model_counts(self, meet_id):
+        return {
+            model_class.__name__: model_class.objects.filter(meet_id=meet_id).count()
+            for model_class in [
+                Pool,
+                Session,
+                Event,
+                Team,
+                Swimmer,
+                Individual_entry,
+                Relay_entry,
+                Relay_assignment,
+            ]
+        }
+
+    def get_orders(self, meet_id):
+        return [
+            list(
+                Event.objects.filter(session_id=session_id)
+                .order_by("order_in_session")
+                .values_list("order_in_session", flat=True)
+            )
+            for session_id in Session.objects.filter(meet_id=meet_id).values_list(
+                "id", flat=True
+            )
+        ]
+
+    def test_export_then_import_round_trips(self):
+        response = self.post_import(self.get_export_rows())
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["errors"], [])
+        self.assertEqual(response.data["duplicates"], [])
+        imported_meet_id = response.data["meet"]["pk"]
+        self.assertEqual(
+            self.get_model_counts(imported_meet_id), self.get_model_counts(self.meet.pk)
+        )
+        # * unchanged events keep the seeding of the file
+        self.assertFalse(
+            Event.objects.filter(
+                meet_id=imported_meet_id, total_heats__isnull=True
+            ).exists()
+        )
+        self.assertEqual(
+            sorted(
+                Relay_assignment.objects.filter(meet_id=imported_meet_id).values_list(
+                    "relay_entry__seed_time", "order_in_relay", "swimmer__last_name"
+                )
+            ),
+            sorted(
+                Relay_assignment.objects.filter(meet_id=self.meet.pk).values_list(
+                    "relay_entry__seed_time", "order_in_relay", "swimmer__last_name"
+                )
+            ),
+        )
+
+    def test_unreadable_and_misnumbered_rows_are_reported(self):
+        rows = self.get_export_rows()
+        swimmer_row = next(
+            row for row in rows if row["model"] == "swimeeter_api_app.swimmer"
+        )
+        relay_entry_row = next(
+            row for row in rows if row["model"] == "swimeeter_api_app.relay_entry"
+        )
+
+        response = self.post_import(
+            rows
+            + [
+                "not json",
+                {**swimmer_row, "pk": None},
+                {**relay_entry_row, "fields": {**relay_entry_row["fields"]}},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [error["error"] for error in response.data["errors"]],
+            [
+                "line is not valid JSON",
+                "pk is missing or not an integer",
+                f"pk already used on line {rows.index(relay_entry_row) + 1}",
+            ],
+        )
+        # * the rest of the file is still imported
+        self.assertEqual(
+            self.get_model_counts(response.data["meet"]["pk"]),
+            self.get_model_counts(self.meet.pk),
+        )
+
+    def test_incomplete_relay_is_skipped_with_its_assignments(self):
+        rows = self.get_export_rows()
+        relay_entry_pk = next(
+            row["pk"] for row in rows if row["model"] == "swimeeter_api_app.relay_entry"
+        )
+        rows.remove(
+            next(
+                row
+                for row in rows
+                if row["model"] == "swimeeter_api_app.relay_assignment"
+                and row["fields"]["relay_entry"] == relay_entry_pk
+            )
+        )
+
+        response = self.post_import(rows)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [error["error"] for error in response.data["errors"]],
+            ["number of relay assignments does not match swimmers per entry"],
+        )
+        imported_meet_id = response.data["meet"]["pk"]
+        relay_entries_count = Relay_entry.objects.filter(meet_id=self.meet.pk).count()
+        self.assertEqual(
+            Relay_entry.objects.filter(meet_id=imported_meet_id).count(),
+            relay_entries_count - 1,
+        )
+        self.assertEqual(
+            Relay_assignment.objects.filter(meet_id=imported_meet_id).count(),
+            (relay_entries_count - 1) * 4,
+        )
+
+    def test_duplicate_meet_follows_duplicate_handling(self):
+        rows = self.get_export_rows()
+
+        self.assertEqual(self.post_import(rows, "unhandled").status_code, 409)
+        self.assertEqual(self.post_import(rows, "keep_originals").status_code, 200)
+        self.assertEqual(Meet.objects.filter(host=self.host).count(), 1)
+
+        self.assertEqual(self.post_import(rows, "keep_new").status_code, 201)
+        self.assertEqual(Meet.objects.filter(host=self.host).count(), 1)
+
+    def test_merged_and_skipped_events_leave_contiguous_orders(self):
+        rows = self.get_export_rows()
+        event_rows = [row for row in rows if row["model"] == "swimeeter_api_app.event"]
+        # $ first event of the first session duplicates the second one
+        event_rows[0]["fields"]["distance"] = event_rows[1]["fields"]["distance"]
+        # $ first event of the second session breaks a validator
+        event_rows[3]["fields"]["swimmers_per_entry"] = 0
+
+        response = self.post_import(rows)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [
+                duplicate["pk"]
+                for duplicate in response.data["duplicates"]
+                if duplicate["model"] == "Event"
+            ],
+            [event_rows[1]["pk"]],
+        )
+        self.assertEqual(self.get_orders(response.data["meet"]["pk"]), [[1, 2], [1, 2]])
+
+
+class Keyset_pagination_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 1, 1, 12)
+
+        # * most swimmers tie on every sort key -> only the id orders them
+        swimmer_ids = list(
+            Swimmer.objects.filter(meet=cls.meet).values_list("id", flat=True)
+        )
+        Swimmer.objects.filter(id__in=swimmer_ids[2:]).update(last_name="Tie")
+
+        # * public meets with null and tied begin and end times
+        now = timezone.now()
+        for begin_time, end_time in [
+            (None, None),
+            (None, None),
+            (now, None),
+            (now, now),
+            (now, now),
+        ]:
+            Meet.objects.create(
+                name="Tied Meet",
+                is_public=True,
+                host=cls.host,
+                begin_time=begin_time,
+                end_time=end_time,
+            )
+
+    def get_swimmers(self, **params):
+        return APIClient().get(
+            "/api/v1/swimmers/",
+            {"specific_to": "meet", "meet_id": self.meet.pk, **params},
+        )
+
+    def get_all_pages(self, url, params, page_size):
+        page_pks = []
+        cursor = ""
+        while cursor is not None:
+            response = APIClient().get(
+                url, {**params, "cursor": cursor, "page_size": page_size}
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data["results"]), page_size)
+            page_pks.append(
+                [model_JSON["pk"] for model_JSON in response.data["results"]]
+            )
+            cursor = response.data["next_cursor"]
+
+        return page_pks
+
+    def test_pages_walk_ties_in_list_order(self):
+        list_pks = list(
+            Swimmer.objects.filter(meet=self.meet)
+            .order_by("last_name", "first_name", "age", "gender", "id")
+            .values_list("id", flat=True)
+        )
+        page_pks = self.get_all_pages(
+            "/api/v1/swimmers/", {"specific_to": "meet", "meet_id": self.meet.pk}, 5
+        )
+
+        self.assertEqual([len(pks) for pks in page_pks], [5, 5, 2])
+        self.assertEqual(sum(page_pks, []), list_pks)
+
+    def test_pages_walk_null_sort_keys(self):
+        expected_pks = list(
+            Meet.objects.filter(is_public=True)
+            .order_by(
+                F("begin_time").desc(nulls_first=True),
+                F("end_time").desc(nulls_first=True),
+                "name",
+                "id",
+            )
+            .values_list("id", flat=True)
+        )
+        page_pks = self.get_all_pages("/api/v1/meets/", {"specific_to": "all"}, 2)
+
+        self.assertEqual(sum(page_pks, []), expected_pks)
+
+    def test_last_page_has_no_next_cursor(self):
+        total_swimmers = Swimmer.objects.filter(meet=self.meet).count()
+
+        response = self.get_swimmers(cursor="", page_size=total_swimmers)
+        self.assertEqual(len(response.data["results"]), total_swimmers)
+        self.assertIsNone(response.data["next_cursor"])
+
+        response = self.get_swimmers(cursor="", page_size=total_swimmers - 1)
+        self.assertIsNotNone(response.data["next_cursor"])
+        response = self.get_swimmers(
+            cursor=response.data["next_cursor"], page_size=total_swimmers - 1
+        )
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNone(response.data["next_cursor"])
+
+    def test_malformed_cursor_or_page_size_is_rejected(self):
+        for cursor in [
+            "not a cursor",
+            vh.encode_cursor(["Tie"]),
+            base64.urlsafe_b64encode(b'{"id": 1}').decode(),
+        ]:
+            with self.subTest(cursor=cursor):
+                response = self.get_swimmers(cursor=cursor)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.data, "invalid cursor")
+
+        for page_size in ["0", str(vh.MAX_PAGE_SIZE + 1), "many"]:
+            with self.subTest(page_size=page_size):
+                response = self.get_swimmers(cursor="", page_size=page_size)
+                self.assertEqual(response.status_code, 400)
+
+    def test_offset_mode_is_unchanged(self):
+        list_pks = list(
+            Swimmer.objects.filter(meet=self.meet)
+            .order_by("last_name", "first_name", "age", "gender")
+            .values_list("id", flat=True)
+        )
+
+        # ~ bounds end before the tied swimmers -> one valid order
+        response = self.get_swimmers(lower_bound=0, upper_bound=2)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(
+            [model_JSON["pk"] for model_JSON in response.data], list_pks[:2]
+        )
+
+        response = self.get_swimmers(lower_bound=2, upper_bound=7)
+        self.assertEqual(len(response.data), 5)
+
+
+class Editing_access_batch_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.other_host = create_host("other@swimeeter.local")
+        cls.meet = create_seeded_meet(cls.host, 1, 1, 4)
+        cls.other_meet = create_seeded_meet(cls.other_host, 1, 1, 4)
+
+        # * every checked model with the host that owns it
+        cls.host_ids = {
+            ("Host", cls.host.pk): cls.host.pk,
+            ("Host", cls.other_host.pk): cls.other_host.pk,
+        }
+        for meet in [cls.meet, cls.other_meet]:
+            cls.host_ids[("Meet", meet.pk)] = meet.host_id
+            for model_class in [
+                Pool,
+                Session,
+                Event,
+                Team,
+                Swimmer,
+                Individual_entry,
+                Relay_entry,
+                Relay_assignment,
+            ]:
+                model_object = model_class.objects.filter(meet=meet).first()
+                cls.host_ids[(model_class.__name__, model_object.pk)] = meet.host_id
+        cls.model_pairs = list(cls.host_ids)
+
+        # * ids no model has -> no access
+        cls.missing_pairs = [
+            (model_type, 10**6) for model_type in ["Host", "Meet", "Swimmer"]
+        ]
+
+    def get_editing_accesses(self, model_pairs, user=None):
+        client = APIClient()
+        if user is not None:
+            client.force_authenticate(user)
+
+        return client.get(
+            "/api/v1/info/",
+            {
+                "info_needed": "editing_access_batch",
+                "models": ",".join(
+                    f"{model_type}:{model_id}" for model_type, model_id in model_pairs
+                ),
+            },
+        )
+
+    def test_mixed_models_of_several_hosts(self):
+        model_pairs = self.model_pairs + self.missing_pairs + self.model_pairs[:2]
+
+        for user in [self.host, self.other_host]:
+            with self.subTest(user=user.username):
+                response = self.get_editing_accesses(model_pairs, user)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    [
+                        (
+                            result["model_type"],
+                            result["model_id"],
+                            result["has_editing_access"],
+                        )
+                        for result in response.data
+                    ],
+                    [
+                        (
+                            model_type,
+                            model_id,
+                            self.host_ids.get((model_type, model_id)) == user.pk,
+                        )
+                        for model_type, model_id in model_pairs
+                    ],
+                )
+
+    def test_batch_matches_single_checks(self):
+        response = self.get_editing_accesses(self.model_pairs, self.host)
+
+        client = APIClient()
+        client.force_authenticate(self.host)
+        for result in response.data:
+            single_response = client.get(
+                "/api/v1/info/",
+                {
+                    "info_needed": "editing_access",
+                    "model_type": result["model_type"],
+                    "model_id": result["model_id"],
+                },
+            )
+            self.assertEqual(
+                single_response.data["has_editing_access"],
+                result["has_editing_access"],
+            )
+
+    def test_one_query_per_model_type(self):
+        request = RequestFactory().get("/")
+        request.user = self.host
+
+        with self.assertNumQueries(len(vh.HOST_ID_LOOKUPS)):
+            vh.check_editing_accesses(request, self.model_pairs + self.missing_pairs)
+
+    def test_logged_out_user_has_no_access(self):
+        response = self.get_editing_accesses(self.model_pairs)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(any(result["has_editing_access"] for result in response.data))
+
+    def test_invalid_models_param_is_rejected(self):
+        for models in [
+            "Meet:abc",
+            "Unknown:1",
+            "Meet",
+            ",".join(["Meet:1"] * (vh.BATCH_MAX_ITEMS + 1)),
+        ]:
+            with self.subTest(models=models[:20]):
+                response = APIClient().get(
+                    "/api/v1/info/",
+                    {"info_needed": "editing_access_batch", "models": models},
+                )
+                self.assertEqual(response.status_code, 400)
+
+
+class Relationship_tree_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 1, 1, 4)
+        cls.entry = Individual_entry.objects.filter(meet=cls.meet).first()
+        cls.relay_entry = Relay_entry.objects.filter(meet=cls.meet).first()
+
+    def setUp(self):
+        caching.get_heat_sheet_cache().clear()
+
+    def get_tree(self, model_type, model_id, client=None):
+        return (client or APIClient()).get(
+            "/api/v1/info/",
+            {
+                "info_needed": "relationship_tree",
+                "model_type": model_type,
+                "model_id": model_id,
+            },
+        )
+
+    def test_cache_miss_and_hit_query_counts(self):
+        # ~ miss: meet version, model with its parents (+ relay swimmers)
+        for model_type, model_id, miss_queries in [
+            ("Meet", self.meet.pk, 2),
+            ("Individual_entry", self.entry.pk, 2),
+            ("Relay_entry", self.relay_entry.pk, 3),
+        ]:
+            with self.subTest(model_type=model_type):
+                with self.assertNumQueries(miss_queries):
+                    tree = vh.get_cached_relationship_tree(model_type, model_id)
+                with self.assertNumQueries(1):
+                    self.assertEqual(
+                        vh.get_cached_relationship_tree(model_type, model_id), tree
+                    )
+
+    def test_version_bump_invalidates_cached_tree(self):
+        response = self.get_tree("Individual_entry", self.entry.pk)
+        self.assertEqual(response.status_code, 200)
+        entry_title = response.data["INDIVIDUAL_ENTRY"]["title"]
+
+        client = APIClient()
+        client.force_authenticate(self.host)
+        response = client.put(
+            f"/api/v1/swimmers/?swimmer_id={self.entry.swimmer_id}",
+            {"first_name": "Renamed"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.get_tree("Individual_entry", self.entry.pk)
+        self.assertNotEqual(response.data["INDIVIDUAL_ENTRY"]["title"], entry_title)
+        self.assertIn("Renamed", response.data["INDIVIDUAL_ENTRY"]["title"])
+
+    def test_missing_model_is_rejected(self):
+        for model_type, model_id in [("Swimmer", 10**6), ("Relay_assignment", 1)]:
+            with self.subTest(model_type=model_type):
+                self.assertEqual(self.get_tree(model_type, model_id).status_code, 400)
+
+
+class Denormalized_meet_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 1, 1, 4)
+        cls.other_meet = create_seeded_meet(cls.host, 1, 1, 4)
+
+    def test_save_copies_meet_of_parent(self):
+        for model_class in [Event, Individual_entry, Relay_entry, Relay_assignment]:
+            with self.subTest(model_type=model_class.__name__):
+                model_object = model_class.objects.filter(meet=self.meet).first()
+                model_object.meet = self.other_meet
+                model_object.save()
+
+                model_object.refresh_from_db()
+                self.assertEqual(model_object.meet_id, self.meet.pk)
+
+    def test_new_model_gets_meet_of_parent(self):
+        event = Event.objects.filter(meet=self.meet, is_relay=False).first()
+        swimmer = Swimmer.objects.filter(meet=self.meet).first()
+        Individual_entry.objects.filter(event=event, swimmer=swimmer).delete()
+
+        new_entry = Individual_entry(seed_time=6000, swimmer=swimmer, event=event)
+        new_entry.save()
+
+        self.assertEqual(new_entry.meet_id, self.meet.pk)
+
+    def test_other_update_fields_do_not_load_the_parent(self):
+        event = Event.objects.filter(meet=self.meet).first()
+        event.total_heats = None
+
+        # ~ only the UPDATE itself -> session is not fetched
+        with self.assertNumQueries(1):
+            event.save(update_fields=["total_heats"])
+
+
+class Meet_version_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        host = create_host()
+        cls.meet = Meet.objects.create(name="Test Meet", is_public=True, host=host)
+
+    def test_bump_is_read_back_from_the_database(self):
+        meet_version = caching.get_meet_version(self.meet.pk)
+        caching.bump_meet_version(self.meet.pk)
+
+        self.assertEqual(caching.get_meet_version(self.meet.pk), meet_version + 1)
+
+    def test_saving_a_loaded_meet_keeps_newer_versions(self):
+        loaded_meet = Meet.objects.get(id=self.meet.pk)
+        caching.bump_meet_version(self.meet.pk)
+        meet_version = caching.get_meet_version(self.meet.pk)
+
+        loaded_meet.name = "Renamed Meet"
+        loaded_meet.save()
+
+        self.assertEqual(caching.get_meet_version(self.meet.pk), meet_version)
+
+
+class Conditional_get_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.other_host = create_host("other@swimeeter.local")
+        cls.meet = create_seeded_meet(cls.host, 1, 1, 8)
+        cls.swimmer = Swimmer.objects.filter(meet_id=cls.meet.pk).first()
+        cls.swimmers_url = f"/api/v1/swimmers/?specific_to=meet&meet_id={cls.meet.pk}"
+
+    def test_unchanged_meet_is_answered_with_a_304(self):
+        client = APIClient()
+        response = client.get(self.swimmers_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ETag", response)
+
+        response_304 = client.get(
+            self.swimmers_url, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+
+        self.assertEqual(response_304.status_code, 304)
+        self.assertEqual(response_304["ETag"], response["ETag"])
+        self.assertEqual(response_304.content, b"")
+
+    def test_etag_changes_after_a_write(self):
+        client = APIClient()
+        etag = client.get(self.swimmers_url)["ETag"]
+
+        client.force_authenticate(self.host)
+        response = client.put(
+            f"/api/v1/swimmers/?swimmer_id={self.swimmer.pk}",
+            {"first_name": "Renamed"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = client.get(self.swimmers_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_private_meet_is_denied_before_any_304(self):
+        Meet.objects.filter(id=self.meet.pk).update(is_public=False)
+        client = APIClient()
+
+        response = client.get(self.swimmers_url, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, 401)
+
+        client.force_authenticate(self.other_host)
+        response = client.get(self.swimmers_url, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, 403)
+
+        client.force_authenticate(self.host)
+        response = client.get(self.swimmers_url, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, 304)
+
+    def test_access_check_alone_never_answers_a_304(self):
+        request = RequestFactory().get("/", HTTP_IF_NONE_MATCH="*")
+        request.user = self.host
+
+        self.assertIsNone(vh.check_meet_access_allowed(request, self.meet.pk))
+
+
+class Meet_access_tests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = create_host()
+        cls.meet = create_seeded_meet(cls.host, 1, 2, 8)
+        cls.swimmer = Swimmer.objects.filter(meet_id=cls.meet.pk).first()
+        cls.event = Event.objects.filter(meet_id=cls.meet.pk).first()
+
+    def test_reads_by_id_check_access_against_the_loaded_meet(self):
+        client = APIClient()
+
+        # ~ swimmer with its meet, then the team of its JSON
+        with self.assertNumQueries(2):
+            response = client.get(
+                f"/api/v1/swimmers/?specific_to=id&swimmer_id={self.swimmer.pk}"
+            )
+        self.assertEqual(response.status_code, 200)
+
+        # ~ event with its meet, then the session and pool of its JSON
+        with self.assertNumQueries(3):
+            response = client.get(
+                f"/api/v1/events/?specific_to=id&event_id={self.event.pk}"
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_reads_by_meet_load_the_meet_once(self):
+        with CaptureQueriesContext(connection) as context:
+            response = APIClient().get(
+                f"/api/v1/events/?specific_to=meet&meet_id={self.meet.pk}"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        meet_queries = [
+            query
+            for query in context.captured_queries
+            if 'FROM "swimeeter_api_app_meet"' in query["sql"]
+        ]
+        self.assertEqual(len(meet_queries), 1)
+
+    def test_editing_access_of_a_deleted_meet_is_not_found(self):
+        pool = Pool.objects.filter(meet_id=self.meet.pk).first()
+        request = RequestFactory().get("/")
+        request.user = self.host
+        Meet.objects.filter(id=self.meet.pk).delete()
+
+        editing_access = vh.check_editing_access(request, "Pool", pool)
+
+        self.assertIsInstance(editing_access, vh.Response)
+        self.assertEqual(editing_access.status_code, 404)
+
+
+def baseline_event_seeding(total_entries, lanes_per_heat, options):
+    # ! frozen copy of the original generate_event_seeding heat and lane assignment
+    #   -> (heat_numbers, lane_numbers, total_heats) of seed-time-ordered entries
+    heat_entry_counts = []
+
+    for i in range(total_entries // lanes_per_heat):
+        heat_entry_counts.append(lanes_per_heat)
+
+    first_heat_leftover = total_entries % lanes_per_heat
+    if first_heat_leftover != 0:
+        heat_entry_counts.insert(0, first_heat_leftover)
+
+    for i in range(1, len(heat_entry_counts)):
+        needed_entries = options["min_entries_per_heat"] - heat_entry_counts[0]
+        if needed_entries <= 0:
+            break
+
+        available_entries = heat_entry_counts[i] - options["min_entries_per_heat"]
+        if available_entries == 0:
+            break
+
+        if needed_entries <= available_entries:
+            heat_entry_counts[0] += needed_entries
+            heat_entry_counts[i] -= needed_entries
+            break
+
+        heat_entry_counts[0] += available_entries
+        heat_entry_counts[i] -= available_entries
+
+    standard_lane_order = []
+    current = math.ceil(lanes_per_heat / 2)
+    change = 1
+    while current >= 1 and current <= lanes_per_heat:
+        standard_lane_order.append(current)
+        current += change
+        change = -1 * (change + 1 if change > 0 else change - 1)
+
+    heat_numbers = []
+    lane_numbers = []
+
+    match (options["seeding_type"]):
+        case "standard":
+            for heat_index in range(len(heat_entry_counts) - 1, -1, -1):
+                for lane_index in range(heat_entry_counts[heat_index]):
+                    heat_numbers.append(heat_index + 1)
+                    lane_numbers.append(standard_lane_order[lane_index])
+
+        case "circle":
+            max_heat_entry_count = max(heat_entry_counts)
+
+            can_circle_seed_heats = 0
+            for i in range(len(heat_entry_counts) - 1, -1, -1):
+                if heat_entry_counts[i] == max_heat_entry_count:
+                    can_circle_seed_heats += 1
+
+            requested_circled_seeded_heats = options["num_circle_seeded_heats"]
+            if requested_circled_seeded_heats == "All full heats":
+                requested_circled_seeded_heats = can_circle_seed_heats
+            else:
+                requested_circled_seeded_heats = int(requested_circled_seeded_heats)
+
+            will_circle_seed_heats = min(
+                can_circle_seed_heats, requested_circled_seeded_heats
+            )
+
+            for lane_index in range(0, max_heat_entry_count):
+                for heat_index in range(
+                    len(heat_entry_counts) - 1,
+                    len(heat_entry_counts) - will_circle_seed_heats - 1,
+                    -1,
+                ):
+                    heat_numbers.append(heat_index + 1)
+                    lane_numbers.append(standard_lane_order[lane_index])
+
+            for heat_index in range(
+                len(heat_entry_counts) - will_circle_seed_heats - 1, -1, -1
+            ):
+                for lane_index in range(heat_entry_counts[heat_index]):
+                    heat_numbers.append(heat_index + 1)
+                    lane_numbers.append(standard_lane_order[lane_index])
+
+    return heat_numbers, lane_numbers, len(heat_entry_counts)
+
+
+class Seeding_core_tests(SimpleTestCase):
+    RANDOM_EVENTS = 300
+
+    def assert_matches_baseline(self, min_entries, max_entries):
+        rng = random.Random(0)
+
+        for _ in range(self.RANDOM_EVENTS):
+            lanes_per_heat = rng.randint(3, 10)
+            total_entries = rng.randint(min_entries, max_entries)
+            options = {
+                "seeding_type": rng.choice(["standard", "circle"]),
+                "min_entries_per_heat": rng.randint(1, lanes_per_heat),
+                "num_circle_seeded_heats": rng.choice(
+                    ["All full heats", rng.randint(0, 6)]
+                ),
+            }
+
+            with self.subTest(
+                total_entries=total_entries, lanes_per_heat=lanes_per_heat, **options
+            ):
+                self.assertEqual(
+                    seeding.compute_event_seeding(
+                        list(range(total_entries)), lanes_per_heat, options
+                    ),
+                    baseline_event_seeding(total_entries, lanes_per_heat, options),
+                )
+
+    def test_small_events_match_baseline(self):
+        self.assert_matches_baseline(1, seeding.VECTORIZED_SEEDING_MIN_ENTRIES - 1)
+
+    @skipUnless(seeding.np is not None, "NumPy is not installed")
+    def test_vectorized_events_match_baseline(self):
+        self.assert_matches_baseline(
+            seeding.VECTORIZED_SEEDING_MIN_ENTRIES,
+            3 * seeding.VECTORIZED_SEEDING_MIN_ENTRIES,
+        )
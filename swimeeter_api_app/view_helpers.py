@@ -1,8 +1,12 @@
 from rest_framework.views import Response
 from rest_framework import status
 
-from django.core.serializers import serialize
-import json
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.db.models import Case, F, Prefetch, PositiveSmallIntegerField, Q, Value, When
+from django.utils.encoding import is_protected_type
+from django.utils.http import parse_etags
 
 from .models import (
     Meet,
@@ -16,14 +20,37 @@ from .models import (
     Relay_assignment,
 )
 from swimeeter_auth_app.models import Host
-
-import math
+from . import seeding
+from . import caching
+from .renderers import Fast_JSON_renderer
+
+import base64
+import collections
+import contextvars
+import datetime
+import decimal
+import hashlib
+import json
+import time
 import inflect
 
 p = inflect.engine()
 
 # ! GENERAL
 
+MODEL_CLASSES = {
+    "Host": Host,
+    "Pool": Pool,
+    "Meet": Meet,
+    "Session": Session,
+    "Event": Event,
+    "Team": Team,
+    "Swimmer": Swimmer,
+    "Individual_entry": Individual_entry,
+    "Relay_entry": Relay_entry,
+    "Relay_assignment": Relay_assignment,
+}
+
 
 def get_query_param(request, param_name):
     param = request.query_params.get(param_name)
@@ -38,37 +65,50 @@ def get_query_param(request, param_name):
 
 
 def get_model_of_id(model_type, model_id):
+    # * each row is fetched at most once per request
+    model_object = recall_model(model_type, model_id)
+    if model_object is not None:
+        return model_object
+
+    model_object = fetch_model_of_id(model_type, model_id)
+    if not isinstance(model_object, Response):
+        remember_models(model_type, [model_object])
+
+    return model_object
+
+
+def fetch_model_of_id(model_type, model_id):
     try:
         match model_type:
             case "Host":
                 return Host.objects.get(id=model_id)
 
             case "Pool":
-                return Pool.objects.get(id=model_id)
+                return Pool.objects.select_related("meet").get(id=model_id)
 
             case "Meet":
                 return Meet.objects.get(id=model_id)
 
             case "Session":
-                return Session.objects.get(id=model_id)
+                return Session.objects.select_related("meet").get(id=model_id)
 
             case "Event":
-                return Event.objects.get(id=model_id)
+                return Event.objects.select_related("meet").get(id=model_id)
 
             case "Team":
-                return Team.objects.get(id=model_id)
+                return Team.objects.select_related("meet").get(id=model_id)
 
             case "Swimmer":
-                return Swimmer.objects.get(id=model_id)
+                return Swimmer.objects.select_related("meet").get(id=model_id)
 
             case "Individual_entry":
-                return Individual_entry.objects.get(id=model_id)
+                return Individual_entry.objects.select_related("meet").get(id=model_id)
 
             case "Relay_entry":
-                return Relay_entry.objects.get(id=model_id)
+                return Relay_entry.objects.select_related("meet").get(id=model_id)
 
             case "Relay_assignment":
-                return Relay_assignment.objects.get(id=model_id)
+                return Relay_assignment.objects.select_related("meet").get(id=model_id)
 
             case _:
                 return Response(
@@ -82,6 +122,232 @@ def get_model_of_id(model_type, model_id):
         )
 
 
+# ! IDENTITY MAP
+
+# ~ request-scoped identity map:
+#   $ API_view.dispatch opens a map per request and always resets it afterwards
+#   $ get_model_of_id and get_JSON_map consult it before querying
+#   ! views mutate and save the instances they are handed -> the map stays current
+#   ! set-based updates bypass the instances -> forget_models drops the rows they touch
+
+current_identity_map = contextvars.ContextVar("current_identity_map", default=None)
+
+
+def open_identity_map():
+    return current_identity_map.set({"models": {}, "hits": 0, "misses": 0})
+
+
+def close_identity_map(identity_map_token):
+    current_identity_map.reset(identity_map_token)
+
+
+def get_identity_map():
+    return current_identity_map.get()
+
+
+def recall_model(model_type, model_id):
+    identity_map = current_identity_map.get()
+    if identity_map is None:
+        return None
+
+    model_object = identity_map["models"].get((model_type, model_id))
+    if model_object is None:
+        identity_map["misses"] += 1
+    else:
+        identity_map["hits"] += 1
+
+    return model_object
+
+
+def remember_models(model_type, model_objects):
+    identity_map = current_identity_map.get()
+    if identity_map is None:
+        return
+
+    for model_object in model_objects:
+        identity_map["models"].setdefault((model_type, model_object.pk), model_object)
+
+        # * share parents between instances -> known parents skip their lazy query
+        for field in model_object._meta.concrete_fields:
+            if field.remote_field is None:
+                continue
+
+            parent_type = field.related_model.__name__
+            known_parent = identity_map["models"].get(
+                (parent_type, getattr(model_object, field.attname))
+            )
+            if known_parent is not None:
+                field.set_cached_value(model_object, known_parent)
+            elif field.is_cached(model_object):
+                # ~ parent came along through select_related -> remember it too
+                parent_object = field.get_cached_value(model_object)
+                if parent_object is not None:
+                    remember_models(parent_type, [parent_object])
+
+
+def forget_models(model_type, model_ids=None):
+    # ~ no model_ids -> every row of model_type, for updates not filtered by id
+    identity_map = current_identity_map.get()
+    if identity_map is None:
+        return
+
+    if model_ids is not None:
+        model_ids = set(model_ids)
+
+    for key in [
+        key
+        for key in identity_map["models"]
+        if key[0] == model_type and (model_ids is None or key[1] in model_ids)
+    ]:
+        del identity_map["models"][key]
+
+
+def bump_meet_version(meet_id):
+    caching.bump_meet_version(meet_id)
+    # ! F() update -> the in-memory meet holds the old version
+    forget_models("Meet", [meet_id])
+
+
+# ! PAGINATION
+
+# ~ opt-in keyset pagination -> pass "cursor" (empty for the first page)
+#   ~ pages continue after the sort key of the last row, so deep pages cost the same as the first
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def get_cursor_ordering(query_set):
+    # * existing sort order of the list, made unique by the primary key
+    cursor_ordering = [str(field) for field in query_set.query.order_by]
+    if len(cursor_ordering) == 0 or cursor_ordering[-1].lstrip("-") not in ("id", "pk"):
+        cursor_ordering.append("id")
+
+    return cursor_ordering
+
+
+def encode_cursor(key_values):
+    key_values = [
+        value.isoformat() if isinstance(value, datetime.datetime) else value
+        for value in key_values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(key_values).encode()).decode()
+
+
+def decode_cursor(cursor, key_count):
+    try:
+        key_values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except:
+        return None
+
+    if not isinstance(key_values, list) or len(key_values) != key_count:
+        return None
+
+    return key_values
+
+
+def get_cursor_key_values(model_object, cursor_ordering):
+    key_values = []
+    for field_name in cursor_ordering:
+        value = model_object
+        for attribute_name in field_name.lstrip("-").split("__"):
+            value = getattr(value, attribute_name)
+        key_values.append(value)
+
+    return key_values
+
+
+def get_after_cursor_filter(cursor_ordering, key_values):
+    # ! NULLS LAST ascending, NULLS FIRST descending
+    after_cursor_filter = Q(pk__in=[])
+    equal_keys_filter = Q()
+
+    for field_name, value in zip(cursor_ordering, key_values):
+        is_descending = field_name.startswith("-")
+        field_name = field_name.lstrip("-")
+
+        # * rows sorted after the cursor on this key
+        if value is None:
+            key_filter = Q(**{f"{field_name}__isnull": False}) if is_descending else None
+        elif is_descending:
+            key_filter = Q(**{f"{field_name}__lt": value})
+        else:
+            key_filter = Q(**{f"{field_name}__gt": value}) | Q(
+                **{f"{field_name}__isnull": True}
+            )
+
+        if key_filter is not None:
+            after_cursor_filter |= equal_keys_filter & key_filter
+
+        # * rows tied with the cursor on this key
+        if value is None:
+            equal_keys_filter &= Q(**{f"{field_name}__isnull": True})
+        else:
+            equal_keys_filter &= Q(**{field_name: value})
+
+    return after_cursor_filter
+
+
+def get_JSON_page(request, model_type, query_set, lower_bound, upper_bound):
+    cursor = request.query_params.get("cursor")
+
+    # $ no cursor -> request range of values
+    if cursor is None:
+        return get_JSON_multiple(model_type, query_set[lower_bound:upper_bound], True)
+
+    try:
+        page_size = int(request.query_params.get("page_size", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        page_size = 0
+    # ? invalid page size
+    if page_size < 1 or page_size > MAX_PAGE_SIZE:
+        return Response(
+            f"page_size must be between 1 and {MAX_PAGE_SIZE}",
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    # ~ NULL placement made explicit -> same as the Postgres default on every backend
+    cursor_ordering = get_cursor_ordering(query_set)
+    query_set = query_set.order_by(
+        *[
+            F(field_name[1:]).desc(nulls_first=True)
+            if field_name.startswith("-")
+            else F(field_name).asc(nulls_last=True)
+            for field_name in cursor_ordering
+        ]
+    )
+
+    # $ continue after cursor
+    if cursor != "":
+        key_values = decode_cursor(cursor, len(cursor_ordering))
+        # ? malformed cursor or cursor of another list
+        if key_values is None:
+            return Response(
+                "invalid cursor",
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        query_set = query_set.filter(
+            get_after_cursor_filter(cursor_ordering, key_values)
+        )
+
+    # ~ one extra row tells whether another page follows
+    page_objects = list(query_set[: page_size + 1])
+    if len(page_objects) > page_size:
+        page_objects = page_objects[:page_size]
+        next_cursor = encode_cursor(
+            get_cursor_key_values(page_objects[-1], cursor_ordering)
+        )
+    else:
+        next_cursor = None
+
+    page_JSON = get_JSON_multiple(model_type, page_objects, True)
+    # ? internal error generating JSON
+    if isinstance(page_JSON, Response):
+        return page_JSON
+
+    return {"results": page_JSON, "next_cursor": next_cursor}
+
+
 # ! DUPLICATES
 
 
@@ -118,7 +384,7 @@ def get_all_duplicates(model_type, model_object):
 
             case "Event":
                 return Event.objects.filter(
-                    session__meet_id=model_object.session.meet_id,
+                    meet_id=model_object.meet_id,
                     stroke=model_object.stroke,
                     distance=model_object.distance,
                     is_relay=model_object.is_relay,
@@ -274,21 +540,66 @@ def check_user_is_host(request, host_id):
         return None
 
 
-def check_meet_access_allowed(request, meet_object):
-    if not meet_object.is_public:
+def check_meet_access_allowed(request, meet_id):
+    # ~ meet of the model the view loaded -> identity map hit, no extra query
+    meet_of_id = get_model_of_id("Meet", meet_id)
+    # ? no meet of meet_id exists
+    if isinstance(meet_of_id, Response):
+        return meet_of_id
+
+    if not meet_of_id.is_public:
         if not request.user.is_authenticated:
             return Response(
                 "meet is private and not logged into host account",
                 status=status.HTTP_401_UNAUTHORIZED,
             )
-        elif meet_object.host_id != request.user.id:
+        elif meet_of_id.host_id != request.user.id:
             return Response(
                 "meet is private and not logged into host account",
                 status=status.HTTP_403_FORBIDDEN,
             )
-    else:
+
+    return None
+
+
+def check_conditional_meet_read(request, meet_id):
+    # ~ read views only -> access check, then a 304 if the meet is unchanged
+    check_meet_access = check_meet_access_allowed(request, meet_id)
+    # ! denied access is reported before any 304 is considered
+    if isinstance(check_meet_access, Response):
+        return check_meet_access
+
+    return check_meet_not_modified(request, get_model_of_id("Meet", meet_id))
+
+
+def get_meet_etag(request, meet_object):
+    # ~ same path, query, media type and meet version -> same response body
+    etag_source = "|".join(
+        [
+            request.get_full_path(),
+            str(request.accepted_media_type),
+            str(meet_object.version),
+        ]
+    )
+    return f'"{hashlib.sha1(etag_source.encode()).hexdigest()}"'
+
+
+def check_meet_not_modified(request, meet_object):
+    if request.method != "GET":
         return None
 
+    # ! API_view.finalize_response tags the 200 response with this ETag
+    request.meet_etag = get_meet_etag(request, meet_object)
+
+    if_none_match_etags = parse_etags(request.headers.get("If-None-Match", ""))
+    if "*" in if_none_match_etags or request.meet_etag in if_none_match_etags:
+        return Response(
+            status=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": request.meet_etag},
+        )
+
+    return None
+
 
 # ! FRONT-END INFO RETRIEVAL
 
@@ -302,32 +613,29 @@ def check_editing_access(request, model_type, model_object):
             case "Host":
                 return model_object.id == request.user.id
 
-            case "Pool":
-                return model_object.meet.host.id == request.user.id
-
             case "Meet":
-                return model_object.host.id == request.user.id
-
-            case "Session":
-                return model_object.meet.host.id == request.user.id
-
-            case "Event":
-                return model_object.session.meet.host.id == request.user.id
-
-            case "Team":
-                return model_object.meet.host.id == request.user.id
-
-            case "Swimmer":
-                return model_object.meet.host.id == request.user.id
-
-            case "Individual_entry":
-                return model_object.swimmer.meet.host.id == request.user.id
-
-            case "Relay_entry":
-                return model_object.event.session.meet.host.id == request.user.id
+                return model_object.host_id == request.user.id
+
+            # ~ meet-scoped models -> host of the meet loaded along with the model
+            case (
+                "Pool"
+                | "Session"
+                | "Event"
+                | "Team"
+                | "Swimmer"
+                | "Individual_entry"
+                | "Relay_entry"
+                | "Relay_assignment"
+            ):
+                meet_of_id = get_model_of_id("Meet", model_object.meet_id)
+                # ? meet was deleted after model_object was loaded
+                if isinstance(meet_of_id, Response):
+                    return Response(
+                        "no Meet with the given id exists",
+                        status=status.HTTP_404_NOT_FOUND,
+                    )
 
-            case "Relay_assignment":
-                return model_object.swimmer.meet.host.id == request.user.id
+                return meet_of_id.host_id == request.user.id
 
             case _:
                 return Response(
@@ -341,6 +649,71 @@ def check_editing_access(request, model_type, model_object):
         )
 
 
+# ~ host of each model type -> one joined lookup per type
+HOST_ID_LOOKUPS = {
+    "Host": "id",
+    "Meet": "host_id",
+    "Pool": "meet__host_id",
+    "Session": "meet__host_id",
+    "Event": "meet__host_id",
+    "Team": "meet__host_id",
+    "Swimmer": "meet__host_id",
+    "Individual_entry": "meet__host_id",
+    "Relay_entry": "meet__host_id",
+    "Relay_assignment": "meet__host_id",
+}
+
+
+def get_model_pairs(request):
+    # ~ "models" param -> comma-separated model_type:model_id pairs
+    models_param = get_query_param(request, "models")
+    # ? no "models" param passed
+    if isinstance(models_param, Response):
+        return models_param
+
+    model_pairs = []
+    for model_pair in models_param.split(","):
+        model_type, _, model_id = model_pair.partition(":")
+        # ? invalid model_type:model_id pair
+        if model_type not in HOST_ID_LOOKUPS or not model_id.isdigit():
+            return Response(
+                f"invalid model '{model_pair}'",
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        model_pairs.append((model_type, int(model_id)))
+
+    # ? too many models passed
+    if len(model_pairs) > BATCH_MAX_ITEMS:
+        return Response(
+            f"models must contain between 1 and {BATCH_MAX_ITEMS} items",
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    return model_pairs
+
+
+def check_editing_accesses(request, model_pairs):
+    # ~ same answers as check_editing_access, missing models have no access
+    if not request.user.is_authenticated:
+        return [False for _ in model_pairs]
+
+    model_ids_of_type = {}
+    for model_type, model_id in model_pairs:
+        model_ids_of_type.setdefault(model_type, set()).add(model_id)
+
+    # * resolve the host of every model -> one query per model type
+    host_ids = {}
+    for model_type, model_ids in model_ids_of_type.items():
+        for model_id, host_id in (
+            MODEL_CLASSES[model_type]
+            .objects.filter(id__in=model_ids)
+            .values_list("id", HOST_ID_LOOKUPS[model_type])
+        ):
+            host_ids[(model_type, model_id)] = host_id
+
+    return [host_ids.get(model_pair) == request.user.id for model_pair in model_pairs]
+
+
 def get_swimmer_name(swimmer_object: Swimmer):
     swimmer_name = ""
 
@@ -464,10 +837,12 @@ def get_individual_entry_name(individual_entry_object: Individual_entry):
 def get_relay_entry_name(relay_entry_object: Relay_entry):
     entry_name = ""
 
+    # ~ sort in Python -> prefetched assignments are reused instead of re-queried
     swimmers_list = [
         assignment.swimmer
-        for assignment in relay_entry_object.relay_assignments.all().order_by(
-            "order_in_relay"
+        for assignment in sorted(
+            relay_entry_object.relay_assignments.all(),
+            key=lambda assignment: assignment.order_in_relay,
         )
     ]
 
@@ -491,8 +866,6 @@ def get_relay_entry_name(relay_entry_object: Relay_entry):
 
 
 def get_relay_participants_names(relay_entry_object: Relay_entry):
-    entry_name = ""
-
     swimmers_list = [
         assignment.swimmer
         for assignment in relay_entry_object.relay_assignments.all().order_by(
@@ -500,6 +873,12 @@ def get_relay_participants_names(relay_entry_object: Relay_entry):
         )
     ]
 
+    return get_swimmers_list_names(swimmers_list)
+
+
+def get_swimmers_list_names(swimmers_list):
+    entry_name = ""
+
     if len(swimmers_list) == 1:
         pass
     elif len(swimmers_list) == 2:
@@ -514,6 +893,86 @@ def get_relay_participants_names(relay_entry_object: Relay_entry):
     return entry_name
 
 
+# ~ parents each relationship tree reads -> joined into the model's single fetch
+RELATIONSHIP_TREE_RELATED = {
+    "Meet": [],
+    "Pool": ["meet"],
+    "Session": ["meet"],
+    "Event": ["meet", "session__pool"],
+    "Team": ["meet"],
+    "Swimmer": ["meet"],
+    "Individual_entry": ["meet", "event__session__pool", "swimmer"],
+    "Relay_entry": ["meet", "event__session__pool"],
+}
+
+
+def get_cached_relationship_tree(model_type, model_id):
+    # ? invalid model type
+    if model_type not in RELATIONSHIP_TREE_RELATED:
+        return Response(
+            f"{model_type} is not a valid model type",
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    # * resolve meet version of model -> also confirms the model still exists
+    # ! read the version before fetching -> a concurrent write bumps past this entry
+    meet_version = (
+        MODEL_CLASSES[model_type]
+        .objects.filter(id=model_id)
+        .values_list("version" if model_type == "Meet" else "meet__version", flat=True)
+        .first()
+    )
+    # ? no model of model_id exists
+    if meet_version is None:
+        return Response(
+            f"no {model_type} with the given id exists",
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    relationship_tree_key = caching.get_relationship_tree_key(
+        model_type, model_id, meet_version
+    )
+    relationship_tree = caching.get_cached_relationship_tree(relationship_tree_key)
+    if relationship_tree is not None:
+        return relationship_tree
+
+    model_object = fetch_relationship_tree_model(model_type, model_id)
+    # ? no model of model_id exists
+    if isinstance(model_object, Response):
+        return model_object
+
+    relationship_tree = get_relationship_tree(model_type, model_object)
+    # ? internal error getting relationship tree
+    if isinstance(relationship_tree, Response):
+        return relationship_tree
+
+    caching.set_cached_relationship_tree(relationship_tree_key, relationship_tree)
+    return relationship_tree
+
+
+def fetch_relationship_tree_model(model_type, model_id):
+    model_objects = MODEL_CLASSES[model_type].objects.select_related(
+        *RELATIONSHIP_TREE_RELATED[model_type]
+    )
+
+    # * relay entry names read every swimmer in the relay -> one extra query
+    if model_type == "Relay_entry":
+        model_objects = model_objects.prefetch_related(
+            Prefetch(
+                "relay_assignments",
+                queryset=Relay_assignment.objects.select_related("swimmer"),
+            )
+        )
+
+    try:
+        return model_objects.get(id=model_id)
+    except:
+        return Response(
+            f"no {model_type} with the given id exists",
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+
 def get_relationship_tree(model_type, model_object):
     try:
         match model_type:
@@ -530,13 +989,13 @@ def get_relationship_tree(model_type, model_object):
                 return {
                     "MEET": {
                         "title": model_object.meet.name,
-                        "id": model_object.meet.id,
-                        "route": f"/meets/{model_object.meet.id}",
+                        "id": model_object.meet_id,
+                        "route": f"/meets/{model_object.meet_id}",
                     },
                     "POOL": {
                         "title": model_object.name,
                         "id": model_object.id,
-                        "route": f"/meets/{model_object.meet.id}/pools/{model_object.id}",
+                        "route": f"/meets/{model_object.meet_id}/pools/{model_object.id}",
                     },
                 }
 
@@ -544,32 +1003,32 @@ def get_relationship_tree(model_type, model_object):
                 return {
                     "MEET": {
                         "title": model_object.meet.name,
-                        "id": model_object.meet.id,
-                        "route": f"/meets/{model_object.meet.id}",
+                        "id": model_object.meet_id,
+                        "route": f"/meets/{model_object.meet_id}",
                     },
                     "SESSION": {
                         "title": model_object.name,
                         "id": model_object.id,
-                        "route": f"/meets/{model_object.meet.id}/sessions/{model_object.id}",
+                        "route": f"/meets/{model_object.meet_id}/sessions/{model_object.id}",
                     },
                 }
 
             case "Event":
                 return {
                     "MEET": {
-                        "title": model_object.session.meet.name,
-                        "id": model_object.session.meet.id,
-                        "route": f"/meets/{model_object.session.meet.id}",
+                        "title": model_object.meet.name,
+                        "id": model_object.meet_id,
+                        "route": f"/meets/{model_object.meet_id}",
                     },
                     "SESSION": {
                         "title": model_object.session.name,
-                        "id": model_object.session.id,
-                        "route": f"/meets/{model_object.session.meet.id}/sessions/{model_object.session.id}",
+                        "id": model_object.session_id,
+                        "route": f"/meets/{model_object.meet_id}/sessions/{model_object.session_id}",
                     },
                     "EVENT": {
                         "title": get_event_name(model_object),
                         "id": model_object.id,
-                        "route": f"/meets/{model_object.session.meet.id}/events/{'relay' if model_object.is_relay else 'individual'}/{model_object.id}",
+                        "route": f"/meets/{model_object.meet_id}/events/{'relay' if model_object.is_relay else 'individual'}/{model_object.id}",
                     },
                 }
 
@@ -577,13 +1036,13 @@ def get_relationship_tree(model_type, model_object):
                 return {
                     "MEET": {
                         "title": model_object.meet.name,
-                        "id": model_object.meet.id,
-                        "route": f"/meets/{model_object.meet.id}",
+                        "id": model_object.meet_id,
+                        "route": f"/meets/{model_object.meet_id}",
                     },
                     "TEAM": {
                         "title": model_object.name,
                         "id": model_object.id,
-                        "route": f"/meets/{model_object.meet.id}/teams/{model_object.id}",
+                        "route": f"/meets/{model_object.meet_id}/teams/{model_object.id}",
                     },
                 }
 
@@ -591,61 +1050,61 @@ def get_relationship_tree(model_type, model_object):
                 return {
                     "MEET": {
                         "title": model_object.meet.name,
-                        "id": model_object.meet.id,
-                        "route": f"/meets/{model_object.meet.id}",
+                        "id": model_object.meet_id,
+                        "route": f"/meets/{model_object.meet_id}",
                     },
                     "SWIMMER": {
                         "title": get_swimmer_name(model_object),
                         "id": model_object.id,
-                        "route": f"/meets/{model_object.meet.id}/swimmers/{model_object.id}",
+                        "route": f"/meets/{model_object.meet_id}/swimmers/{model_object.id}",
                     },
                 }
 
             case "Individual_entry":
                 return {
                     "MEET": {
-                        "title": model_object.event.session.meet.name,
-                        "id": model_object.event.session.meet.id,
-                        "route": f"/meets/{model_object.event.session.meet.id}",
+                        "title": model_object.meet.name,
+                        "id": model_object.meet_id,
+                        "route": f"/meets/{model_object.meet_id}",
                     },
                     "SESSION": {
                         "title": model_object.event.session.name,
-                        "id": model_object.event.session.id,
-                        "route": f"/meets/{model_object.event.session.meet.id}/sessions/{model_object.event.session.id}",
+                        "id": model_object.event.session_id,
+                        "route": f"/meets/{model_object.meet_id}/sessions/{model_object.event.session_id}",
                     },
                     "EVENT": {
                         "title": get_event_name(model_object.event),
-                        "id": model_object.event.id,
-                        "route": f"/meets/{model_object.event.session.meet.id}/events/individual/{model_object.event.id}",
+                        "id": model_object.event_id,
+                        "route": f"/meets/{model_object.meet_id}/events/individual/{model_object.event_id}",
                     },
                     "INDIVIDUAL_ENTRY": {
                         "title": get_individual_entry_name(model_object),
                         "id": model_object.id,
-                        "route": f"/meets/{model_object.event.session.meet.id}/individual_entries/{model_object.id}",
+                        "route": f"/meets/{model_object.meet_id}/individual_entries/{model_object.id}",
                     },
                 }
 
             case "Relay_entry":
                 return {
                     "MEET": {
-                        "title": model_object.event.session.meet.name,
-                        "id": model_object.event.session.meet.id,
-                        "route": f"/meets/{model_object.event.session.meet.id}",
+                        "title": model_object.meet.name,
+                        "id": model_object.meet_id,
+                        "route": f"/meets/{model_object.meet_id}",
                     },
                     "SESSION": {
                         "title": model_object.event.session.name,
-                        "id": model_object.event.session.id,
-                        "route": f"/meets/{model_object.event.session.meet.id}/sessions/{model_object.event.session.id}",
+                        "id": model_object.event.session_id,
+                        "route": f"/meets/{model_object.meet_id}/sessions/{model_object.event.session_id}",
                     },
                     "EVENT": {
                         "title": get_event_name(model_object.event),
-                        "id": model_object.event.id,
-                        "route": f"/meets/{model_object.event.session.meet.id}/events/relay/{model_object.event.id}",
+                        "id": model_object.event_id,
+                        "route": f"/meets/{model_object.meet_id}/events/relay/{model_object.event_id}",
                     },
                     "RELAY_ENTRY": {
                         "title": get_relay_entry_name(model_object),
                         "id": model_object.id,
-                        "route": f"/meets/{model_object.event.session.meet.id}/relay_entries/{model_object.id}",
+                        "route": f"/meets/{model_object.meet_id}/relay_entries/{model_object.id}",
                     },
                 }
 
@@ -661,6 +1120,54 @@ def get_relationship_tree(model_type, model_object):
         )
 
 
+# ! EVENT ORDERING
+
+
+def lock_sessions(session_ids):
+    # ! must run inside transaction.atomic()
+    #   ~ locks rows in id order -> concurrent edits of two sessions cannot deadlock
+    return list(
+        Session.objects.select_for_update()
+        .filter(id__in=session_ids)
+        .order_by("id")
+    )
+
+
+def shift_events_order(
+    session_id, shift, min_order=None, max_order=None, excluded_event_id=None
+):
+    # * move a range of order numbers in a single UPDATE
+    shifted_events = Event.objects.filter(session_id=session_id)
+    if min_order is not None:
+        shifted_events = shifted_events.filter(order_in_session__gte=min_order)
+    if max_order is not None:
+        shifted_events = shifted_events.filter(order_in_session__lte=max_order)
+    if excluded_event_id is not None:
+        shifted_events = shifted_events.exclude(id=excluded_event_id)
+
+    shifted_count = shifted_events.update(order_in_session=F("order_in_session") + shift)
+    forget_models("Event")
+
+    return shifted_count
+
+
+def set_events_order(session_id, event_ids):
+    # * rewrite every order number of a session in a single UPDATE
+    ordered_count = Event.objects.filter(session_id=session_id).update(
+        order_in_session=Case(
+            *[
+                When(id=event_id, then=Value(order_number))
+                for order_number, event_id in enumerate(event_ids, start=1)
+            ],
+            default=F("order_in_session"),
+            output_field=PositiveSmallIntegerField(),
+        )
+    )
+    forget_models("Event")
+
+    return ordered_count
+
+
 # ! ENTRIES
 
 
@@ -729,267 +1236,578 @@ def validate_swimmer_against_event(swimmer_object, event_object):
         return None
 
 
-# ! HEAT SHEET SEEDING
-
+# ! BATCHES
 
-def invalidate_event_seeding(event_object):
-    try:
-        # data already invalidated
-        if event_object.total_heats is None:
-            return None
+BATCH_MAX_ITEMS = 500
 
-        event_object.total_heats = None
-        event_object.save()
 
-        if event_object.is_relay:
-            entries_of_event = Relay_entry.objects.filter(event_id=event_object.pk)
-        else:
-            entries_of_event = Individual_entry.objects.filter(event_id=event_object.pk)
+def get_batch_items(request):
+    batch_items = request.data
 
-        for entry in entries_of_event:
-            entry.heat_number = None
-            entry.lane_number = None
-            entry.save()
+    # ? request body is not a list of objects
+    if not isinstance(batch_items, list) or not all(
+        isinstance(batch_item, dict) for batch_item in batch_items
+    ):
+        return Response(
+            "request body must be a list of objects",
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
-        return None
-    except Exception as err:
+    # ? batch is empty or too large
+    if len(batch_items) == 0 or len(batch_items) > BATCH_MAX_ITEMS:
         return Response(
-            "heat sheet invalidation failed",
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            f"batch must contain between 1 and {BATCH_MAX_ITEMS} items",
+            status=status.HTTP_400_BAD_REQUEST,
         )
 
+    return batch_items
 
-def generate_event_seeding(options, event_object: Event):
-    # ~ options:
-    #   $ min_entries_per_heat: number
-    #   $ seeding_type: "standard" | "circle"
-    #   ! (circle seeding only) num_circle_seeded_heats: number | "All full heats"
 
-    # * get entries of event
-    if event_object.is_relay:
-        entries_list = list(
-            Relay_entry.objects.filter(event_id=event_object.pk).order_by("seed_time")
-        )
+def get_batch_ids(batch_items, id_name):
+    # ~ malformed ids are reported per item -> skipped here
+    return {
+        batch_item.get(id_name)
+        for batch_item in batch_items
+        if isinstance(batch_item.get(id_name), int)
+    }
+
+
+def get_batch_result(index, item_response):
+    return {
+        "index": index,
+        "status": item_response.status_code,
+        "data": item_response.data,
+    }
+
+
+def get_batch_response(batch_results):
+    # ~ one status shared by every item -> that status, otherwise multi-status
+    item_statuses = {batch_result["status"] for batch_result in batch_results}
+    if len(item_statuses) == 1:
+        batch_status = item_statuses.pop()
     else:
-        entries_list = list(
-            Individual_entry.objects.filter(event_id=event_object.pk).order_by(
-                "seed_time"
-            )
-        )
+        batch_status = status.HTTP_207_MULTI_STATUS
 
-    # * calculate entries per heat
-    total_entries = len(entries_list)
-    lanes_per_heat = event_object.session.pool.lanes
-
-    heat_entry_counts = []
-
-    for i in range(total_entries // lanes_per_heat):
-        heat_entry_counts.append(lanes_per_heat)
-
-    first_heat_leftover = total_entries % lanes_per_heat
-    if first_heat_leftover != 0:
-        heat_entry_counts.insert(0, first_heat_leftover)
-
-    # ~ deal with minimum entries needed per heat
-    for i in range(1, len(heat_entry_counts)):
-        # * first heat already meets min requirement
-        needed_entries = options["min_entries_per_heat"] - heat_entry_counts[0]
-        if needed_entries <= 0:
-            break
-
-        # * no entries are available to carry over -> fail to meet min requirement
-        available_entries = heat_entry_counts[i] - options["min_entries_per_heat"]
-        if available_entries == 0:
-            break
-
-        # * enough entries available to meet min requirement
-        if needed_entries <= available_entries:
-            heat_entry_counts[0] += needed_entries
-            heat_entry_counts[i] -= needed_entries
-            break
-
-        # * not enough entries available, but at least some
-        heat_entry_counts[0] += available_entries
-        heat_entry_counts[i] -= available_entries
-
-    # * define standard lane order
-    standard_lane_order = []
-    current = math.ceil(lanes_per_heat / 2)
-    change = 1
-    while current >= 1 and current <= lanes_per_heat:
-        standard_lane_order.append(current)
-        current += change
-        change = -1 * (change + 1 if change > 0 else change - 1)
-
-    # $ assign heat and lanes using...
-    match (options["seeding_type"]):
-        # $ ...standard seeding
-        case "standard":
-            entry_index = 0
-
-            # * standard seed all heats
-            for heat_index in range(len(heat_entry_counts) - 1, -1, -1):
-                for lane_index in range(heat_entry_counts[heat_index]):
-                    entries_list[entry_index].heat_number = heat_index + 1
-                    entries_list[entry_index].lane_number = standard_lane_order[
-                        lane_index
-                    ]
-                    entry_index += 1
-
-        # $ ...circle seeding
-        case "circle":
-            # * determine heats that will be circle seeded
-            max_heat_entry_count = max(heat_entry_counts)
-
-            can_circle_seed_heats = 0
-            for i in range(len(heat_entry_counts) - 1, -1, -1):
-                if heat_entry_counts[i] == max_heat_entry_count:
-                    can_circle_seed_heats += 1
-
-            requested_circled_seeded_heats = options["num_circle_seeded_heats"]
-            if requested_circled_seeded_heats == "All full heats":
-                requested_circled_seeded_heats = can_circle_seed_heats
-            else:
-                requested_circled_seeded_heats = int(requested_circled_seeded_heats)
-
-            will_circle_seed_heats = min(
-                can_circle_seed_heats, requested_circled_seeded_heats
-            )
+    return Response(batch_results, status=batch_status)
 
-            entry_index = 0
-
-            # * circle seed ending heats
-            for lane_index in range(0, max_heat_entry_count):
-                for heat_index in range(
-                    len(heat_entry_counts) - 1,
-                    len(heat_entry_counts) - will_circle_seed_heats - 1,
-                    -1,
-                ):
-                    entries_list[entry_index].heat_number = heat_index + 1
-                    entries_list[entry_index].lane_number = standard_lane_order[
-                        lane_index
-                    ]
-                    entry_index += 1
 
-            # * standard seed beginning heats
-            for heat_index in range(
-                len(heat_entry_counts) - will_circle_seed_heats - 1, -1, -1
-            ):
-                for lane_index in range(heat_entry_counts[heat_index]):
-                    entries_list[entry_index].heat_number = heat_index + 1
-                    entries_list[entry_index].lane_number = standard_lane_order[
-                        lane_index
-                    ]
-                    entry_index += 1
+# ! HEAT SHEET SEEDING
 
-        # ? invalid seeding type
-        case _:
-            return Response("invalid seeding type", status=status.HTTP_400_BAD_REQUEST)
+SEEDING_FIELDS = ["heat_number", "lane_number"]
 
-    event_object.total_heats = len(heat_entry_counts)
 
-    # * save event and entry seeding data
-    try:
-        event_object.full_clean()
-        event_object.save()
+def invalidate_event_seeding(event_object):
+    return invalidate_events_seeding([event_object])
 
-        for entry in entries_list:
-            entry.full_clean()
-            entry.save()
 
-        return True
-    except:
-        event_object.total_heats = None
-        event_object.save()
+def invalidate_events_seeding(events_list):
+    # ~ data already invalidated -> total_heats is null
+    cleared_meet_ids = clear_events_seeding(
+        [event for event in events_list if event.total_heats is not None]
+    )
+    # ? internal error invalidating event seeding
+    if isinstance(cleared_meet_ids, Response):
+        return cleared_meet_ids
 
-        for entry in entries_list:
-            entry.heat_number = None
-            entry.lane_number = None
-            entry.save()
+    # ! keep in-memory events consistent with the database
+    for event in events_list:
+        event.total_heats = None
 
-        # ? error saving event and entries
-        return Response(
-            "error saving event and entries",
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+    for meet_id in cleared_meet_ids:
+        bump_meet_version(meet_id)
 
+    return None
 
-def get_heat_seeding_data(event_object, heat_number):
-    heat_seeding_data = {"heat_number": heat_number, "lanes_data": []}
 
-    if event_object.is_relay:
-        entries_list = list(
-            Relay_entry.objects.filter(
-                event_id=event_object.pk, heat_number=heat_number
-            ).order_by("lane_number")
-        )
+def clear_events_seeding(events_list):
+    # ~ returns the ids of the meets whose seeding was cleared
+    event_ids = list({event.pk for event in events_list})
+    if len(event_ids) == 0:
+        return set()
 
-        starting_lane_number = entries_list[0].lane_number
-        ending_lane_number = entries_list[-1].lane_number
-        total_lanes = event_object.session.pool.lanes
+    individual_event_ids = [event.pk for event in events_list if not event.is_relay]
+    relay_event_ids = [event.pk for event in events_list if event.is_relay]
 
-        for i in range(1, starting_lane_number):
-            heat_seeding_data["lanes_data"].append(
-                {"lane_number": i, "entry_data": None}
+    try:
+        # * clear events and their entries in one statement per table
+        with transaction.atomic():
+            Event.objects.filter(id__in=event_ids).update(total_heats=None)
+            Individual_entry.objects.filter(event_id__in=individual_event_ids).update(
+                heat_number=None, lane_number=None
             )
-
-        lane_counter = starting_lane_number
-        for entry in entries_list:
-            heat_seeding_data["lanes_data"].append(
-                {
-                    "lane_number": lane_counter,
-                    "entry_data": {
-                        "entry_id": entry.pk,
-                        "entry_name": get_relay_participants_names(entry),
-                        "entry_team": list(entry.swimmers.all())[0].team.name,
-                        "entry_seed_time": entry.seed_time,
-                    },
-                }
+            Relay_entry.objects.filter(event_id__in=relay_event_ids).update(
+                heat_number=None, lane_number=None
             )
-            lane_counter += 1
 
-        for i in range(ending_lane_number + 1, total_lanes + 1):
-            heat_seeding_data["lanes_data"].append(
-                {"lane_number": i, "entry_data": None}
-            )
+        forget_models("Event", event_ids)
+        forget_models("Individual_entry")
+        forget_models("Relay_entry")
 
-    else:
+        return {event.meet_id for event in events_list}
+    except Exception as err:
+        return Response(
+            "heat sheet invalidation failed",
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+# ~ request-scoped deferral:
+#   $ views record invalidated events and changed meets while they run
+#   $ API_view.finalize_response flushes them inside the write request's transaction
+#   ! each event is cleared at most once and each meet version bumped once per request
+
+
+def get_deferred_changes(request):
+    if getattr(request, "deferred_changes", None) is None:
+        request.deferred_changes = {
+            "events_to_invalidate": {},
+            "changed_meet_ids": set(),
+        }
+
+    return request.deferred_changes
+
+
+def defer_event_seeding_invalidation(request, event_object):
+    defer_events_seeding_invalidation(request, [event_object])
+
+
+def defer_events_seeding_invalidation(request, events_list):
+    deferred_changes = get_deferred_changes(request)
+
+    for event in events_list:
+        # ~ data already invalidated -> nothing to clear
+        if event.total_heats is None:
+            continue
+
+        deferred_changes["events_to_invalidate"][event.pk] = event
+        # ! in-memory event already reflects the pending invalidation
+        event.total_heats = None
+
+
+def defer_meet_version_bump(request, meet_id):
+    get_deferred_changes(request)["changed_meet_ids"].add(meet_id)
+
+
+def flush_deferred_changes(request):
+    deferred_changes = getattr(request, "deferred_changes", None)
+    if deferred_changes is None:
+        return None
+    request.deferred_changes = None
+
+    cleared_meet_ids = clear_events_seeding(
+        list(deferred_changes["events_to_invalidate"].values())
+    )
+    # ? internal error invalidating event seeding
+    if isinstance(cleared_meet_ids, Response):
+        return cleared_meet_ids
+
+    # ~ sorted -> concurrent requests lock meet rows in the same order
+    for meet_id in sorted(deferred_changes["changed_meet_ids"] | cleared_meet_ids):
+        bump_meet_version(meet_id)
+
+    return None
+
+
+def assign_event_seeding(options, entries_list, lanes_per_heat):
+    # ! entries_list must be ordered by seed_time; no database access happens here
+    try:
+        heat_numbers, lane_numbers, total_heats = seeding.compute_event_seeding(
+            [entry.seed_time for entry in entries_list], lanes_per_heat, options
+        )
+    except ValueError as err:
+        # ? invalid seeding options
+        return Response(str(err), status=status.HTTP_400_BAD_REQUEST)
+
+    for entry, heat_number, lane_number in zip(
+        entries_list, heat_numbers, lane_numbers
+    ):
+        entry.heat_number = heat_number
+        entry.lane_number = lane_number
+
+    return total_heats
+
+
+def generate_event_seeding(options, event_object: Event):
+    # * get entries of event
+    if event_object.is_relay:
+        entries_list = list(
+            Relay_entry.objects.filter(event_id=event_object.pk).order_by("seed_time")
+        )
+    else:
+        entries_list = list(
+            Individual_entry.objects.filter(event_id=event_object.pk).order_by(
+                "seed_time"
+            )
+        )
+
+    total_heats = assign_event_seeding(
+        options, entries_list, event_object.session.pool.lanes
+    )
+    # ? invalid seeding options
+    if isinstance(total_heats, Response):
+        return total_heats
+
+    previous_total_heats = event_object.total_heats
+    event_object.total_heats = total_heats
+
+    # * save event and entry seeding data
+    try:
+        event_object.full_clean()
+        validate_seeding_fields(entries_list, SEEDING_FIELDS)
+
+        with transaction.atomic():
+            event_object.save(update_fields=["total_heats"])
+            save_entries_seeding(event_object.is_relay, entries_list)
+
+        # ~ event_object may be another instance than the one in the map
+        forget_models("Event", [event_object.pk])
+
+        bump_meet_version(event_object.meet_id)
+        return True
+    except:
+        # ! database changes were rolled back by the transaction
+        event_object.total_heats = previous_total_heats
+
+        # ? error saving event and entries
+        return Response(
+            "error saving event and entries",
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+def get_events_entries_snapshot(events_list):
+    entries_of_event = {event.pk: [] for event in events_list}
+
+    individual_event_ids = [event.pk for event in events_list if not event.is_relay]
+    relay_event_ids = [event.pk for event in events_list if event.is_relay]
+
+    for entry in Individual_entry.objects.filter(
+        event_id__in=individual_event_ids
+    ).order_by("event_id", "seed_time"):
+        entries_of_event[entry.event_id].append(entry)
+
+    for entry in Relay_entry.objects.filter(event_id__in=relay_event_ids).order_by(
+        "event_id", "seed_time"
+    ):
+        entries_of_event[entry.event_id].append(entry)
+
+    return entries_of_event
+
+
+def time_event_seeding(options, entries_list, lanes_per_heat):
+    start_time = time.perf_counter()
+    total_heats = assign_event_seeding(options, entries_list, lanes_per_heat)
+    return total_heats, (time.perf_counter() - start_time) * 1000
+
+
+def generate_events_seeding(options, events_list):
+    # ! events_list should select_related("session__pool") to avoid lazy pool loads
+    events_list = list(events_list)
+
+    # * snapshot entries and lane counts up front -> seeding never touches the database
+    entries_of_event = get_events_entries_snapshot(events_list)
+    lanes_of_event = {event.pk: event.session.pool.lanes for event in events_list}
+
+    # * assign heats and lanes event by event
+    #   ! seeding is CPU-bound Python -> threads would only add overhead under the GIL
+    seeding_results = [
+        time_event_seeding(
+            options, entries_of_event[event.pk], lanes_of_event[event.pk]
+        )
+        for event in events_list
+    ]
+
+    previous_total_heats = {event.pk: event.total_heats for event in events_list}
+    seeding_timings = []
+    for event, (total_heats, seeding_ms) in zip(events_list, seeding_results):
+        # ? invalid seeding options
+        if isinstance(total_heats, Response):
+            return total_heats
+
+        event.total_heats = total_heats
+        seeding_timings.append(
+            {"event_id": event.pk, "seeding_ms": round(seeding_ms, 3)}
+        )
+
+    individual_entries = [
+        entry
+        for event in events_list
+        if not event.is_relay
+        for entry in entries_of_event[event.pk]
+    ]
+    relay_entries = [
+        entry
+        for event in events_list
+        if event.is_relay
+        for entry in entries_of_event[event.pk]
+    ]
+
+    # * save all events and entries seeding data at once
+    try:
+        validate_seeding_fields(events_list, ["total_heats"])
+        validate_seeding_fields(individual_entries, SEEDING_FIELDS)
+        validate_seeding_fields(relay_entries, SEEDING_FIELDS)
+
+        with transaction.atomic():
+            Event.objects.bulk_update(events_list, ["total_heats"], batch_size=500)
+            forget_models("Event", [event.pk for event in events_list])
+            save_entries_seeding(False, individual_entries)
+            save_entries_seeding(True, relay_entries)
+
+        for meet_id in {event.meet_id for event in events_list}:
+            bump_meet_version(meet_id)
+
+        return seeding_timings
+    except:
+        # ! database changes were rolled back by the transaction
+        for event in events_list:
+            event.total_heats = previous_total_heats[event.pk]
+
+        # ? error saving events and entries
+        return Response(
+            "error saving events and entries",
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+def validate_seeding_fields(model_objects, field_names):
+    if len(model_objects) == 0:
+        return None
+
+    # * only validate seeding fields -> avoids per-object FK lookups
+    excluded_fields = [
+        field.name
+        for field in model_objects[0]._meta.fields
+        if field.name not in field_names
+    ]
+
+    for model_object in model_objects:
+        model_object.clean_fields(exclude=excluded_fields)
+
+    return None
+
+
+def save_entries_seeding(is_relay, entries_list):
+    if is_relay:
+        Relay_entry.objects.bulk_update(entries_list, SEEDING_FIELDS, batch_size=500)
+    else:
+        Individual_entry.objects.bulk_update(
+            entries_list, SEEDING_FIELDS, batch_size=500
+        )
+
+    # ! entries_list was fetched apart from the map -> mapped copies are stale
+    forget_models(
+        "Relay_entry" if is_relay else "Individual_entry",
+        [entry.pk for entry in entries_list],
+    )
+
+
+def build_heat_seeding_data(heat_number, lane_entries, total_lanes):
+    # ~ lane_entries: list of (lane_number, entry_data) ordered by lane_number
+    heat_seeding_data = {"heat_number": heat_number, "lanes_data": []}
+
+    starting_lane_number = lane_entries[0][0]
+    ending_lane_number = lane_entries[-1][0]
+
+    for i in range(1, starting_lane_number):
+        heat_seeding_data["lanes_data"].append({"lane_number": i, "entry_data": None})
+
+    lane_counter = starting_lane_number
+    for _, entry_data in lane_entries:
+        heat_seeding_data["lanes_data"].append(
+            {
+                "lane_number": lane_counter,
+                "entry_data": entry_data,
+            }
+        )
+        lane_counter += 1
+
+    for i in range(ending_lane_number + 1, total_lanes + 1):
+        heat_seeding_data["lanes_data"].append({"lane_number": i, "entry_data": None})
+
+    return heat_seeding_data
+
+
+def get_heat_seeding_data(event_object, heat_number):
+    if event_object.is_relay:
+        entries_list = list(
+            Relay_entry.objects.filter(
+                event_id=event_object.pk, heat_number=heat_number
+            ).order_by("lane_number")
+        )
+
+        lane_entries = [
+            (
+                entry.lane_number,
+                {
+                    "entry_id": entry.pk,
+                    "entry_name": get_relay_participants_names(entry),
+                    "entry_team": list(entry.swimmers.all())[0].team.name,
+                    "entry_seed_time": entry.seed_time,
+                },
+            )
+            for entry in entries_list
+        ]
+
+    else:
         entries_list = list(
             Individual_entry.objects.filter(
                 event_id=event_object.pk, heat_number=heat_number
             ).order_by("lane_number")
         )
 
-        starting_lane_number = entries_list[0].lane_number
-        ending_lane_number = entries_list[-1].lane_number
-        total_lanes = event_object.session.pool.lanes
+        lane_entries = [
+            (
+                entry.lane_number,
+                {
+                    "entry_id": entry.pk,
+                    "entry_name": get_swimmer_name(entry.swimmer),
+                    "entry_team": entry.swimmer.team.name,
+                    "entry_seed_time": entry.seed_time,
+                },
+            )
+            for entry in entries_list
+        ]
+
+    return build_heat_seeding_data(
+        heat_number, lane_entries, event_object.session.pool.lanes
+    )
+
+
+def get_meet_seeding_snapshot(meet_object):
+    # ! loads every seeding-related row of a meet in a fixed number of queries
+    sessions_list = list(
+        Session.objects.filter(meet_id=meet_object.pk).order_by(
+            "begin_time", "end_time", "name"
+        )
+    )
+
+    events_of_session = {session.pk: [] for session in sessions_list}
+    events_list = (
+        Event.objects.filter(meet_id=meet_object.pk)
+        .select_related("session__pool")
+        .order_by("order_in_session")
+    )
+    for event in events_list:
+        events_of_session[event.session_id].append(event)
+
+    # * group seeded entries by (event, heat), ordered by lane
+    heat_entries = {}
+
+    individual_entries = (
+        Individual_entry.objects.filter(
+            meet_id=meet_object.pk, heat_number__isnull=False
+        )
+        .select_related("swimmer__team")
+        .order_by("event_id", "heat_number", "lane_number")
+    )
+    for entry in individual_entries:
+        heat_entries.setdefault((entry.event_id, entry.heat_number), []).append(
+            (
+                entry.lane_number,
+                {
+                    "entry_id": entry.pk,
+                    "entry_name": get_swimmer_name(entry.swimmer),
+                    "entry_team": entry.swimmer.team.name,
+                    "entry_seed_time": entry.seed_time,
+                },
+            )
+        )
 
-        for i in range(1, starting_lane_number):
-            heat_seeding_data["lanes_data"].append(
-                {"lane_number": i, "entry_data": None}
+    relay_entries = (
+        Relay_entry.objects.filter(
+            meet_id=meet_object.pk, heat_number__isnull=False
+        )
+        .prefetch_related(
+            Prefetch(
+                "relay_assignments",
+                queryset=Relay_assignment.objects.select_related(
+                    "swimmer__team"
+                ).order_by("order_in_relay"),
             )
+        )
+        .order_by("event_id", "heat_number", "lane_number")
+    )
+    for entry in relay_entries:
+        swimmers_list = [
+            assignment.swimmer for assignment in entry.relay_assignments.all()
+        ]
+        heat_entries.setdefault((entry.event_id, entry.heat_number), []).append(
+            (
+                entry.lane_number,
+                {
+                    "entry_id": entry.pk,
+                    "entry_name": get_swimmers_list_names(swimmers_list),
+                    "entry_team": swimmers_list[0].team.name,
+                    "entry_seed_time": entry.seed_time,
+                },
+            )
+        )
+
+    return {
+        "sessions_list": sessions_list,
+        "events_of_session": events_of_session,
+        "heat_entries": heat_entries,
+    }
+
+
+def build_meet_sessions_seeding_data(seeding_snapshot, include_seeding_full):
+    sessions_data = []
+    meet_seeding_full = True
+
+    for session_number, session in enumerate(seeding_snapshot["sessions_list"], 1):
+        session_seeding_full = True
+        events_data = []
+        for event in seeding_snapshot["events_of_session"][session.pk]:
+            if event.total_heats == None:
+                session_seeding_full = False
+                events_data.append(
+                    {
+                        "event_id": event.pk,
+                        "event_name": get_event_name(event),
+                        "event_number": event.order_in_session,
+                        "event_is_relay": event.is_relay,
+                        "heats_data": None,
+                    }
+                )
+                continue
+
+            total_lanes = event.session.pool.lanes
+            heats_data = []
+            for i in range(1, event.total_heats + 1):
+                heats_data.append(
+                    build_heat_seeding_data(
+                        i,
+                        seeding_snapshot["heat_entries"].get((event.pk, i), []),
+                        total_lanes,
+                    )
+                )
 
-        lane_counter = starting_lane_number
-        for entry in entries_list:
-            heat_seeding_data["lanes_data"].append(
+            events_data.append(
                 {
-                    "lane_number": lane_counter,
-                    "entry_data": {
-                        "entry_id": entry.pk,
-                        "entry_name": get_swimmer_name(entry.swimmer),
-                        "entry_team": entry.swimmer.team.name,
-                        "entry_seed_time": entry.seed_time,
-                    },
+                    "event_id": event.pk,
+                    "event_name": get_event_name(event),
+                    "event_number": event.order_in_session,
+                    "event_is_relay": event.is_relay,
+                    "heats_data": heats_data,
                 }
             )
-            lane_counter += 1
 
-        for i in range(ending_lane_number + 1, total_lanes + 1):
-            heat_seeding_data["lanes_data"].append(
-                {"lane_number": i, "entry_data": None}
-            )
+        if session_seeding_full == False:
+            meet_seeding_full = False
 
-    return heat_seeding_data
+        session_data = {
+            "session_id": session.pk,
+            "session_name": session.name,
+            "session_number": session_number,
+        }
+        if include_seeding_full:
+            session_data["session_seeding_full"] = session_seeding_full
+        session_data["events_data"] = events_data
+
+        sessions_data.append(session_data)
+
+    return sessions_data, meet_seeding_full
 
 
 def generate_session_number_map(meet_object):
@@ -1013,139 +1831,30 @@ def get_seeding_data(model_type, model_object):
 
         match (model_type):
             case "Overview":
-                session_number_map = generate_session_number_map(model_object)
+                seeding_snapshot = get_meet_seeding_snapshot(model_object)
+                sessions_data, meet_seeding_full = build_meet_sessions_seeding_data(
+                    seeding_snapshot, True
+                )
 
-                seeding_data = {
+                return {
                     "meet_id": model_object.pk,
                     "meet_name": model_object.name,
-                    "meet_seeding_full": True,
-                    "sessions_data": [],
+                    "meet_seeding_full": meet_seeding_full,
+                    "sessions_data": sessions_data,
                 }
 
-                sessions_list = list(
-                    Session.objects.filter(meet_id=model_object.pk).order_by(
-                        "begin_time", "end_time", "name"
-                    )
-                )
-
-                meet_seeding_full = True
-                for session in sessions_list:
-                    events_list = list(
-                        Event.objects.filter(session_id=session.pk).order_by(
-                            "order_in_session"
-                        )
-                    )
-
-                    session_seeding_full = True
-                    events_data = []
-                    for event in events_list:
-                        if event.total_heats == None:
-                            session_seeding_full = False
-                            events_data.append(
-                                {
-                                    "event_id": event.pk,
-                                    "event_name": get_event_name(event),
-                                    "event_number": event.order_in_session,
-                                    "event_is_relay": event.is_relay,
-                                    "heats_data": None,
-                                }
-                            )
-                            continue
-
-                        num_heats = event.total_heats
-                        heats_data = []
-                        for i in range(1, num_heats + 1):
-                            heats_data.append(get_heat_seeding_data(event, i))
-
-                        events_data.append(
-                            {
-                                "event_id": event.pk,
-                                "event_name": get_event_name(event),
-                                "event_number": event.order_in_session,
-                                "event_is_relay": event.is_relay,
-                                "heats_data": heats_data,
-                            }
-                        )
-
-                    if session_seeding_full == False:
-                        meet_seeding_full = False
-
-                    seeding_data["sessions_data"].append(
-                        {
-                            "session_id": session.pk,
-                            "session_name": session.name,
-                            "session_number": session_number_map[session.pk],
-                            "session_seeding_full": session_seeding_full,
-                            "events_data": events_data,
-                        }
-                    )
-
-                seeding_data["meet_seeding_full"] = meet_seeding_full
-
-                return seeding_data
-
             case "Meet":
-                session_number_map = generate_session_number_map(model_object)
+                seeding_snapshot = get_meet_seeding_snapshot(model_object)
+                sessions_data, _ = build_meet_sessions_seeding_data(
+                    seeding_snapshot, False
+                )
 
-                seeding_data = {
+                return {
                     "meet_id": model_object.pk,
                     "meet_name": model_object.name,
-                    "sessions_data": [],
+                    "sessions_data": sessions_data,
                 }
 
-                sessions_list = list(
-                    Session.objects.filter(meet_id=model_object.pk).order_by(
-                        "begin_time", "end_time", "name"
-                    )
-                )
-
-                for session in sessions_list:
-                    events_list = list(
-                        Event.objects.filter(session_id=session.pk).order_by(
-                            "order_in_session"
-                        )
-                    )
-
-                    events_data = []
-                    for event in events_list:
-                        if event.total_heats == None:
-                            events_data.append(
-                                {
-                                    "event_id": event.pk,
-                                    "event_name": get_event_name(event),
-                                    "event_number": event.order_in_session,
-                                    "event_is_relay": event.is_relay,
-                                    "heats_data": None,
-                                }
-                            )
-                            continue
-
-                        num_heats = event.total_heats
-                        heats_data = []
-                        for i in range(1, num_heats + 1):
-                            heats_data.append(get_heat_seeding_data(event, i))
-
-                        events_data.append(
-                            {
-                                "event_id": event.pk,
-                                "event_name": get_event_name(event),
-                                "event_number": event.order_in_session,
-                                "event_is_relay": event.is_relay,
-                                "heats_data": heats_data,
-                            }
-                        )
-
-                    seeding_data["sessions_data"].append(
-                        {
-                            "session_id": session.pk,
-                            "session_name": session.name,
-                            "session_number": session_number_map[session.pk],
-                            "events_data": events_data,
-                        }
-                    )
-
-                return seeding_data
-
             case "Pool":
                 session_number_map = generate_session_number_map(model_object.meet)
 
@@ -1510,283 +2219,891 @@ def get_seeding_data(model_type, model_object):
         )
 
 
+def get_cached_seeding_data(model_type, model_object, meet_id):
+    # ! key includes the meet version -> any bump makes older payloads unreachable
+    #   ~ meet was loaded by the access check -> identity map hit, no extra query
+    meet_of_id = get_model_of_id("Meet", meet_id)
+    # ? no meet of meet_id exists
+    if isinstance(meet_of_id, Response):
+        return meet_of_id
+
+    heat_sheet_key = caching.get_heat_sheet_key(
+        meet_id, meet_of_id.version, model_type, model_object.pk
+    )
+
+    seeding_data = caching.get_cached_heat_sheet(heat_sheet_key)
+    if seeding_data is not None:
+        return seeding_data
+
+    seeding_data = get_seeding_data(model_type, model_object)
+    # ~ errors are never cached
+    if not isinstance(seeding_data, Response):
+        caching.set_cached_heat_sheet(heat_sheet_key, seeding_data)
+
+    return seeding_data
+
+
+# ! MEET EXPORT
+
+# ~ rows fetched per round-trip by the server-side cursors of an export
+EXPORT_CHUNK_SIZE = 2000
+
+
+def get_meet_export_query_sets(meet_id):
+    # ~ parents before children -> an import can replay the lines in order
+    return [
+        Meet.objects.filter(id=meet_id),
+        Pool.objects.filter(meet_id=meet_id).order_by("id"),
+        Session.objects.filter(meet_id=meet_id).order_by("id"),
+        Event.objects.filter(meet_id=meet_id).order_by("id"),
+        Team.objects.filter(meet_id=meet_id).order_by("id"),
+        Swimmer.objects.filter(meet_id=meet_id).order_by("id"),
+        Individual_entry.objects.filter(meet_id=meet_id).order_by("id"),
+        Relay_entry.objects.filter(meet_id=meet_id).order_by("id"),
+        Relay_assignment.objects.filter(meet_id=meet_id).order_by("id"),
+    ]
+
+
+def iter_meet_export_lines(meet_id):
+    # * one serialize("json") style model dict per NDJSON line
+    renderer = Fast_JSON_renderer()
+    is_outermost = not connection.in_atomic_block
+
+    # ~ one transaction for every table -> writes mid-stream cannot split the meet
+    with transaction.atomic():
+        # ~ postgres READ COMMITTED snapshots per statement -> pin one for all tables
+        if is_outermost and connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+
+        for query_set in get_meet_export_query_sets(meet_id):
+            fields = [
+                field.attname if field.remote_field is None else field.attname[:-3]
+                for field in query_set.model._meta.local_fields
+                if not field.primary_key
+            ]
+
+            for model_JSON in iter_serialized_models(
+                query_set.iterator(chunk_size=EXPORT_CHUNK_SIZE), fields
+            ):
+                yield renderer.render(model_JSON) + b"\n"
+
+
+# ! MEET IMPORT
+
+# ~ imports read the NDJSON export shape -> see iter_meet_export_lines
+IMPORT_BATCH_SIZE = 1000
+
+# ~ same duplicate rules as get_all_duplicates, applied to the rows of one file
+IMPORT_DUPLICATE_KEYS = {
+    "Pool": lambda pool: (
+        pool.name,
+        pool.lanes,
+        pool.side_length,
+        pool.measure_unit,
+    ),
+    "Session": lambda session: (session.pool_id, session.name),
+    "Event": lambda event: (
+        event.stroke,
+        event.distance,
+        event.is_relay,
+        event.swimmers_per_entry,
+        event.stage,
+        event.competing_gender,
+        event.competing_max_age,
+        event.competing_min_age,
+    ),
+    "Team": lambda team: (team.name, team.acronym),
+    "Swimmer": lambda swimmer: (
+        swimmer.team_id,
+        swimmer.first_name,
+        swimmer.last_name,
+        swimmer.age,
+        swimmer.gender,
+    ),
+    "Individual_entry": lambda entry: (entry.event_id, entry.swimmer_id),
+}
+
+
+def get_import_error(line_number, model_type, row, message):
+    return {
+        "line": line_number,
+        "model": model_type,
+        "pk": row.get("pk") if isinstance(row, dict) else None,
+        "error": message,
+    }
+
+
+def parse_meet_import_lines(import_lines):
+    # * group rows by model type -> per-line errors for unreadable rows
+    model_types = {
+        str(model_class._meta): model_type
+        for model_type, model_class in MODEL_CLASSES.items()
+        if model_type != "Host"
+    }
+    import_rows = {model_type: [] for model_type in model_types.values()}
+    import_errors = []
+    pk_line_numbers = {model_type: {} for model_type in model_types.values()}
+
+    for line_number, line in enumerate(import_lines, start=1):
+        if len(line.strip()) == 0:
+            continue
+
+        try:
+            row = json.loads(line)
+        except ValueError:
+            import_errors.append(
+                get_import_error(line_number, None, None, "line is not valid JSON")
+            )
+            continue
+
+        # ? not a serialized model of a meet
+        if (
+            not isinstance(row, dict)
+            or row.get("model") not in model_types
+            or not isinstance(row.get("fields"), dict)
+        ):
+            import_errors.append(
+                get_import_error(line_number, None, row, "line is not a meet model")
+            )
+            continue
+
+        # ! rows refer to each other by export pk -> every row needs its own
+        model_type = model_types[row["model"]]
+        pk = row.get("pk")
+        # ? no integer pk
+        if not isinstance(pk, int) or isinstance(pk, bool):
+            import_errors.append(
+                get_import_error(
+                    line_number, model_type, row, "pk is missing or not an integer"
+                )
+            )
+            continue
+        # ? pk of an earlier row of the same model
+        if pk in pk_line_numbers[model_type]:
+            import_errors.append(
+                get_import_error(
+                    line_number,
+                    model_type,
+                    row,
+                    f"pk already used on line {pk_line_numbers[model_type][pk]}",
+                )
+            )
+            continue
+
+        pk_line_numbers[model_type][pk] = line_number
+        import_rows[model_type].append((line_number, row))
+
+    return import_rows, import_errors
+
+
+def build_import_object(model_type, row, imported_ids):
+    # ~ foreign keys point at export pks -> swapped for the pks of imported rows
+    model_class = MODEL_CLASSES[model_type]
+    model_object = model_class()
+    foreign_key_names = []
+
+    for field in model_class._meta.local_fields:
+        if field.primary_key:
+            continue
+
+        # ! imported rows always belong to the imported meet
+        #   -> also fills the denormalized meet of exports made before it existed
+        if field.name == "meet":
+            foreign_key_names.append(field.name)
+            setattr(
+                model_object, field.attname, next(iter(imported_ids["Meet"].values()))
+            )
+            continue
+
+        if field.name not in row["fields"]:
+            continue
+
+        value = row["fields"][field.name]
+        if field.remote_field is None:
+            setattr(model_object, field.attname, field.to_python(value))
+            continue
+
+        foreign_key_names.append(field.name)
+        if field.name == "host":
+            continue  # ! imported meets always belong to the importing host
+
+        parent_type = field.related_model.__name__
+        if value not in imported_ids[parent_type]:
+            raise ValidationError(f"{field.name} {value} was not imported")
+        setattr(model_object, field.attname, imported_ids[parent_type][value])
+
+    # * same field validators as full_clean -> parents are known to exist
+    model_object.full_clean(exclude=foreign_key_names)
+
+    return model_object
+
+
+def check_import_object(model_type, model_object, imported_objects):
+    # * rules enforced by the create views
+    match model_type:
+        case "Event":
+            if (
+                model_object.competing_max_age is not None
+                and model_object.competing_min_age is not None
+                and model_object.competing_max_age < model_object.competing_min_age
+            ):
+                return "maximum age less than minimum age"
+            if (
+                model_object.is_relay
+                and model_object.stroke == "Medley"
+                and model_object.swimmers_per_entry != 4
+            ):
+                return "swimmers per entry of medley relay is not 4"
+
+        case "Individual_entry":
+            event_object = imported_objects["Event"][model_object.event_id]
+            if event_object.is_relay:
+                return "individual entry of a relay event"
+            check_compatibility = validate_swimmer_against_event(
+                imported_objects["Swimmer"][model_object.swimmer_id], event_object
+            )
+            if isinstance(check_compatibility, Response):
+                return check_compatibility.data
+
+        case "Relay_entry":
+            if not imported_objects["Event"][model_object.event_id].is_relay:
+                return "relay entry of an individual event"
+
+    return None
+
+
+def import_model_rows(model_type, import_rows, import_report, imported_ids, imported_objects):
+    # * validate in memory, collapse duplicates, then insert in batches
+    new_objects = []
+    new_export_ids = []
+    duplicate_export_ids = []
+    first_rows = {}
+    get_duplicate_key = IMPORT_DUPLICATE_KEYS.get(model_type)
+
+    for line_number, row in import_rows:
+        try:
+            model_object = build_import_object(model_type, row, imported_ids)
+        except ValidationError as err:
+            import_report["errors"].append(
+                get_import_error(line_number, model_type, row, "; ".join(err.messages))
+            )
+            continue
+        except Exception as err:
+            import_report["errors"].append(
+                get_import_error(line_number, model_type, row, str(err))
+            )
+            continue
+
+        check_result = check_import_object(model_type, model_object, imported_objects)
+        # ? row breaks a rule of the create views
+        if check_result is not None:
+            import_report["errors"].append(
+                get_import_error(line_number, model_type, row, check_result)
+            )
+            continue
+
+        if get_duplicate_key is not None:
+            duplicate_key = get_duplicate_key(model_object)
+            # ~ later duplicates merge into the first such row of the file
+            if duplicate_key in first_rows:
+                first_line_number, first_index = first_rows[duplicate_key]
+                duplicate_export_ids.append((row.get("pk"), first_index))
+                import_report["duplicates"].append(
+                    get_import_error(
+                        line_number,
+                        model_type,
+                        row,
+                        f"duplicate of line {first_line_number}",
+                    )
+                )
+                continue
+            first_rows[duplicate_key] = (line_number, len(new_objects))
+
+        new_objects.append(model_object)
+        new_export_ids.append(row.get("pk"))
+
+    MODEL_CLASSES[model_type].objects.bulk_create(
+        new_objects, batch_size=IMPORT_BATCH_SIZE
+    )
+
+    # * export pks -> imported pks
+    for export_id, model_object in zip(new_export_ids, new_objects):
+        imported_ids[model_type][export_id] = model_object.pk
+        imported_objects[model_type][model_object.pk] = model_object
+    for export_id, first_index in duplicate_export_ids:
+        imported_ids[model_type][export_id] = new_objects[first_index].pk
+
+    import_report["imported"][model_type] = len(new_objects)
+
+
+def renumber_imported_events(event_objects):
+    # ! skipped and merged event rows leave gaps -> each session restarts at 1
+    events_of_session = collections.defaultdict(list)
+    for event in event_objects:
+        events_of_session[event.session_id].append(event)
+
+    renumbered_events = []
+    for session_events in events_of_session.values():
+        # ~ pks follow file order -> ties keep the order of the file
+        session_events.sort(key=lambda event: (event.order_in_session, event.pk))
+        for order_number, event in enumerate(session_events, start=1):
+            if event.order_in_session != order_number:
+                event.order_in_session = order_number
+                renumbered_events.append(event)
+
+    Event.objects.bulk_update(
+        renumbered_events, ["order_in_session"], batch_size=IMPORT_BATCH_SIZE
+    )
+
+
+def import_relay_rows(import_rows, import_report, imported_ids, imported_objects):
+    # ~ relay entries are only valid together with their assignments
+    relay_entries = {}
+    for line_number, row in import_rows["Relay_entry"]:
+        try:
+            relay_entry = build_import_object("Relay_entry", row, imported_ids)
+            check_result = check_import_object(
+                "Relay_entry", relay_entry, imported_objects
+            )
+            if check_result is not None:
+                raise ValidationError(check_result)
+        except ValidationError as err:
+            import_report["errors"].append(
+                get_import_error(line_number, "Relay_entry", row, "; ".join(err.messages))
+            )
+            continue
+        except Exception as err:
+            import_report["errors"].append(
+                get_import_error(line_number, "Relay_entry", row, str(err))
+            )
+            continue
+
+        relay_entries[row.get("pk")] = (line_number, row, relay_entry, [])
+
+    # * attach assignments to their relay entries
+    assignment_ids = {"Relay_entry": {export_id: export_id for export_id in relay_entries}}
+    assignment_ids["Swimmer"] = imported_ids["Swimmer"]
+    assignment_ids["Meet"] = imported_ids["Meet"]
+    for line_number, row in import_rows["Relay_assignment"]:
+        try:
+            relay_assignment = build_import_object(
+                "Relay_assignment", row, assignment_ids
+            )
+        except ValidationError as err:
+            import_report["errors"].append(
+                get_import_error(
+                    line_number, "Relay_assignment", row, "; ".join(err.messages)
+                )
+            )
+            continue
+        except Exception as err:
+            import_report["errors"].append(
+                get_import_error(line_number, "Relay_assignment", row, str(err))
+            )
+            continue
+
+        relay_entries[relay_assignment.relay_entry_id][3].append(relay_assignment)
+
+    # * same rules as Relay_entry_view.post -> checked set-wise per event
+    new_relay_entries = []
+    new_relay_assignments = []
+    event_swimmer_ids = set()
+    for line_number, row, relay_entry, relay_assignments in relay_entries.values():
+        event_object = imported_objects["Event"][relay_entry.event_id]
+        swimmer_objects = [
+            imported_objects["Swimmer"][relay_assignment.swimmer_id]
+            for relay_assignment in relay_assignments
+        ]
+        swimmer_ids = [swimmer.pk for swimmer in swimmer_objects]
+        order_numbers = sorted(
+            relay_assignment.order_in_relay for relay_assignment in relay_assignments
+        )
+
+        if len(relay_assignments) != event_object.swimmers_per_entry:
+            check_result = "number of relay assignments does not match swimmers per entry"
+        elif order_numbers != list(range(1, len(relay_assignments) + 1)):
+            check_result = "relay assignment orders are not 1 through swimmers per entry"
+        elif len(set(swimmer_ids)) != len(swimmer_ids):
+            check_result = "duplicate swimmers exist inside relay"
+        elif len({swimmer.team_id for swimmer in swimmer_objects}) > 1:
+            check_result = "swimmers of different teams exist inside relay"
+        elif any(
+            isinstance(validate_swimmer_against_event(swimmer, event_object), Response)
+            for swimmer in swimmer_objects
+        ):
+            check_result = "swimmer and event are incompatible"
+        elif any(
+            (event_object.pk, swimmer_id) in event_swimmer_ids
+            for swimmer_id in swimmer_ids
+        ):
+            check_result = "swimmer already has a relay entry in this event"
+        else:
+            check_result = None
+
+        # ? relay entry and its assignments are skipped together
+        if check_result is not None:
+            import_report["errors"].append(
+                get_import_error(line_number, "Relay_entry", row, check_result)
+            )
+            continue
+
+        event_swimmer_ids.update(
+            (event_object.pk, swimmer_id) for swimmer_id in swimmer_ids
+        )
+        new_relay_entries.append(relay_entry)
+        new_relay_assignments.append(relay_assignments)
+
+    Relay_entry.objects.bulk_create(new_relay_entries, batch_size=IMPORT_BATCH_SIZE)
+    for relay_entry, relay_assignments in zip(new_relay_entries, new_relay_assignments):
+        imported_objects["Relay_entry"][relay_entry.pk] = relay_entry
+        for relay_assignment in relay_assignments:
+            relay_assignment.relay_entry_id = relay_entry.pk
+
+    new_relay_assignments = [
+        relay_assignment
+        for relay_assignments in new_relay_assignments
+        for relay_assignment in relay_assignments
+    ]
+    Relay_assignment.objects.bulk_create(
+        new_relay_assignments, batch_size=IMPORT_BATCH_SIZE
+    )
+
+    import_report["imported"]["Relay_entry"] = len(new_relay_entries)
+    import_report["imported"]["Relay_assignment"] = len(new_relay_assignments)
+
+
+def import_meet(import_lines, host_id, duplicate_handling):
+    import_rows, import_errors = parse_meet_import_lines(import_lines)
+    import_report = {"imported": {}, "duplicates": [], "errors": import_errors}
+
+    # ? an import creates exactly one meet
+    if len(import_rows["Meet"]) != 1:
+        return Response(
+            "import must contain exactly one meet",
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    imported_ids = {model_type: {} for model_type in MODEL_CLASSES}
+    imported_objects = {model_type: {} for model_type in MODEL_CLASSES}
+
+    with transaction.atomic():
+        # * create meet
+        meet_line_number, meet_row = import_rows["Meet"][0]
+        try:
+            new_meet = build_import_object("Meet", meet_row, imported_ids)
+            new_meet.host_id = host_id
+        except ValidationError as err:
+            return Response(
+                "; ".join(err.messages),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except Exception as err:
+            return Response(
+                str(err),
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # * handle any duplicates
+        handle_duplicates_result = handle_duplicates(duplicate_handling, "Meet", new_meet)
+        # ? error handling duplicates
+        if isinstance(handle_duplicates_result, Response):
+            return handle_duplicates_result
+
+        new_meet.save()
+        imported_ids["Meet"][meet_row.get("pk")] = new_meet.pk
+        import_report["imported"]["Meet"] = 1
+
+        # * create meet contents -> parents before children
+        for model_type in ("Pool", "Session", "Event", "Team", "Swimmer", "Individual_entry"):
+            import_model_rows(
+                model_type,
+                import_rows[model_type],
+                import_report,
+                imported_ids,
+                imported_objects,
+            )
+        import_relay_rows(import_rows, import_report, imported_ids, imported_objects)
+        renumber_imported_events(imported_objects["Event"].values())
+
+        # ! events that lost entries or merged the entries of several file events
+        #   no longer match the seeding of the file
+        file_event_ids = collections.defaultdict(set)
+        file_entry_counts = collections.Counter()
+        for model_type in ("Individual_entry", "Relay_entry"):
+            for _, row in import_rows[model_type]:
+                file_event_id = row["fields"].get("event")
+                event_id = imported_ids["Event"].get(file_event_id)
+                if not isinstance(file_event_id, int) or event_id is None:
+                    continue
+
+                file_event_ids[event_id].add(file_event_id)
+                file_entry_counts[event_id] += 1
+
+        imported_entry_counts = collections.Counter(
+            entry.event_id
+            for model_type in ("Individual_entry", "Relay_entry")
+            for entry in imported_objects[model_type].values()
+        )
+        cleared_meet_ids = clear_events_seeding(
+            [
+                imported_objects["Event"][event_id]
+                for event_id, entry_count in file_entry_counts.items()
+                if len(file_event_ids[event_id]) > 1
+                or imported_entry_counts[event_id] != entry_count
+            ]
+        )
+        # ? internal error invalidating event seeding
+        if isinstance(cleared_meet_ids, Response):
+            transaction.set_rollback(True)
+            return cleared_meet_ids
+
+        # * meet times follow its imported sessions
+        session_objects = imported_objects["Session"].values()
+        if len(session_objects) > 0:
+            new_meet.begin_time = min(session.begin_time for session in session_objects)
+            new_meet.end_time = max(session.end_time for session in session_objects)
+        else:
+            new_meet.begin_time = None
+            new_meet.end_time = None
+        new_meet.save()
+
+    return new_meet, import_report
+
+
 # ! JSON SERIALIZERS
 
+JSON_ENCODER = DjangoJSONEncoder()
+
 
 def get_JSON_multiple(model_type, model_objects, get_inner_JSON):
     match model_type:
         case "Host":
-            return json.loads(
-                serialize(
-                    "json",
-                    model_objects,
-                    fields=[
-                        "first_name",
-                        "last_name",
-                        "prefix",
-                        "suffix",
-                        "middle_initials",
-                    ],
-                )
+            return serialize_models(
+                model_objects,
+                fields=[
+                    "first_name",
+                    "last_name",
+                    "prefix",
+                    "suffix",
+                    "middle_initials",
+                ],
             )
 
         case "Meet":
-            collective_JSON = json.loads(
-                serialize(
-                    "json",
-                    model_objects,
-                    fields=[
-                        "name",
-                        "begin_time",
-                        "end_time",
-                        "is_public",
-                        "host",
-                    ],
-                )
+            collective_JSON = serialize_models(
+                model_objects,
+                fields=[
+                    "name",
+                    "begin_time",
+                    "end_time",
+                    "is_public",
+                    "host",
+                ],
             )
 
             if get_inner_JSON:
+                hosts_JSON = get_JSON_map(
+                    "Host",
+                    [
+                        individual_JSON["fields"]["host"]
+                        for individual_JSON in collective_JSON
+                    ],
+                    False,
+                )
                 for individual_JSON in collective_JSON:
-                    individual_JSON["fields"]["host"] = get_JSON_single(
-                        "Host",
-                        Host.objects.get(id=individual_JSON["fields"]["host"]),
-                        False,
-                    )
+                    individual_JSON["fields"]["host"] = hosts_JSON[
+                        individual_JSON["fields"]["host"]
+                    ]
 
             return collective_JSON
 
         case "Pool":
-            collective_JSON = json.loads(
-                serialize(
-                    "json",
-                    model_objects,
-                    fields=[
-                        "name",
-                        "street_address",
-                        "city",
-                        "state",
-                        "country",
-                        "zipcode",
-                        "lanes",
-                        "side_length",
-                        "measure_unit",
-                        "meet",
-                    ],
-                )
+            collective_JSON = serialize_models(
+                model_objects,
+                fields=[
+                    "name",
+                    "street_address",
+                    "city",
+                    "state",
+                    "country",
+                    "zipcode",
+                    "lanes",
+                    "side_length",
+                    "measure_unit",
+                    "meet",
+                ],
             )
 
             if get_inner_JSON:
+                meets_JSON = get_JSON_map(
+                    "Meet",
+                    [
+                        individual_JSON["fields"]["meet"]
+                        for individual_JSON in collective_JSON
+                    ],
+                    False,
+                )
                 for individual_JSON in collective_JSON:
-                    individual_JSON["fields"]["meet"] = get_JSON_single(
-                        "Meet",
-                        Meet.objects.get(id=individual_JSON["fields"]["meet"]),
-                        False,
-                    )
+                    individual_JSON["fields"]["meet"] = meets_JSON[
+                        individual_JSON["fields"]["meet"]
+                    ]
 
             return collective_JSON
 
         case "Session":
-            collective_JSON = json.loads(
-                serialize(
-                    "json",
-                    model_objects,
-                    fields=[
-                        "name",
-                        "begin_time",
-                        "end_time",
-                        "meet",
-                        "pool",
-                    ],
-                )
+            collective_JSON = serialize_models(
+                model_objects,
+                fields=[
+                    "name",
+                    "begin_time",
+                    "end_time",
+                    "meet",
+                    "pool",
+                ],
             )
 
             if get_inner_JSON:
+                meets_JSON = get_JSON_map(
+                    "Meet",
+                    [
+                        individual_JSON["fields"]["meet"]
+                        for individual_JSON in collective_JSON
+                    ],
+                    False,
+                )
+                pools_JSON = get_JSON_map(
+                    "Pool",
+                    [
+                        individual_JSON["fields"]["pool"]
+                        for individual_JSON in collective_JSON
+                    ],
+                    False,
+                )
                 for individual_JSON in collective_JSON:
-                    individual_JSON["fields"]["meet"] = get_JSON_single(
-                        "Meet",
-                        Meet.objects.get(id=individual_JSON["fields"]["meet"]),
-                        False,
-                    )
-                    individual_JSON["fields"]["pool"] = get_JSON_single(
-                        "Pool",
-                        Pool.objects.get(id=individual_JSON["fields"]["pool"]),
-                        False,
-                    )
+                    individual_JSON["fields"]["meet"] = meets_JSON[
+                        individual_JSON["fields"]["meet"]
+                    ]
+                    individual_JSON["fields"]["pool"] = pools_JSON[
+                        individual_JSON["fields"]["pool"]
+                    ]
 
             return collective_JSON
 
         case "Event":
-            collective_JSON = json.loads(
-                serialize(
-                    "json",
-                    model_objects,
-                    fields=[
-                        "stroke",
-                        "distance",
-                        "is_relay",
-                        "swimmers_per_entry",
-                        "stage",
-                        "competing_gender",
-                        "competing_max_age",
-                        "competing_min_age",
-                        "order_in_session",
-                        "total_heats",
-                        "session",
-                    ],
-                )
+            collective_JSON = serialize_models(
+                model_objects,
+                fields=[
+                    "stroke",
+                    "distance",
+                    "is_relay",
+                    "swimmers_per_entry",
+                    "stage",
+                    "competing_gender",
+                    "competing_max_age",
+                    "competing_min_age",
+                    "order_in_session",
+                    "total_heats",
+                    "session",
+                ],
             )
 
             if get_inner_JSON:
+                sessions_JSON = get_JSON_map(
+                    "Session",
+                    [
+                        individual_JSON["fields"]["session"]
+                        for individual_JSON in collective_JSON
+                    ],
+                    True,
+                )
                 for individual_JSON in collective_JSON:
-                    individual_JSON["fields"]["session"] = get_JSON_single(
-                        "Session",
-                        Session.objects.get(id=individual_JSON["fields"]["session"]),
-                        True,
-                    )
+                    individual_JSON["fields"]["session"] = sessions_JSON[
+                        individual_JSON["fields"]["session"]
+                    ]
 
             return collective_JSON
 
         case "Team":
-            collective_JSON = json.loads(
-                serialize(
-                    "json",
-                    model_objects,
-                    fields=[
-                        "name",
-                        "acronym",
-                        "meet",
-                    ],
-                )
+            collective_JSON = serialize_models(
+                model_objects,
+                fields=[
+                    "name",
+                    "acronym",
+                    "meet",
+                ],
             )
 
             if get_inner_JSON:
+                meets_JSON = get_JSON_map(
+                    "Meet",
+                    [
+                        individual_JSON["fields"]["meet"]
+                        for individual_JSON in collective_JSON
+                    ],
+                    False,
+                )
                 for individual_JSON in collective_JSON:
-                    individual_JSON["fields"]["meet"] = get_JSON_single(
-                        "Meet",
-                        Meet.objects.get(id=individual_JSON["fields"]["meet"]),
-                        False,
-                    )
+                    individual_JSON["fields"]["meet"] = meets_JSON[
+                        individual_JSON["fields"]["meet"]
+                    ]
 
             return collective_JSON
 
         case "Swimmer":
-            collective_JSON = json.loads(
-                serialize(
-                    "json",
-                    model_objects,
-                    fields=[
-                        "first_name",
-                        "last_name",
-                        "prefix",
-                        "suffix",
-                        "middle_initials",
-                        "age",
-                        "gender",
-                        "meet",
-                        "team",
-                    ],
-                )
+            collective_JSON = serialize_models(
+                model_objects,
+                fields=[
+                    "first_name",
+                    "last_name",
+                    "prefix",
+                    "suffix",
+                    "middle_initials",
+                    "age",
+                    "gender",
+                    "meet",
+                    "team",
+                ],
             )
 
             if get_inner_JSON:
+                meets_JSON = get_JSON_map(
+                    "Meet",
+                    [
+                        individual_JSON["fields"]["meet"]
+                        for individual_JSON in collective_JSON
+                    ],
+                    False,
+                )
+                teams_JSON = get_JSON_map(
+                    "Team",
+                    [
+                        individual_JSON["fields"]["team"]
+                        for individual_JSON in collective_JSON
+                    ],
+                    False,
+                )
                 for individual_JSON in collective_JSON:
-                    individual_JSON["fields"]["meet"] = get_JSON_single(
-                        "Meet",
-                        Meet.objects.get(id=individual_JSON["fields"]["meet"]),
-                        False,
-                    )
-                    individual_JSON["fields"]["team"] = get_JSON_single(
-                        "Team",
-                        Team.objects.get(id=individual_JSON["fields"]["team"]),
-                        False,
-                    )
+                    individual_JSON["fields"]["meet"] = meets_JSON[
+                        individual_JSON["fields"]["meet"]
+                    ]
+                    individual_JSON["fields"]["team"] = teams_JSON[
+                        individual_JSON["fields"]["team"]
+                    ]
 
             return collective_JSON
 
         case "Individual_entry":
-            collective_JSON = json.loads(
-                serialize(
-                    "json",
-                    model_objects,
-                    fields=[
-                        "seed_time",
-                        "heat_number",
-                        "lane_number",
-                        "swimmer",
-                        "event",
-                    ],
-                )
+            collective_JSON = serialize_models(
+                model_objects,
+                fields=[
+                    "seed_time",
+                    "heat_number",
+                    "lane_number",
+                    "swimmer",
+                    "event",
+                ],
             )
 
             if get_inner_JSON:
+                swimmers_JSON = get_JSON_map(
+                    "Swimmer",
+                    [
+                        individual_JSON["fields"]["swimmer"]
+                        for individual_JSON in collective_JSON
+                    ],
+                    True,
+                )
+                events_JSON = get_JSON_map(
+                    "Event",
+                    [
+                        individual_JSON["fields"]["event"]
+                        for individual_JSON in collective_JSON
+                    ],
+                    False,
+                )
                 for individual_JSON in collective_JSON:
-                    individual_JSON["fields"]["swimmer"] = get_JSON_single(
-                        "Swimmer",
-                        Swimmer.objects.get(id=individual_JSON["fields"]["swimmer"]),
-                        True,
-                    )
-                    individual_JSON["fields"]["event"] = get_JSON_single(
-                        "Event",
-                        Event.objects.get(id=individual_JSON["fields"]["event"]),
-                        False,
-                    )
+                    individual_JSON["fields"]["swimmer"] = swimmers_JSON[
+                        individual_JSON["fields"]["swimmer"]
+                    ]
+                    individual_JSON["fields"]["event"] = events_JSON[
+                        individual_JSON["fields"]["event"]
+                    ]
 
             return collective_JSON
 
         case "Relay_entry":
-            collective_JSON = json.loads(
-                serialize(
-                    "json",
-                    model_objects,
-                    fields=[
-                        "seed_time",
-                        "heat_number",
-                        "lane_number",
-                        # swimmers => handled by relay_assignments,
-                        "relay_assignments",
-                        "event",
-                    ],
-                )
+            collective_JSON = serialize_models(
+                model_objects,
+                fields=[
+                    "seed_time",
+                    "heat_number",
+                    "lane_number",
+                    # swimmers => handled by relay_assignments,
+                    "relay_assignments",
+                    "event",
+                ],
             )
 
             if get_inner_JSON:
+                # * group all assignments of the listed entries by entry
+                assignments_JSON_of_entry = {
+                    individual_JSON["pk"]: [] for individual_JSON in collective_JSON
+                }
+                assignments_JSON = get_JSON_multiple(
+                    "Relay_assignment",
+                    Relay_assignment.objects.filter(
+                        relay_entry_id__in=assignments_JSON_of_entry.keys()
+                    ).order_by("id"),
+                    True,
+                )
+                for assignment_JSON in assignments_JSON:
+                    assignments_JSON_of_entry[
+                        assignment_JSON["fields"]["relay_entry"]
+                    ].append(assignment_JSON)
+
+                events_JSON = get_JSON_map(
+                    "Event",
+                    [
+                        individual_JSON["fields"]["event"]
+                        for individual_JSON in collective_JSON
+                    ],
+                    False,
+                )
                 for individual_JSON in collective_JSON:
-                    individual_JSON["fields"]["relay_assignments"] = get_JSON_multiple(
-                        "Relay_assignment",
-                        Relay_assignment.objects.filter(
-                            relay_entry_id=individual_JSON["pk"]
-                        ),
-                        True,
-                    )
-                    individual_JSON["fields"]["event"] = get_JSON_single(
-                        "Event",
-                        Event.objects.get(id=individual_JSON["fields"]["event"]),
-                        False,
+                    individual_JSON["fields"]["relay_assignments"] = (
+                        assignments_JSON_of_entry[individual_JSON["pk"]]
                     )
+                    individual_JSON["fields"]["event"] = events_JSON[
+                        individual_JSON["fields"]["event"]
+                    ]
 
             return collective_JSON
 
         case "Relay_assignment":
-            collective_JSON = json.loads(
-                serialize(
-                    "json",
-                    model_objects,
-                    fields=[
-                        "order_in_relay",
-                        "seed_relay_split",
-                        "swimmer",
-                        "relay_entry",
-                    ],
-                )
+            collective_JSON = serialize_models(
+                model_objects,
+                fields=[
+                    "order_in_relay",
+                    "seed_relay_split",
+                    "swimmer",
+                    "relay_entry",
+                ],
             )
 
             if get_inner_JSON:
+                swimmers_JSON = get_JSON_map(
+                    "Swimmer",
+                    [
+                        individual_JSON["fields"]["swimmer"]
+                        for individual_JSON in collective_JSON
+                    ],
+                    True,
+                )
                 for individual_JSON in collective_JSON:
-                    individual_JSON["fields"]["swimmer"] = get_JSON_single(
-                        "Swimmer",
-                        Swimmer.objects.get(id=individual_JSON["fields"]["swimmer"]),
-                        True,
-                    )
+                    individual_JSON["fields"]["swimmer"] = swimmers_JSON[
+                        individual_JSON["fields"]["swimmer"]
+                    ]
 
             return collective_JSON
 
@@ -1797,6 +3114,73 @@ def get_JSON_multiple(model_type, model_objects, get_inner_JSON):
             )
 
 
+def get_field_JSON_value(model_object, field):
+    value = field.value_from_object(model_object)
+
+    # * match serialize("json") -> non-primitive values become strings
+    if not is_protected_type(value):
+        return field.value_to_string(model_object)
+    if isinstance(value, (datetime.date, datetime.time, decimal.Decimal)):
+        return JSON_ENCODER.default(value)
+
+    return value
+
+
+def serialize_models(model_objects, fields):
+    # * builds serialize("json") style dicts without the JSON string round-trip
+    return list(iter_serialized_models(model_objects, fields))
+
+
+def iter_serialized_models(model_objects, fields):
+    # ~ generator form of serialize_models -> one model dict at a time
+    serialized_fields = None
+
+    for model_object in model_objects:
+        if serialized_fields is None:
+            serialized_fields = [
+                field
+                for field in model_object._meta.concrete_model._meta.local_fields
+                if field.serialize
+                and (
+                    field.attname if field.remote_field is None else field.attname[:-3]
+                )
+                in fields
+            ]
+
+        yield {
+            "model": str(model_object._meta),
+            "pk": get_field_JSON_value(model_object, model_object._meta.pk),
+            "fields": {
+                field.name: get_field_JSON_value(model_object, field)
+                for field in serialized_fields
+            },
+        }
+
+
+def get_JSON_map(model_type, model_ids, get_inner_JSON):
+    # * fetch each related model once -> id to JSON map
+    model_objects = []
+    unknown_ids = set()
+    for model_id in set(model_ids):
+        model_object = recall_model(model_type, model_id)
+        if model_object is None:
+            unknown_ids.add(model_id)
+        else:
+            model_objects.append(model_object)
+
+    if len(unknown_ids) > 0:
+        fetched_objects = list(
+            MODEL_CLASSES[model_type].objects.filter(id__in=unknown_ids)
+        )
+        remember_models(model_type, fetched_objects)
+        model_objects += fetched_objects
+
+    return {
+        model_JSON["pk"]: model_JSON
+        for model_JSON in get_JSON_multiple(model_type, model_objects, get_inner_JSON)
+    }
+
+
 def get_JSON_single(model_type, model_object, get_inner_JSON):
     collective_JSON = get_JSON_multiple(model_type, [model_object], get_inner_JSON)
 
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.2 on 2026-10-18 15:40
+
+from django.db import migrations, models
+import django.db.models.functions.text
+import swimeeter_api_app.indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            'swimeeter_auth_app',
+            '0004_alter_host_middle_initials_alter_host_prefix_and_more',
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='host',
+            index=models.Index(
+                swimeeter_api_app.indexes.Portable_op_class(
+                    django.db.models.functions.text.Upper('first_name'),
+                    name='text_pattern_ops',
+                ),
+                name='host_first_name_upper_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='host',
+            index=models.Index(
+                swimeeter_api_app.indexes.Portable_op_class(
+                    django.db.models.functions.text.Upper('last_name'),
+                    name='text_pattern_ops',
+                ),
+                name='host_last_name_upper_idx',
+            ),
+        ),
+    ]
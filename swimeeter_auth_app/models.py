@@ -1,6 +1,8 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.core import validators
 from . import validators as v
+from swimeeter_api_app.indexes import Portable_op_class
 from django.contrib.auth.models import AbstractUser
 
 
@@ -40,3 +42,16 @@ class Host(AbstractUser):
     REQUIRED_FIELDS = []  # automatically: username and password
 
     # via association: meets
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # ~ host name search -> UPPER(name) LIKE 'PREFIX%'
+            models.Index(
+                Portable_op_class(Upper("first_name"), name="text_pattern_ops"),
+                name="host_first_name_upper_idx",
+            ),
+            models.Index(
+                Portable_op_class(Upper("last_name"), name="text_pattern_ops"),
+                name="host_last_name_upper_idx",
+            ),
+        ]
@@ -10,6 +10,7 @@ from django.contrib.auth import login, logout, authenticate
 from .models import Host
 
 from . import view_helpers as vh
+from swimeeter_api_app.caching import bump_meet_version
 
 
 class Log_in(APIView):
@@ -203,6 +204,10 @@ class Update_profile(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # * host names appear in meet data -> mark the host's meets as changed
+        for meet_id in request.user.meets.values_list("id", flat=True):
+            bump_meet_version(meet_id)
+
         # * get profile JSON
         edited_host_profile_JSON = json.loads(
             serialize(